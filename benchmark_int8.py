@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark VoxQwen - Quantification int8 sur CPU
+
+Compare, pour un modele, la pleine precision (dtype de MODEL_DTYPES) et les
+modes int8 (VOXQWEN_QUANTIZE) : temps de chargement, memoire des poids,
+pic de memoire du processus et RTF (temps de synthese / duree de l'audio,
+< 1 = plus rapide que le temps reel).
+
+Chaque variante tourne dans un sous-processus pour que le pic de memoire soit
+mesure isolement. Le premier passage int8 ecrit le checkpoint quantifie dans
+models_int8/ (reutilise ensuite par le serveur).
+
+Usage:
+    source venv/bin/activate
+    python benchmark_int8.py clone_1_7b
+    python benchmark_int8.py voice_design --modes dynamic --runs 5
+"""
+
+import argparse
+import json
+import resource
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+OUTPUTS_DIR = Path(__file__).parent / "outputs"
+
+TEXTS = [
+    "Bonjour, je suis ravi de vous rencontrer aujourd'hui.",
+    "La synthese vocale locale permet de garder les donnees sur la machine.",
+    "Ce test mesure la vitesse de generation par rapport au temps reel.",
+]
+
+
+def peak_rss_mb() -> float:
+    """Pic de memoire residente du processus (ru_maxrss : Ko sous Linux, octets sous macOS)."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / 1024 / (1024 if sys.platform == "darwin" else 1), 1)
+
+
+def run_variant(model_key: str, variant: str, runs: int) -> dict:
+    """Charge le modele dans la variante demandee et mesure RTF et memoire."""
+    import torch
+    import main
+
+    phases = {}
+    started = time.perf_counter()
+    if variant == "baseline":
+        from qwen_tts import Qwen3TTSModel
+        model = Qwen3TTSModel.from_pretrained(
+            str(main.MODELS_DIR / main.MODEL_NAMES[model_key]),
+            device_map="cpu",
+            dtype=main.MODEL_DTYPES[model_key],
+        )
+    else:
+        model = main.load_quantized_model(model_key, variant, phases)
+    load_seconds = time.perf_counter() - started
+
+    # Premier passage : initialisation des noyaux, non compte
+    main.sample_generation(model, model_key, TEXTS[0])
+
+    rtfs, audio_seconds = [], 0.0
+    for i in range(runs):
+        text = TEXTS[i % len(TEXTS)]
+        torch.manual_seed(i)
+        started = time.perf_counter()
+        wavs, sr = main.sample_generation(model, model_key, text)
+        elapsed = time.perf_counter() - started
+        duration = len(wavs[0]) / sr
+        audio_seconds += duration
+        rtfs.append(elapsed / duration)
+
+    return {
+        "variant": variant,
+        "load_seconds": round(load_seconds, 2),
+        "phases": phases,
+        "weights_mb": round(main._model_nbytes(model) / 1024 / 1024, 1),
+        "peak_rss_mb": peak_rss_mb(),
+        "rtf_median": round(statistics.median(rtfs), 3),
+        "rtf_runs": [round(rtf, 3) for rtf in rtfs],
+        "audio_seconds": round(audio_seconds, 2),
+    }
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description="Benchmark int8 vs pleine precision sur CPU")
+    parser.add_argument("model", choices=["voice_design", "voice_clone", "preset_voice", "clone_1_7b", "clone_0_6b"])
+    parser.add_argument("--modes", default="dynamic,weight", help="Modes int8 compares (dynamic, weight)")
+    parser.add_argument("--runs", type=int, default=3, help="Generations mesurees par variante")
+    parser.add_argument("--variant", help=argparse.SUPPRESS)  # Usage interne (sous-processus)
+    args = parser.parse_args()
+
+    if args.variant:
+        print(json.dumps(run_variant(args.model, args.variant, args.runs)))
+        return
+
+    results = []
+    for variant in ["baseline"] + [mode.strip() for mode in args.modes.split(",") if mode.strip()]:
+        print(f"Variante {variant}...")
+        completed = subprocess.run(
+            [sys.executable, __file__, args.model, "--variant", variant, "--runs", str(args.runs)],
+            capture_output=True, text=True,
+        )
+        if completed.returncode != 0:
+            print(completed.stderr[-2000:])
+            sys.exit(f"Echec de la variante {variant}")
+        results.append(json.loads(completed.stdout.strip().splitlines()[-1]))
+
+    baseline = results[0]
+    print()
+    print(f"{'Variante':<10} {'Chargement':>11} {'Poids (Mo)':>11} {'Pic RSS (Mo)':>13} {'RTF':>7} {'Gain RTF':>9}")
+    for result in results:
+        speedup = baseline["rtf_median"] / result["rtf_median"]
+        print(
+            f"{result['variant']:<10} {result['load_seconds']:>10.1f}s {result['weights_mb']:>11.0f} "
+            f"{result['peak_rss_mb']:>13.0f} {result['rtf_median']:>7.3f} {speedup:>8.2f}x"
+        )
+
+    report_dir = OUTPUTS_DIR / "benchmarks"
+    report_dir.mkdir(parents=True, exist_ok=True)
+    report = report_dir / f"int8_{args.model}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    report.write_text(json.dumps({"model": args.model, "results": results}, indent=2), encoding="utf-8")
+    print(f"\nRapport : {report}")
+
+
+if __name__ == "__main__":
+    main_cli()
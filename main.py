@@ -14,10 +14,26 @@ import os
 import io
 import re
 import json
+import hashlib
+import math
+import queue
 import shutil
+import asyncio
+import functools
+import contextlib
+import itertools
+import collections
+import threading
+import weakref
 import tempfile
+import time
+import gc
 import uuid
 import zipfile
+import copy
+import unicodedata
+import contextvars
+import concurrent.futures
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict, Any, List
@@ -25,8 +41,9 @@ from typing import Optional, Dict, Any, List
 import base64
 import torch
 import soundfile as sf
-from fastapi import FastAPI, File, UploadFile, Form, HTTPException, Request, Depends
-from fastapi.responses import StreamingResponse, JSONResponse, HTMLResponse
+from fastapi import FastAPI, File, UploadFile, Form, HTTPException, Request, Depends, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse, JSONResponse, HTMLResponse, FileResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from pydantic import BaseModel, Field, field_validator
@@ -38,7 +55,8 @@ from fastapi_mcp import FastApiMCP
 # Détection automatique de langue (lazy import)
 langdetect_available = False
 try:
-    from langdetect import detect as langdetect_detect
+    from langdetect import detect_langs as langdetect_detect_langs, DetectorFactory
+    DetectorFactory.seed = 0  # langdetect est probabiliste : graine fixe = résultat stable
     langdetect_available = True
 except ImportError:
     pass
@@ -72,18 +90,23 @@ elif torch.cuda.is_available():
 else:
     DEVICE = "cpu"
 
-# Modeles (charges a la demande)
-voice_design_model = None
-voice_clone_model = None  # 1.7B-CustomVoice pour /preset/instruct
-preset_voice_model = None
-
-# Modeles Base pour clonage (avec create_voice_clone_prompt)
-clone_model_1_7b = None  # 1.7B-Base
-clone_model_0_6b = None  # 0.6B-Base
+# Nom des checkpoints par clé de modèle (clés identiques à /models/status)
+MODEL_NAMES = {
+    "voice_design": "1.7B-VoiceDesign",
+    "voice_clone": "1.7B-CustomVoice",
+    "preset_voice": "0.6B-CustomVoice",
+    "clone_1_7b": "1.7B-Base",
+    "clone_0_6b": "0.6B-Base",
+}
 
-# Cache des prompts de clonage vocal (in-memory, volatile)
-# Structure: {prompt_id: {"prompt_items": [...], "model": "1.7B", "created_at": datetime}}
-voice_clone_prompts: Dict[str, Dict[str, Any]] = {}
+# Précision de chargement par modèle (modèles chargés à la demande, voir ModelManager)
+MODEL_DTYPES = {
+    "voice_design": torch.float16,  # bfloat16 pas supporte sur MPS
+    "voice_clone": torch.float16,  # 1.7B-CustomVoice pour /preset/instruct
+    "preset_voice": torch.float32,  # float32 pour MPS (float16 cause des NaN avec ce modele)
+    "clone_1_7b": torch.float16,  # 1.7B-Base (create_voice_clone_prompt)
+    "clone_0_6b": torch.float32,  # 0.6B-Base, float32 pour MPS
+}
 
 # Voix personnalisées persistantes (chargées depuis disque)
 # Structure: {name: {"meta": {...}, "prompt_items": ... ou None si pas encore chargé}}
@@ -102,6 +125,17 @@ PRESET_VOICES = {
     "Sohee": {"gender": "Femme", "native_lang": "Coreen", "description": "Voix feminine chaleureuse avec une riche emotion"},
 }
 
+@contextlib.asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Cycle de vie du serveur : démarrage (voir DÉMARRAGE) puis arrêt des tâches de fond."""
+    tasks = start_background_tasks()
+    try:
+        yield
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
 app = FastAPI(
     title="Qwen3-TTS API",
     description="""
@@ -114,6 +148,7 @@ API locale de synthèse vocale basée sur **Qwen3-TTS** (Alibaba), optimisée po
 - **Preset Voices** : 9 voix préréglées avec contrôle émotionnel optionnel
 - **Voix Personnalisées** : Sauvegarder vos voix créées de façon persistante
 - **Batch Processing** : Générer plusieurs audios en une seule requête (ZIP)
+- **Jobs asynchrones** : Soumettre de gros batchs, suivre leur progression et télécharger les résultats
 - **Auto Language** : Détection automatique de la langue (language="auto")
 - **Tokenizer API** : Encoder/décoder du texte en tokens
 - **MCP Support** : Intégration Model Context Protocol pour Claude Code
@@ -142,6 +177,7 @@ Pour l'intégration avec Claude Code via MCP, consultez [/mcp/docs](/mcp/docs).
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
+    lifespan=lifespan,
 )
 
 # Rate Limiter State
@@ -150,14 +186,20 @@ app.state.limiter = limiter
 @app.exception_handler(RateLimitExceeded)
 async def rate_limit_handler(request: Request, exc: RateLimitExceeded):
     """Handler pour les erreurs de rate limiting."""
+    # Durée de la fenêtre de la limite dépassée (ex: 60s pour "10/minute")
+    try:
+        retry_after = int(exc.limit.limit.get_expiry())
+    except Exception:
+        retry_after = 60
     return JSONResponse(
         status_code=429,
         content={
             "error": "Rate limit exceeded",
             "code": "RATE_LIMIT_EXCEEDED",
             "detail": str(exc.detail),
-            "retry_after": 60,
-        }
+            "retry_after": retry_after,
+        },
+        headers={"Retry-After": str(retry_after)},
     )
 
 # Montage des fichiers statiques
@@ -176,6 +218,7 @@ class DesignRequest(BaseModel):
     text: str = Field(..., min_length=1, max_length=10000, description="Texte à synthétiser")
     voice_instruct: str = Field("", description="Description de la voix en langage naturel")
     language: str = Field("fr", description="Langue: fr, en, zh, ja, ko, de, ru, pt, es, it, auto")
+    seed: Optional[int] = Field(None, ge=0, le=4294967295, description="Graine : audio reproductible, ETag")
 
 
 class BatchPresetRequest(BaseModel):
@@ -192,6 +235,23 @@ class BatchDesignRequest(BaseModel):
     language: str = Field("fr", description="Langue: fr, en, zh, ja, ko, de, ru, pt, es, it, auto")
 
 
+class JobRequest(BaseModel):
+    """Requête de création d'un job de synthèse asynchrone."""
+    type: str = Field(..., description="Type de job : 'preset', 'design' ou 'clone'")
+    texts: List[str] = Field(..., min_length=1, max_length=1000, description="Liste de textes à synthétiser (max 1000)")
+    voice: str = Field("Serena", description="Nom de la voix, native ou personnalisée (type=preset)")
+    voice_instruct: str = Field("", description="Description de la voix en langage naturel (type=design)")
+    prompt_id: str = Field("", description="ID du prompt créé via /clone/prompt (type=clone)")
+    language: str = Field("fr", description="Langue: fr, en, zh, ja, ko, de, ru, pt, es, it, auto")
+
+    @field_validator('type')
+    @classmethod
+    def validate_type(cls, v):
+        if v not in ("preset", "design", "clone"):
+            raise ValueError("type doit être 'preset', 'design' ou 'clone'")
+        return v
+
+
 class TokenizeRequest(BaseModel):
     """Requête pour tokenizer encode."""
     text: str = Field(..., min_length=1, description="Texte à encoder")
@@ -202,6 +262,17 @@ class DetokenizeRequest(BaseModel):
     tokens: List[int] = Field(..., min_length=1, description="Liste de tokens à décoder")
 
 
+class BatchTokenizeRequest(BaseModel):
+    """Requête pour tokenizer encode en batch."""
+    texts: List[str] = Field(..., min_length=1, max_length=1000, description="Textes à encoder (max 1000)")
+    return_tokens: bool = Field(True, description="Inclure les tokens (False = uniquement les comptes)")
+
+
+class BatchDetokenizeRequest(BaseModel):
+    """Requête pour tokenizer decode en batch."""
+    sequences: List[List[int]] = Field(..., min_length=1, max_length=1000, description="Séquences de tokens à décoder (max 1000)")
+
+
 class LanguagesResponse(BaseModel):
     """Réponse pour la liste des langues."""
     languages: list[dict]
@@ -219,6 +290,8 @@ class MCPPresetRequest(BaseModel):
     text: str = Field(..., min_length=1, max_length=2000, description="Texte à synthétiser")
     voice: str = Field("Serena", description="Voix native ou custom")
     language: str = Field("fr", description="Code langue ou 'auto'")
+    seed: Optional[int] = Field(None, ge=0, le=4294967295, description="Graine pour un audio reproductible")
+    deadline_ms: Optional[int] = Field(None, ge=1, le=3600000, description="Budget de latence en ms (504 DEADLINE_EXCEEDED au-delà)")
 
 
 class MCPDesignRequest(BaseModel):
@@ -226,6 +299,8 @@ class MCPDesignRequest(BaseModel):
     text: str = Field(..., min_length=1, max_length=2000, description="Texte à synthétiser")
     voice_description: str = Field(..., min_length=5, max_length=500, description="Description de la voix")
     language: str = Field("fr", description="Code langue ou 'auto'")
+    seed: Optional[int] = Field(None, ge=0, le=4294967295, description="Graine pour un audio reproductible")
+    deadline_ms: Optional[int] = Field(None, ge=1, le=3600000, description="Budget de latence en ms (504 DEADLINE_EXCEEDED au-delà)")
 
 
 class MCPCloneRequest(BaseModel):
@@ -233,6 +308,8 @@ class MCPCloneRequest(BaseModel):
     text: str = Field(..., min_length=1, max_length=2000, description="Texte à synthétiser")
     prompt_id: str = Field(..., description="UUID du prompt (VOLATILE: perdu au redémarrage)")
     language: str = Field("fr", description="Code langue ou 'auto'")
+    seed: Optional[int] = Field(None, ge=0, le=4294967295, description="Graine pour un audio reproductible")
+    deadline_ms: Optional[int] = Field(None, ge=1, le=3600000, description="Budget de latence en ms (504 DEADLINE_EXCEEDED au-delà)")
 
 
 class MCPCreatePromptRequest(BaseModel):
@@ -241,6 +318,7 @@ class MCPCreatePromptRequest(BaseModel):
     reference_text: str = Field(..., min_length=1, max_length=1000, description="Transcription exacte")
     model: str = Field("1.7B", description="Modèle: '1.7B' ou '0.6B'")
     name: Optional[str] = Field(None, max_length=50, description="Nom du prompt")
+    deadline_ms: Optional[int] = Field(None, ge=1, le=3600000, description="Budget de latence en ms (504 DEADLINE_EXCEEDED au-delà)")
 
     @field_validator('model')
     @classmethod
@@ -256,6 +334,8 @@ class MCPPresetInstructRequest(BaseModel):
     voice: str = Field("Serena", description="Voix native uniquement")
     instruct: str = Field("", description="Instruction émotion/style (ex: 'Ton joyeux')")
     language: str = Field("fr", description="Code langue ou 'auto'")
+    seed: Optional[int] = Field(None, ge=0, le=4294967295, description="Graine pour un audio reproductible")
+    deadline_ms: Optional[int] = Field(None, ge=1, le=3600000, description="Budget de latence en ms (504 DEADLINE_EXCEEDED au-delà)")
 
 
 class MCPAudioResponse(BaseModel):
@@ -275,6 +355,7 @@ class MCPPromptResponse(BaseModel):
     name: Optional[str]
     model: str
     created_at: str
+    cached: bool = False
     warning: str = "Prompt stocké en mémoire, perdu au redémarrage. Utilisez /voices/custom pour persistance."
 
 
@@ -316,25 +397,133 @@ LANGDETECT_TO_CODE = {
 }
 
 
+# Détection rapide par écriture Unicode, avant le n-gram langdetect (lent, ~ms/texte)
+LANGUAGE_DETECT_CACHE_SIZE = int(os.environ.get("VOXQWEN_LANGUAGE_DETECT_CACHE", "4096"))
+LANGUAGE_DETECT_MAX_CHARS = 1000  # Au-delà, le début du texte suffit à trancher
+SCRIPT_MIN_RATIO = 0.3  # Part minimale des lettres dans l'écriture pour conclure
+
+_SCRIPT_PATTERNS = {
+    "ko": re.compile(r"[\uac00-\ud7af\u1100-\u11ff\u3130-\u318f]"),  # Hangul
+    "ja": re.compile(r"[\u3040-\u30ff\u31f0-\u31ff]"),  # Hiragana / Katakana
+    "zh": re.compile(r"[\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]"),  # Han
+    "ru": re.compile(r"[\u0400-\u04ff]"),  # Cyrillique
+}
+_LETTER_RE = re.compile(r"[^\W\d_]")
+_langdetect_lock = threading.Lock()
+
+language_detection_stats = {"script": 0, "ngram": 0, "fallback": 0}
+# Compteurs incrémentés depuis les handlers et les workers d'inférence
+_language_detection_stats_lock = threading.Lock()
+
+
+def _count_language_detection(source: str):
+    """Incrémente le compteur de détection de la source donnée (script, ngram, fallback)."""
+    with _language_detection_stats_lock:
+        language_detection_stats[source] += 1
+
+
+def script_language(text: str) -> Optional[str]:
+    """
+    Détermine la langue à partir de l'écriture Unicode dominante.
+
+    Les kana tranchent pour le japonais même mêlés de kanji (Han) ;
+    retourne None pour un texte latin, laissé à langdetect.
+    """
+    letters = len(_LETTER_RE.findall(text))
+    if not letters:
+        return None
+    counts = {code: len(pattern.findall(text)) for code, pattern in _SCRIPT_PATTERNS.items()}
+    if counts["ja"] and counts["ja"] + counts["zh"] >= letters * SCRIPT_MIN_RATIO:
+        return "ja"
+    best = max(("ko", "zh", "ru"), key=counts.get)
+    if counts[best] >= letters * SCRIPT_MIN_RATIO:
+        return best
+    return None
+
+
+def _ngram_language(text: str) -> str:
+    """Détection n-gram (langdetect), restreinte aux langues supportées."""
+    if not langdetect_available:
+        _count_language_detection("fallback")
+        return "fr"  # Fallback si langdetect non installé
+
+    try:
+        # Le chargement paresseux des profils langdetect n'est pas thread-safe
+        with _langdetect_lock:
+            candidates = langdetect_detect_langs(text)
+    except Exception:
+        _count_language_detection("fallback")
+        return "fr"  # Fallback en cas d'erreur
+
+    # Candidats triés par probabilité : première langue que le modèle sait parler
+    for candidate in candidates:
+        code = LANGDETECT_TO_CODE.get(candidate.lang)
+        if code:
+            _count_language_detection("ngram")
+            return code
+    _count_language_detection("fallback")
+    return "fr"
+
+
+@functools.lru_cache(maxsize=LANGUAGE_DETECT_CACHE_SIZE)
+def _detect_normalized(text: str) -> str:
+    """Détection mémoïsée sur le texte normalisé (écriture d'abord, n-gram ensuite)."""
+    code = script_language(text)
+    if code:
+        _count_language_detection("script")
+        return code
+    return _ngram_language(text)
+
+
+def _language_detect_key(text: str) -> str:
+    """Normalise un texte pour la détection : NFC, espaces réduits, tronqué."""
+    normalized = " ".join(unicodedata.normalize("NFC", text or "").split())
+    return normalized[:LANGUAGE_DETECT_MAX_CHARS]
+
+
 def detect_language(text: str) -> str:
     """
     Détecte automatiquement la langue d'un texte.
 
+    Déterministe (graine langdetect fixe) et mémoïsé par texte normalisé :
+    un même texte donne toujours la même langue, donc la même clé de cache audio.
+
     Args:
         text: Texte à analyser
 
     Returns:
         Code langue (fr, en, zh, etc.) ou "fr" par défaut
     """
-    if not langdetect_available:
-        return "fr"  # Fallback si langdetect non installé
+    key = _language_detect_key(text)
+    if not key:
+        return "fr"
+    return _detect_normalized(key)
 
-    try:
-        detected = langdetect_detect(text)
-        # Convertir le code langdetect vers notre code API
-        return LANGDETECT_TO_CODE.get(detected, "fr")
-    except Exception:
-        return "fr"  # Fallback en cas d'erreur
+
+def detect_languages(texts: List[str]) -> List[str]:
+    """
+    Détecte la langue de chaque texte d'un batch en une passe.
+
+    Les textes identiques (après normalisation) ne sont analysés qu'une fois.
+    """
+    keys = [_language_detect_key(text) for text in texts]
+    detected = {key: (_detect_normalized(key) if key else "fr") for key in dict.fromkeys(keys)}
+    return [detected[key] for key in keys]
+
+
+def language_detection_status() -> dict:
+    """Statistiques de détection de langue pour /models/status."""
+    info = _detect_normalized.cache_info()
+    with _language_detection_stats_lock:
+        counts = dict(language_detection_stats)
+    return {
+        "langdetect_available": langdetect_available,
+        "memo_hits": info.hits,
+        "memo_misses": info.misses,
+        "memo_size": info.currsize,
+        "memo_max": info.maxsize,
+        **counts,
+    }
 
 
 def resolve_language(language: str, text: str = "") -> str:
@@ -358,161 +547,3212 @@ def resolve_language(language: str, text: str = "") -> str:
 # MODEL LOADING
 # ==============================================================================
 
-def load_voice_design_model():
-    """Charge le modele Voice Design."""
-    global voice_design_model
-    if voice_design_model is None:
-        print("=" * 60)
-        print("Chargement du modele Voice Design...")
-        print("Cela peut prendre quelques minutes au premier lancement.")
-        print("=" * 60)
-
-        from qwen_tts import Qwen3TTSModel
-
-        # Chemin local du modele
-        model_path = MODELS_DIR / "1.7B-VoiceDesign"
-
-        # Pour Mac Studio (MPS), pas de flash_attention_2
-        voice_design_model = Qwen3TTSModel.from_pretrained(
-            str(model_path),
-            device_map=DEVICE,
-            dtype=torch.float16,  # bfloat16 pas supporte sur MPS
-        )
-        print(f"Modele Voice Design charge sur {DEVICE}")
-    return voice_design_model
+# Budget mémoire des modèles résidents (0 = illimité) et déchargement après inactivité
+MODEL_MEMORY_GB = float(os.getenv("VOXQWEN_MODEL_MEMORY_GB", "0"))
+MODEL_IDLE_TTL_MINUTES = float(os.getenv("VOXQWEN_MODEL_IDLE_TTL_MINUTES", "0"))
+PINNED_MODELS = {key.strip() for key in os.getenv("VOXQWEN_PINNED_MODELS", "").split(",") if key.strip()}
+MODEL_MAINTENANCE_INTERVAL = 60  # Secondes entre deux vérifications d'inactivité
+
+# Progression et erreurs de chargement, exposées dans /models/status
+# Structure: {model_key: {"state": "loading|loaded|failed|unloaded", "started_at": ..., ...}}
+model_load_status: Dict[str, Dict[str, Any]] = {}
+
+
+def _model_nbytes(model) -> int:
+    """Mémoire occupée par les poids et buffers d'un modèle (talker et speech tokenizer)."""
+    inner = getattr(model, "model", model)
+    modules = [inner, getattr(getattr(inner, "speech_tokenizer", None), "model", None)]
+    seen, total = set(), 0
+    for module in modules:
+        if not isinstance(module, torch.nn.Module):
+            continue
+        for tensor in itertools.chain(module.parameters(), module.buffers()):
+            if tensor.data_ptr() in seen:
+                continue
+            seen.add(tensor.data_ptr())
+            total += tensor.numel() * tensor.element_size()
+    return total
+
+
+def _checkpoint_estimate(model_key: str) -> int:
+    """Estimation avant chargement : taille des poids sur disque, à la précision de chargement."""
+    model_dir = MODELS_DIR / MODEL_NAMES[model_key]
+    disk_bytes = sum(path.stat().st_size for path in model_dir.rglob("*.safetensors"))
+    # Checkpoints publiés en bfloat16 (2 octets par paramètre)
+    return int(disk_bytes * torch.tensor([], dtype=MODEL_DTYPES[model_key]).element_size() / 2)
+
+
+def _release_device_memory():
+    """Rend au système la mémoire des tenseurs libérés (caches CUDA / MPS)."""
+    gc.collect()
+    if torch.cuda.is_available():
+        torch.cuda.empty_cache()
+    if torch.backends.mps.is_available() and hasattr(torch, "mps"):
+        torch.mps.empty_cache()
+
+
+class ModelManager:
+    """
+    Modèles résidents : chargement single-flight, budget mémoire, LRU et inactivité.
+
+    Un seul chargement par modèle, même avec des appels concurrents : le premier
+    appelant charge, les suivants attendent le même future (pas de double copie
+    en mémoire). En cas d'échec, tous reçoivent l'erreur et l'appel suivant
+    retente le chargement.
+
+    Avant un chargement, les modèles les moins récemment utilisés sont déchargés
+    jusqu'à ce que l'estimation tienne dans le budget ; un modèle épinglé
+    (VOXQWEN_PINNED_MODELS ou preload avec pin) ou occupé (travail en file ou en
+    cours dans l'exécuteur) n'est jamais évincé. Si la place manque quand même,
+    le chargement est refusé (503). maintain() décharge les modèles inactifs
+    depuis plus de MODEL_IDLE_TTL_MINUTES. Les travaux "idle" (prégénération) ne
+    comptent pas comme une utilisation.
+    """
+
+    def __init__(self, budget: int, idle_ttl: float, pinned: set):
+        self.budget = budget
+        self.idle_ttl = idle_ttl
+        self._pinned = set(pinned)
+        self._models: Dict[str, Any] = {}
+        self._nbytes: Dict[str, int] = {}
+        # Dernière utilisation (time.monotonic), ordre LRU (le moins récent en tête)
+        self._last_used: "collections.OrderedDict[str, float]" = collections.OrderedDict()
+        self._futures: Dict[str, concurrent.futures.Future] = {}
+        # Mémoire réservée par les chargements en cours (chargements parallèles)
+        self._reserved: Dict[str, int] = {}
+        self._lock = threading.RLock()
+        self._stats = {"loads": 0, "evictions": 0, "idle_unloads": 0, "manual_unloads": 0, "refused": 0}
+
+    def get(self, model_key: str):
+        """
+        Retourne le modèle, chargé si besoin (bloquant).
+
+        Args:
+            model_key: Clé du modèle (voir MODEL_NAMES)
+
+        Returns:
+            Le modèle chargé
+        """
+        with self._lock:
+            model = self._models.get(model_key)
+            if model is not None:
+                if getattr(_worker_context, "priority", None) != "idle":
+                    self._last_used[model_key] = time.monotonic()
+                    self._last_used.move_to_end(model_key)
+                return model
+            future = self._futures.get(model_key)
+            owner = future is None
+            if owner:
+                future = concurrent.futures.Future()
+                self._futures[model_key] = future
+                model_load_status[model_key] = {
+                    "state": "loading",
+                    "started_at": datetime.now().isoformat(),
+                    "waiters": 0,
+                    "phases": {},
+                }
+            else:
+                model_load_status[model_key]["waiters"] += 1
+
+        # Signale au worker d'inférence que ce travail a attendu un chargement
+        _worker_context.waited_for_load = True
+        if not owner:
+            return future.result()
+
+        started = time.perf_counter()
+        try:
+            self._make_room(model_key)
+            model = _from_pretrained(model_key, MODEL_DTYPES[model_key])
+        except BaseException as e:
+            with self._lock:
+                self._reserved.pop(model_key, None)
+                model_load_status[model_key].update({
+                    "state": "failed",
+                    "error": str(e),
+                    "elapsed_seconds": round(time.perf_counter() - started, 2),
+                })
+                # Retirer le future pour permettre une nouvelle tentative
+                del self._futures[model_key]
+            future.set_exception(e)
+            raise
+
+        nbytes = _model_nbytes(model)
+        with self._lock:
+            self._models[model_key] = model
+            self._nbytes[model_key] = nbytes
+            self._reserved.pop(model_key, None)
+            self._last_used[model_key] = time.monotonic()
+            self._last_used.move_to_end(model_key)
+            del self._futures[model_key]
+            self._stats["loads"] += 1
+            model_load_status[model_key].update({
+                "state": "loaded",
+                "elapsed_seconds": round(time.perf_counter() - started, 2),
+                "memory_mb": round(nbytes / 1024 / 1024, 1),
+            })
+        future.set_result(model)
+        return model
+
+    def _used_bytes(self, without: tuple = ()) -> int:
+        """
+        Mémoire des modèles résidents, composants partagés comptés une seule fois.
+
+        Args:
+            without: Modèles à exclure (mémoire restante après leur déchargement :
+                un composant partagé avec un modèle restant n'est pas libéré)
+        """
+        models = {key: model for key, model in self._models.items() if key not in without}
+        return sum(self._nbytes[key] for key in models) - shared_components.stats(models)["saved_bytes"]
+
+    def _evictable(self, model_key: str) -> bool:
+        return model_key not in self._pinned and not inference_executor.is_busy(model_key)
+
+    def _make_room(self, model_key: str):
+        """Décharge les modèles LRU non épinglés jusqu'à pouvoir charger model_key."""
+        if self.budget <= 0:
+            return
+        needed = _checkpoint_estimate(model_key)
+        with self._lock:
+            reserved = sum(self._reserved.values())
+            used = self._used_bytes() + reserved
+            victims = []
+            for key in self._last_used:
+                if used + needed <= self.budget:
+                    break
+                if key != model_key and self._evictable(key):
+                    victims.append(key)
+                    used = self._used_bytes(tuple(victims)) + reserved
+            if used + needed > self.budget:
+                self._stats["refused"] += 1
+                raise ServerOverloadedError(
+                    model_key, MODEL_MAINTENANCE_INTERVAL,
+                    f"Budget mémoire des modèles insuffisant ({needed / 1024 ** 3:.1f} GB requis)",
+                )
+            self._reserved[model_key] = needed
+        for key in victims:
+            if self.unload(key, "evicted"):
+                with self._lock:
+                    self._stats["evictions"] += 1
+
+    def unload(self, model_key: str, reason: str = "manual") -> bool:
+        """
+        Décharge un modèle (ses poids sont libérés à la fin des générations en cours).
+
+        Returns:
+            True si le modèle était chargé
+        """
+        with self._lock:
+            model = self._models.pop(model_key, None)
+            if model is None:
+                return False
+            self._nbytes.pop(model_key, None)
+            self._last_used.pop(model_key, None)
+            model_load_status[model_key].update({
+                "state": "unloaded",
+                "unloaded_at": datetime.now().isoformat(),
+                "reason": reason,
+            })
+            if reason == "manual":
+                self._stats["manual_unloads"] += 1
+        prefix_kv_cache.forget(model_key)
+        del model
+        _release_device_memory()
+        print(f"Modele {MODEL_NAMES[model_key]} decharge ({reason})")
+        return True
+
+    def maintain(self) -> List[str]:
+        """Décharge les modèles inactifs depuis plus de idle_ttl secondes (bloquant)."""
+        if self.idle_ttl <= 0:
+            return []
+        now = time.monotonic()
+        with self._lock:
+            idle = [
+                key for key, last_used in self._last_used.items()
+                if now - last_used > self.idle_ttl and self._evictable(key)
+            ]
+        unloaded = [key for key in idle if self.unload(key, "idle")]
+        with self._lock:
+            self._stats["idle_unloads"] += len(unloaded)
+        return unloaded
+
+    def is_loaded(self, model_key: str) -> bool:
+        return model_key in self._models
+
+    def loaded_flags(self) -> Dict[str, bool]:
+        """{"<model_key>_loaded": bool} pour chaque modèle (format historique des statuts)."""
+        return {f"{key}_loaded": key in self._models for key in MODEL_NAMES}
+
+    def pin(self, model_key: str):
+        with self._lock:
+            self._pinned.add(model_key)
+
+    def unpin(self, model_key: str):
+        with self._lock:
+            self._pinned.discard(model_key)
+
+    def is_pinned(self, model_key: str) -> bool:
+        return model_key in self._pinned
+
+    def stats(self) -> Dict[str, Any]:
+        """Occupation mémoire, modèles résidents (ordre LRU) et compteurs."""
+        now = time.monotonic()
+        with self._lock:
+            resident = {
+                key: {
+                    "memory_mb": round(self._nbytes[key] / 1024 / 1024, 1),
+                    "idle_seconds": round(now - last_used, 1),
+                    "pinned": key in self._pinned,
+                }
+                for key, last_used in self._last_used.items()
+            }
+            used = self._used_bytes()
+            shared = shared_components.stats(self._models)
+        return {
+            "budget_gb": round(self.budget / 1024 ** 3, 2) if self.budget > 0 else None,
+            "used_gb": round(used / 1024 ** 3, 2),
+            "idle_ttl_minutes": self.idle_ttl / 60 if self.idle_ttl > 0 else None,
+            "pinned": sorted(self._pinned),
+            "resident": resident,
+            "shared_components": shared,
+            **self._stats,
+        }
+
+
+model_manager = ModelManager(
+    int(MODEL_MEMORY_GB * 1024 ** 3), MODEL_IDLE_TTL_MINUTES * 60, PINNED_MODELS
+)
+
+
+# Lecture préalable des poids : plages lues en parallèle pour monter les fichiers
+# en page cache, que le chargement mmap de safetensors relit ensuite sans I/O
+MODEL_LOAD_THREADS = int(os.getenv("VOXQWEN_MODEL_LOAD_THREADS", "8"))  # 0 = pas de lecture préalable
+PREFETCH_RANGE_BYTES = 64 * 1024 * 1024  # Plage lue par tâche
+PREFETCH_BLOCK_BYTES = 8 * 1024 * 1024  # Taille d'une lecture
+
+# Shards d'un checkpoint chargés en parallèle par transformers (checkpoints multi-fichiers)
+os.environ.setdefault("HF_ENABLE_PARALLEL_LOADING", "true")
+
+_prefetch_pool = (
+    concurrent.futures.ThreadPoolExecutor(max_workers=MODEL_LOAD_THREADS, thread_name_prefix="model-prefetch")
+    if MODEL_LOAD_THREADS > 0 else None
+)
+
+
+def _prefetch_range(path: Path, offset: int, length: int) -> int:
+    """Lit une plage d'un fichier par blocs, dans un tampon réutilisé."""
+    block = memoryview(bytearray(min(PREFETCH_BLOCK_BYTES, length)))
+    read = 0
+    with open(path, "rb", buffering=0) as f:
+        f.seek(offset)
+        while read < length:
+            n = f.readinto(block[:length - read])
+            if not n:
+                break
+            read += n
+    return read
+
+
+def prefetch_checkpoint(model_dir: Path) -> int:
+    """
+    Monte les poids d'un checkpoint (modèle et speech tokenizer) en page cache.
+
+    Les fichiers sont découpés en plages lues en parallèle : un disque réseau ou
+    NVMe n'atteint son débit qu'avec plusieurs lectures en vol, là où le
+    chargement mmap avance défaut de page par défaut de page.
+
+    Returns:
+        Nombre d'octets lus
+    """
+    if _prefetch_pool is None:
+        return 0
+    futures = []
+    for path in sorted(model_dir.rglob("*.safetensors")):
+        size = path.stat().st_size
+        for offset in range(0, size, PREFETCH_RANGE_BYTES):
+            futures.append(_prefetch_pool.submit(
+                _prefetch_range, path, offset, min(PREFETCH_RANGE_BYTES, size - offset)
+            ))
+    return sum(future.result() for future in futures)
+
+
+def _move_to_device(model, device: str):
+    """Déplace le modèle et son speech tokenizer (hors de l'arbre des modules) sur device."""
+    model.model.to(device)
+    model.device = torch.device(device)
+    speech_tokenizer = getattr(model.model, "speech_tokenizer", None)
+    if speech_tokenizer is not None:
+        speech_tokenizer.model.to(device)
+        speech_tokenizer.device = torch.device(device)
+
+
+# Fichiers du processor texte (tokenizer BPE) d'un checkpoint
+PROCESSOR_FILES = [
+    "vocab.json", "merges.txt", "tokenizer.json", "tokenizer_config.json",
+    "special_tokens_map.json", "added_tokens.json", "preprocessor_config.json",
+]
+
+
+def _component_nbytes(module) -> int:
+    """Mémoire des poids et buffers d'un module."""
+    if not isinstance(module, torch.nn.Module):
+        return 0
+    return sum(t.numel() * t.element_size() for t in itertools.chain(module.parameters(), module.buffers()))
+
+
+class SharedComponents:
+    """
+    Sous-composants identiques entre checkpoints, chargés une seule fois.
+
+    Les checkpoints Qwen3-TTS embarquent chacun une copie du speech tokenizer
+    (codec) et du processor texte. Chaque composant est identifié par le hash
+    du contenu de ses fichiers (et, pour le codec, la précision de chargement) :
+    un modèle chargé ensuite réutilise l'instance résidente au lieu de charger
+    sa propre copie. Les instances sont référencées faiblement et disparaissent
+    avec le dernier modèle qui les utilise.
+
+    Les modèles sont assemblés par assemble_model : le registre est consulté
+    avant de construire un composant, jamais après.
+    """
+
+    def __init__(self):
+        self._instances: "weakref.WeakValueDictionary[tuple, Any]" = weakref.WeakValueDictionary()
+        self._load_locks: Dict[tuple, threading.Lock] = collections.defaultdict(threading.Lock)
+        # Hash par fichier, invalidé par un changement de taille ou de date
+        self._file_hashes: Dict[tuple, str] = {}
+        self._lock = threading.Lock()
+        self._stats = {"loaded": 0, "reused": 0, "hash_seconds": 0.0}
+
+    def _file_hash(self, path: Path) -> str:
+        stat = path.stat()
+        key = (str(path), stat.st_size, stat.st_mtime_ns)
+        digest = self._file_hashes.get(key)
+        if digest is None:
+            started = time.perf_counter()
+            sha = hashlib.sha256()
+            with open(path, "rb") as f:
+                for block in iter(lambda: f.read(PREFETCH_BLOCK_BYTES), b""):
+                    sha.update(block)
+            digest = sha.hexdigest()
+            self._file_hashes[key] = digest
+            self._stats["hash_seconds"] += time.perf_counter() - started
+        return digest
+
+    def content_hash(self, directory: Path, files: Optional[List[str]] = None) -> str:
+        """Hash du contenu des fichiers d'un répertoire (tous, ou ceux de files présents)."""
+        paths = [directory / name for name in files] if files else sorted(directory.iterdir())
+        sha = hashlib.sha256()
+        for path in paths:
+            if path.is_file():
+                sha.update(f"{path.name}:{self._file_hash(path)};".encode())
+        return sha.hexdigest()
+
+    def _get_or_load(self, key: tuple, load_fn):
+        with self._lock:
+            lock = self._load_locks[key]
+        # Un seul chargement par composant, même avec des chargements de modèles parallèles
+        with lock:
+            instance = self._instances.get(key)
+            if instance is not None:
+                self._stats["reused"] += 1
+                return instance
+            instance = load_fn()
+            self._instances[key] = instance
+            self._stats["loaded"] += 1
+            return instance
+
+    def speech_tokenizer(self, path: Path, dtype):
+        """Speech tokenizer du répertoire path (chargé sur CPU), partagé entre modèles de même précision."""
+        from qwen_tts.inference.qwen3_tts_tokenizer import Qwen3TTSTokenizer
+
+        key = ("speech_tokenizer", self.content_hash(path), str(dtype))
+        return self._get_or_load(
+            key, lambda: Qwen3TTSTokenizer.from_pretrained(str(path), device_map="cpu", dtype=dtype),
+        )
+
+    def processor(self, model_dir: Path):
+        """Processor texte de model_dir, construit seulement si aucun identique n'est résident."""
+        from transformers import AutoConfig, AutoProcessor
+        from qwen_tts.core.models import Qwen3TTSConfig, Qwen3TTSProcessor
+
+        AutoConfig.register("qwen3_tts", Qwen3TTSConfig, exist_ok=True)
+        AutoProcessor.register(Qwen3TTSConfig, Qwen3TTSProcessor, exist_ok=True)
+        key = ("processor", self.content_hash(model_dir, PROCESSOR_FILES))
+        return self._get_or_load(
+            key, lambda: AutoProcessor.from_pretrained(str(model_dir), fix_mistral_regex=True),
+        )
+
+    def stats(self, models: Dict[str, Any]) -> Dict[str, Any]:
+        """Composants partagés entre les modèles résidents et mémoire économisée."""
+        users: Dict[int, List[str]] = collections.defaultdict(list)
+        nbytes: Dict[int, int] = {}
+        for model_key, model in models.items():
+            speech_tokenizer = getattr(getattr(model, "model", None), "speech_tokenizer", None)
+            if speech_tokenizer is not None:
+                users[id(speech_tokenizer)].append(model_key)
+                nbytes[id(speech_tokenizer)] = _component_nbytes(speech_tokenizer.model)
+        saved = sum((len(keys) - 1) * nbytes[ident] for ident, keys in users.items())
+        return {
+            "speech_tokenizers": [
+                {"models": keys, "memory_mb": round(nbytes[ident] / 1024 / 1024, 1)}
+                for ident, keys in users.items()
+            ],
+            "saved_bytes": saved,
+            "saved_mb": round(saved / 1024 / 1024, 1),
+            "loaded": self._stats["loaded"],
+            "reused": self._stats["reused"],
+            "hash_seconds": round(self._stats["hash_seconds"], 2),
+        }
+
+
+shared_components = SharedComponents()
+
+
+# Quantification int8 des couches Linear du talker sur CPU, par modèle :
+# VOXQWEN_QUANTIZE="clone_1_7b:dynamic,voice_design:weight" (mode "dynamic" par défaut)
+#   dynamic : poids et activations en int8 (produit matriciel entier, le plus rapide)
+#   weight  : poids seuls en int8, calcul en float32 (le plus fidèle)
+QUANTIZE_MODES = ("dynamic", "weight")
+QUANTIZE_MODELS = dict(
+    (item.strip().split(":", 1) + ["dynamic"])[:2]
+    for item in os.getenv("VOXQWEN_QUANTIZE", "").split(",") if item.strip()
+)
+QUANTIZED_DIR = MODELS_DIR.parent / "models_int8"  # Checkpoints quantifiés, écrits au premier chargement
+QUANTIZED_FORMAT = 2  # À incrémenter si la structure des checkpoints quantifiés change
+
+
+# Mode "weight" : poids déquantifiés par blocs de cette taille (float32), jamais en entier
+INT8_DEQUANT_BLOCK_BYTES = 8 * 1024 * 1024
+
+
+def _int_mm_supported(m: int, k: int, n: int, device: torch.device) -> bool:
+    """
+    Vérifie les contraintes de forme de torch._int_mm (API privée, variables selon la version).
+
+    Sur CUDA : M > 16, K et N multiples de 8 ; sur CPU, seules les contraintes
+    de K et N sont conservées (les versions récentes acceptent toutes les formes).
+    """
+    if not hasattr(torch, "_int_mm") or k % 8 or n % 8 or k < 16:
+        return False
+    return device.type != "cuda" or m > 16
+
+
+class Int8Linear(torch.nn.Module):
+    """
+    Couche Linear à poids int8 (échelle symétrique par canal de sortie), pour le CPU.
+
+    Les poids sont stockés transposés (in_features, out_features) et contigus,
+    opérande direct de torch._int_mm. En mode "dynamic", les activations sont
+    quantifiées à la volée (échelle par token) et le produit est calculé en
+    entiers ; en mode "weight", ou si la forme ne convient pas à torch._int_mm,
+    les poids sont déquantifiés bloc par bloc et accumulés en float32.
+    """
+
+    def __init__(self, in_features: int, out_features: int, bias: bool, mode: str):
+        super().__init__()
+        self.in_features = in_features
+        self.out_features = out_features
+        self.mode = mode
+        self.register_buffer("weight_int8", torch.empty(in_features, out_features, dtype=torch.int8))
+        self.register_buffer("weight_scale", torch.empty(out_features, dtype=torch.float32))
+        self.register_buffer("bias", torch.empty(out_features, dtype=torch.float32) if bias else None)
+        self.block_rows = max(1, INT8_DEQUANT_BLOCK_BYTES // (out_features * 4))
+
+    @classmethod
+    def from_linear(cls, linear: torch.nn.Linear, mode: str) -> "Int8Linear":
+        layer = cls(linear.in_features, linear.out_features, linear.bias is not None, mode)
+        weight = linear.weight.detach().to(torch.float32)
+        scale = weight.abs().amax(dim=1).clamp(min=1e-8) / 127
+        layer.weight_int8.copy_(torch.round(weight / scale[:, None]).clamp(-127, 127).t())
+        layer.weight_scale.copy_(scale)
+        if linear.bias is not None:
+            layer.bias.copy_(linear.bias.detach())
+        return layer
+
+    def _dequantized_matmul(self, x2d: torch.Tensor) -> torch.Tensor:
+        """x2d @ poids, déquantifiés par blocs de block_rows lignes (copie float32 bornée)."""
+        out = torch.zeros(x2d.shape[0], self.out_features, dtype=x2d.dtype, device=x2d.device)
+        for start in range(0, self.in_features, self.block_rows):
+            stop = start + self.block_rows
+            out.addmm_(x2d[:, start:stop], self.weight_int8[start:stop].to(x2d.dtype))
+        return out
+
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        x2d = x.reshape(-1, self.in_features).to(torch.float32)
+        if self.mode == "dynamic" and _int_mm_supported(x2d.shape[0], self.in_features, self.out_features, x2d.device):
+            x_scale = x2d.abs().amax(dim=1, keepdim=True).clamp(min=1e-8) / 127
+            x_int8 = torch.round(x2d / x_scale).to(torch.int8).contiguous()
+            out = torch._int_mm(x_int8, self.weight_int8).to(torch.float32) * x_scale
+        else:
+            out = self._dequantized_matmul(x2d)
+        out = out * self.weight_scale
+        if self.bias is not None:
+            out = out + self.bias
+        return out.to(x.dtype).reshape(*x.shape[:-1], self.out_features)
+
+    def extra_repr(self) -> str:
+        return f"in_features={self.in_features}, out_features={self.out_features}, mode={self.mode}"
+
+
+def quantize_linears(module: torch.nn.Module, mode: str, from_weights: bool = True):
+    """
+    Remplace les Linear du module par des Int8Linear (en place).
+
+    Les têtes de sortie (codec_head, lm_head) restent en pleine précision : leurs
+    logits pilotent l'échantillonnage. Avec from_weights=False, les couches sont
+    créées vides, pour recevoir un state_dict déjà quantifié.
+    """
+    for name, child in module.named_children():
+        if type(child) is torch.nn.Linear and "head" not in name:
+            if from_weights:
+                setattr(module, name, Int8Linear.from_linear(child, mode))
+            else:
+                setattr(module, name, Int8Linear(child.in_features, child.out_features, child.bias is not None, mode))
+        elif "head" not in name:
+            quantize_linears(child, mode, from_weights)
+
+
+def quantization_mode(model_key: str) -> Optional[str]:
+    """Mode de quantification du modèle, None en pleine précision (ou hors CPU)."""
+    mode = QUANTIZE_MODELS.get(model_key)
+    if mode is None or DEVICE != "cpu":
+        return None
+    if mode not in QUANTIZE_MODES:
+        raise ValueError(f"VOXQWEN_QUANTIZE : mode '{mode}' inconnu pour {model_key} ({', '.join(QUANTIZE_MODES)})")
+    return mode
+
+
+def quantized_checkpoint_path(model_key: str, mode: str) -> Path:
+    return QUANTIZED_DIR / f"{MODEL_NAMES[model_key]}-int8-{mode}.pt"
+
+
+def _quantized_identity(model_key: str, mode: str) -> Dict[str, Any]:
+    """Identité d'un checkpoint quantifié : un changement du checkpoint source ou de torch l'invalide."""
+    model_dir = MODELS_DIR / MODEL_NAMES[model_key]
+    source = sorted(
+        (str(path.relative_to(model_dir)), path.stat().st_size, int(path.stat().st_mtime))
+        for path in model_dir.glob("*.safetensors")
+    )
+    return {"format": QUANTIZED_FORMAT, "mode": mode, "torch": torch.__version__, "source": source}
+
+
+def load_talker_weights(model_dir: Path, dtype):
+    """
+    Charge les poids de Qwen3TTSForConditionalGeneration sur CPU, sans speech tokenizer.
+
+    Qwen3TTSForConditionalGeneration.from_pretrained charge aussi sa propre
+    copie du speech tokenizer : on appelle le chargement transformers de la
+    classe parente, le speech tokenizer étant fourni par assemble_model.
+    """
+    from qwen_tts.core.models import Qwen3TTSForConditionalGeneration
+
+    return super(Qwen3TTSForConditionalGeneration, Qwen3TTSForConditionalGeneration).from_pretrained(
+        str(model_dir), device_map="cpu", dtype=dtype,
+    )
+
+
+def assemble_model(model_dir: Path, hf_model, dtype):
+    """
+    Complète un modèle chargé comme Qwen3TTSModel.from_pretrained.
+
+    Speech tokenizer et processor viennent de shared_components : identiques à
+    ceux d'un modèle résident, ils sont réutilisés sans être reconstruits.
+    """
+    from qwen_tts import Qwen3TTSModel
+
+    hf_model.load_speech_tokenizer(shared_components.speech_tokenizer(model_dir / "speech_tokenizer", dtype))
+    with open(model_dir / "generation_config.json", "r", encoding="utf-8") as f:
+        hf_model.load_generate_config(json.load(f))
+    processor = shared_components.processor(model_dir)
+    return Qwen3TTSModel(model=hf_model, processor=processor, generate_defaults=hf_model.generate_config)
+
+
+def _build_quantized_model(model_key: str, mode: str, state_dict: Dict[str, torch.Tensor]):
+    """
+    Construit le modèle depuis un checkpoint quantifié, sans relire les poids d'origine.
+
+    Le squelette est construit sans allocation puis reçoit les tenseurs du
+    checkpoint ; le reste est assemblé par assemble_model.
+    """
+    from accelerate import init_empty_weights
+    from qwen_tts.core.models import Qwen3TTSConfig, Qwen3TTSForConditionalGeneration
+
+    model_dir = MODELS_DIR / MODEL_NAMES[model_key]
+    config = Qwen3TTSConfig.from_pretrained(str(model_dir))
+    with init_empty_weights():
+        hf_model = Qwen3TTSForConditionalGeneration(config)
+    quantize_linears(hf_model.talker, mode, from_weights=False)
+    hf_model.load_state_dict(state_dict, assign=True)
+    hf_model.eval()
+    return assemble_model(model_dir, hf_model, torch.float32)
+
+
+def load_quantized_model(model_key: str, mode: str, phases: Dict[str, Any]):
+    """
+    Charge un modèle quantifié int8 sur CPU.
+
+    Au premier chargement, le modèle est chargé en float32, quantifié puis écrit
+    dans QUANTIZED_DIR ; les démarrages suivants lisent directement ce
+    checkpoint (environ 4x plus petit pour le talker).
+    """
+    path = quantized_checkpoint_path(model_key, mode)
+    identity = _quantized_identity(model_key, mode)
+    started = time.perf_counter()
+    if path.exists():
+        checkpoint = torch.load(path, map_location="cpu", weights_only=True, mmap=True)
+        if checkpoint.get("identity") == identity:
+            phases["io_seconds"] = round(time.perf_counter() - started, 2)
+            started = time.perf_counter()
+            model = _build_quantized_model(model_key, mode, checkpoint["state_dict"])
+            phases["materialize_seconds"] = round(time.perf_counter() - started, 2)
+            return model
+        print(f"Checkpoint quantifie {path.name} obsolete, nouvelle quantification")
+
+    model_dir = MODELS_DIR / MODEL_NAMES[model_key]
+    phases["io_mb"] = round(prefetch_checkpoint(model_dir) / 1024 / 1024, 1)
+    phases["io_seconds"] = round(time.perf_counter() - started, 2)
+    started = time.perf_counter()
+    model = assemble_model(model_dir, load_talker_weights(model_dir, torch.float32), torch.float32)
+    phases["materialize_seconds"] = round(time.perf_counter() - started, 2)
+
+    started = time.perf_counter()
+    quantize_linears(model.model.talker, mode)
+    QUANTIZED_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    torch.save({"identity": identity, "state_dict": model.model.state_dict()}, tmp_path)
+    os.replace(tmp_path, path)
+    phases["quantize_seconds"] = round(time.perf_counter() - started, 2)
+    print(f"Checkpoint quantifie ecrit : {path}")
+    return model
+
+
+def _from_pretrained(model_key: str, dtype):
+    """
+    Charge un checkpoint Qwen3-TTS local depuis MODELS_DIR.
+
+    Trois phases, chronométrées dans model_load_status[model_key]["phases"] :
+    lecture des poids en page cache (io), construction du modèle depuis les
+    safetensors mappés en mémoire (materialize), transfert sur le device.
+    """
+    model_name = MODEL_NAMES[model_key]
+    model_dir = MODELS_DIR / model_name
+    print("=" * 60)
+    print(f"Chargement du modele {model_name}...")
+    print("Cela peut prendre quelques minutes au premier lancement.")
+    print("=" * 60)
+
+    phases = model_load_status[model_key]["phases"]
+    mode = quantization_mode(model_key)
+    if mode is not None:
+        phases["quantization"] = mode
+        model = load_quantized_model(model_key, mode, phases)
+        prefix_kv_cache.attach(model_key, model)
+        print(f"Modele {model_name} charge sur {DEVICE}, int8 {mode} ({phases})")
+        return model
+
+    started = time.perf_counter()
+    read_bytes = prefetch_checkpoint(model_dir)
+    phases["io_seconds"] = round(time.perf_counter() - started, 2)
+    phases["io_mb"] = round(read_bytes / 1024 / 1024, 1)
+
+    # Pour Mac Studio (MPS), pas de flash_attention_2
+    started = time.perf_counter()
+    # Speech tokenizer et processor identiques à ceux d'un modèle résident : réutilisés
+    model = assemble_model(model_dir, load_talker_weights(model_dir, dtype), dtype)
+    phases["materialize_seconds"] = round(time.perf_counter() - started, 2)
+
+    started = time.perf_counter()
+    if DEVICE != "cpu":
+        _move_to_device(model, DEVICE)
+        if DEVICE.startswith("cuda"):
+            torch.cuda.synchronize()
+        elif DEVICE == "mps":
+            torch.mps.synchronize()
+    phases["device_seconds"] = round(time.perf_counter() - started, 2)
+
+    prefix_kv_cache.attach(model_key, model)
+    print(f"Modele {model_name} charge sur {DEVICE} ({phases})")
+    return model
+
+
+def load_voice_design_model():
+    """Charge le modele Voice Design."""
+    return model_manager.get("voice_design")
+
+
+def load_voice_clone_model():
+    """Charge le modele Voice Clone (1.7B-CustomVoice)."""
+    return model_manager.get("voice_clone")
+
+
+def load_preset_voice_model():
+    """Charge le modele Preset Voice (0.6B-CustomVoice)."""
+    return model_manager.get("preset_voice")
+
+
+def load_clone_base_model(model_size: str = "1.7B"):
+    """
+    Charge le modele Base pour le clonage vocal.
+
+    Les modeles Base supportent create_voice_clone_prompt() contrairement aux CustomVoice.
+
+    Args:
+        model_size: "1.7B" (qualite) ou "0.6B" (rapide)
+
+    Returns:
+        Le modele charge
+    """
+    if model_size not in ("1.7B", "0.6B"):
+        raise ValueError(f"model_size doit etre '1.7B' ou '0.6B', pas '{model_size}'")
+    return model_manager.get("clone_1_7b" if model_size == "1.7B" else "clone_0_6b")
+
+
+# ==============================================================================
+# PREFIX KV CACHE (préremplissage partagé entre requêtes)
+# ==============================================================================
+
+# Expérimental, désactivé par défaut (0) : dépend d'internes de qwen_tts et transformers
+PREFIX_CACHE_MB = int(os.environ.get("VOXQWEN_PREFIX_CACHE_MB", "0"))
+PREFIX_MIN_TOKENS = 16  # Préfixe minimal réutilisé (en dessous, le gain est négligeable)
+PREFIX_PROBE_TOKENS = 8  # Premières positions hachées pour retrouver les préfixes candidats
+
+
+def _cache_layers(cache) -> Optional[List[tuple]]:
+    """(keys, values) par couche d'un DynamicCache (API transformers récente ou ancienne), None sinon."""
+    if hasattr(cache, "layers"):
+        if not all(hasattr(layer, "keys") and hasattr(layer, "values") for layer in cache.layers):
+            return None
+        return [(layer.keys, layer.values) for layer in cache.layers]
+    if hasattr(cache, "key_cache") and hasattr(cache, "value_cache"):
+        return list(zip(cache.key_cache, cache.value_cache))
+    return None
+
+
+def _is_dynamic_cache(cache) -> bool:
+    """Seul le DynamicCache de transformers est pris en charge (les autres caches passent tels quels)."""
+    try:
+        from transformers.cache_utils import DynamicCache
+    except ImportError:
+        return False
+    return type(cache) is DynamicCache
+
+
+def _common_prefix_length(a: torch.Tensor, b: torch.Tensor) -> int:
+    """Nombre de positions initiales identiques de deux séquences d'embeddings [T, D]."""
+    n = min(a.shape[0], b.shape[0])
+    if n == 0:
+        return 0
+    same = (a[:n] == b[:n]).all(dim=-1)
+    if bool(same.all()):
+        return n
+    return int((~same).nonzero()[0, 0])
+
+
+class PrefixKVCache:
+    """
+    États KV du talker pour les préfixes récurrents, par modèle, sous budget mémoire (LRU).
+
+    Le préremplissage d'une génération commence par des positions qui ne dépendent
+    que de l'instruction et de la voix (rôle, langue, locuteur, texte et codes de la
+    référence d'un prompt de clonage). Au préremplissage, les embeddings d'entrée sont
+    comparés aux préfixes connus : la plus longue partie commune reprend les états KV
+    stockés et seule la suite est calculée. Une entrée est réduite à la partie
+    effectivement partagée dès sa première réutilisation.
+
+    Seules les générations unitaires sans padding sont concernées ; les micro-batches
+    (paddés à gauche) sont préremplis normalement.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: "collections.OrderedDict[int, dict]" = collections.OrderedDict()
+        self._ids = itertools.count()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {
+            "hits": 0, "misses": 0, "evictions": 0,
+            "reused_tokens": 0, "prefilled_tokens": 0,
+        }
+
+    def attach(self, model_key: str, model):
+        """Installe le cache sur le talker d'un modèle chargé (sans effet si budget nul)."""
+        talker = getattr(getattr(model, "model", None), "talker", None)
+        if self.max_bytes <= 0 or talker is None or not hasattr(talker, "get_rope_index"):
+            return
+        original_forward = talker.forward
+
+        # wraps : generate() valide ses arguments sur la signature de forward
+        @functools.wraps(original_forward)
+        def forward(*args, **kwargs):
+            # Appel positionnel : forward d'origine, sans cache de préfixe
+            if args:
+                return original_forward(*args, **kwargs)
+            return self._forward(model_key, talker, original_forward, kwargs)
+
+        talker.forward = forward
+
+    def forget(self, model_key: str):
+        """Retire les entrées d'un modèle (déchargé)."""
+        with self._lock:
+            for entry_id in [i for i, e in self._entries.items() if e["model_key"] == model_key]:
+                self._bytes -= self._entries.pop(entry_id)["nbytes"]
+
+    @staticmethod
+    def _probe(embeds: torch.Tensor) -> str:
+        head = embeds[:PREFIX_PROBE_TOKENS].detach().to("cpu", torch.float32)
+        return hashlib.sha1(head.numpy().tobytes()).hexdigest()
+
+    def _forward(self, model_key: str, talker, original_forward, kwargs: dict):
+        inputs_embeds = kwargs.get("inputs_embeds")
+        cache = kwargs.get("past_key_values")
+        attention_mask = kwargs.get("attention_mask")
+        # Uniquement le préremplissage (cache vide) d'une séquence unique sans padding
+        if (
+            inputs_embeds is None
+            or inputs_embeds.shape[0] != 1
+            or inputs_embeds.shape[1] <= PREFIX_MIN_TOKENS
+            or not _is_dynamic_cache(cache)
+            or cache.get_seq_length() != 0
+            or (attention_mask is not None and not bool(attention_mask.all()))
+        ):
+            return original_forward(**kwargs)
+
+        embeds = inputs_embeds[0]
+        total = embeds.shape[0]
+        probe = self._probe(embeds)
+        entry, length = self._lookup(model_key, probe, embeds)
+        # Le talker ne reconnaît un préremplissage qu'à partir de 2 positions
+        length = min(length, total - 2)
+
+        if entry is None or length < PREFIX_MIN_TOKENS:
+            outputs = original_forward(**kwargs)
+            self._store(model_key, probe, embeds, outputs.past_key_values)
+            with self._lock:
+                self._stats["misses"] += 1
+                self._stats["prefilled_tokens"] += total
+            return outputs
+
+        for layer_idx, (keys, values) in enumerate(entry["kv"]):
+            cache.update(keys[:, :, :length], values[:, :, :length], layer_idx)
+
+        # Positions et décalage rope identiques à un préremplissage complet sans padding
+        full_mask = torch.ones((1, total), dtype=torch.long, device=inputs_embeds.device)
+        position_ids, rope_deltas = talker.get_rope_index(full_mask)
+        kwargs.update(
+            inputs_embeds=inputs_embeds[:, length:],
+            attention_mask=None,  # Pas de padding : masque causal implicite
+            position_ids=position_ids[:, :, length:],
+            cache_position=torch.arange(length, total, device=inputs_embeds.device),
+        )
+        outputs = original_forward(**kwargs)
+        talker.rope_deltas = rope_deltas
+        with self._lock:
+            self._stats["hits"] += 1
+            self._stats["reused_tokens"] += length
+            self._stats["prefilled_tokens"] += total - length
+        return outputs
+
+    def _lookup(self, model_key: str, probe: str, embeds: torch.Tensor) -> tuple:
+        """Plus long préfixe connu pour ces embeddings : (entrée, longueur commune)."""
+        with self._lock:
+            best_id, best_length = None, 0
+            for entry_id, entry in self._entries.items():
+                if entry["model_key"] != model_key or entry["probe"] != probe:
+                    continue
+                length = _common_prefix_length(entry["embeds"], embeds)
+                if length > best_length:
+                    best_id, best_length = entry_id, length
+            if best_id is None or best_length < PREFIX_MIN_TOKENS:
+                return None, 0
+
+            self._entries.move_to_end(best_id)
+            entry = self._entries[best_id]
+            if not entry["shared"]:
+                # Première réutilisation : ne garder que la partie partagée (copie
+                # compacte, la séquence complète de la première requête est libérée)
+                entry["embeds"] = entry["embeds"][:best_length].clone()
+                entry["kv"] = [
+                    (keys[:, :, :best_length].clone(), values[:, :, :best_length].clone())
+                    for keys, values in entry["kv"]
+                ]
+                nbytes = entry["embeds"].nbytes + sum(k.nbytes + v.nbytes for k, v in entry["kv"])
+                self._bytes += nbytes - entry["nbytes"]
+                entry.update(nbytes=nbytes, shared=True)
+            return entry, best_length
+
+    def _store(self, model_key: str, probe: str, embeds: torch.Tensor, cache):
+        """Mémorise le préremplissage complet d'une requête (réduit au premier partage)."""
+        # Les tenseurs du cache ne sont jamais modifiés en place (concaténation à
+        # chaque pas de décodage) : les conserver ne demande aucune copie
+        kv = _cache_layers(cache)
+        if kv is None:
+            return
+        nbytes = embeds.nbytes + sum(k.nbytes + v.nbytes for k, v in kv)
+        if nbytes > self.max_bytes:
+            return
+        with self._lock:
+            self._entries[next(self._ids)] = {
+                "model_key": model_key,
+                "probe": probe,
+                "embeds": embeds,
+                "kv": kv,
+                "nbytes": nbytes,
+                "shared": False,
+            }
+            self._bytes += nbytes
+            while self._bytes > self.max_bytes and self._entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted["nbytes"]
+                self._stats["evictions"] += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                **self._stats,
+                "entries": len(self._entries),
+                "shared_entries": sum(1 for e in self._entries.values() if e["shared"]),
+                "memory_mb": round(self._bytes / (1024 * 1024), 1),
+                "max_memory_mb": PREFIX_CACHE_MB,
+            }
+
+
+prefix_kv_cache = PrefixKVCache(PREFIX_CACHE_MB * 1024 * 1024)
+
+
+# ==============================================================================
+# DEADLINES (budget de latence par requête)
+# ==============================================================================
+
+# Deadline de la requête courante (horloge time.perf_counter), None = pas de deadline
+request_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar(
+    "request_deadline", default=None
+)
+
+deadline_stats = {"expired_waiting": 0, "invalid_headers": 0}
+
+
+class DeadlineExceededError(HTTPException):
+    """Deadline de la requête dépassée (504) : le client peut basculer sur un repli."""
+
+    def __init__(self, detail: str = "Deadline de la requête dépassée"):
+        super().__init__(status_code=504, detail=detail)
+
+
+@app.exception_handler(DeadlineExceededError)
+async def deadline_exceeded_handler(request: Request, exc: DeadlineExceededError):
+    """Handler pour les deadlines dépassées (REST et MCP)."""
+    return JSONResponse(
+        status_code=exc.status_code,
+        content={
+            "error": "Deadline exceeded",
+            "code": "DEADLINE_EXCEEDED",
+            "detail": exc.detail,
+        },
+    )
+
+
+def parse_deadline_header(value: str) -> float:
+    """
+    Convertit X-Request-Deadline en deadline sur l'horloge time.perf_counter.
+
+    Formats acceptés :
+    - budget relatif en millisecondes (ex: "2500")
+    - timestamp Unix absolu en secondes (ex: "1760700000.5"), reconnu à partir de 1e9
+
+    Raises:
+        ValueError: si la valeur n'est pas un nombre positif
+    """
+    number = float(value)
+    if not math.isfinite(number) or number <= 0:
+        raise ValueError(value)
+    if number >= 1e9:
+        return time.perf_counter() + (number - time.time())
+    return time.perf_counter() + number / 1000
+
+
+def tighten_deadline(deadline_ms: Optional[int]):
+    """Applique un budget en ms (champ MCP) s'il est plus court que la deadline courante."""
+    if not deadline_ms:
+        return
+    deadline = time.perf_counter() + deadline_ms / 1000
+    current = request_deadline.get()
+    if current is None or deadline < current:
+        request_deadline.set(deadline)
+
+
+def deadline_expired(deadline: Optional[float]) -> bool:
+    """True si la deadline est dépassée (False sans deadline)."""
+    return deadline is not None and time.perf_counter() >= deadline
+
+
+class RequestDeadlineMiddleware:
+    """
+    Middleware ASGI qui lit l'en-tête X-Request-Deadline.
+
+    La deadline est posée dans request_deadline pour toute la requête : les
+    travaux soumis à l'exécuteur d'inférence la portent, sont abandonnés en
+    file une fois expirés et interrompus en cours de génération.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            for name, value in scope["headers"]:
+                if name == b"x-request-deadline":
+                    try:
+                        request_deadline.set(parse_deadline_header(value.decode("latin-1")))
+                    except ValueError:
+                        deadline_stats["invalid_headers"] += 1
+                        response = JSONResponse(
+                            status_code=400,
+                            content={
+                                "error": "Invalid X-Request-Deadline",
+                                "code": "INVALID_DEADLINE",
+                                "detail": "Attendu: budget en ms ou timestamp Unix en secondes",
+                            },
+                        )
+                        await response(scope, receive, send)
+                        return
+                    break
+        await self.app(scope, receive, send)
+
+
+app.add_middleware(RequestDeadlineMiddleware)
+
+
+# ==============================================================================
+# INFERENCE EXECUTOR
+# ==============================================================================
+
+# Générations simultanées par modèle et taille max de la file d'attente par modèle
+INFERENCE_WORKERS_PER_MODEL = int(os.getenv("VOXQWEN_INFERENCE_WORKERS", "1"))
+INFERENCE_QUEUE_SIZE = int(os.getenv("VOXQWEN_INFERENCE_QUEUE_SIZE", "64"))
+
+# Contrôle d'admission : backlog max estimé par modèle (secondes de génération)
+MAX_BACKLOG_SECONDS = float(os.getenv("VOXQWEN_MAX_BACKLOG_SECONDS", "120"))
+# Au-delà, le débit mesuré n'est plus utilisé pour refuser ou abandonner un travail
+THROUGHPUT_MAX_AGE_SECONDS = 600
+
+# Classes de priorité du scheduler (plus petit = servi en premier)
+# - interactive : routes unitaires (/preset, /design, /clone...) et outils MCP
+# - bulk : routes /batch/*, cèdent la place entre deux lots
+# - idle : prégénération du hot set, interrompue dès qu'un autre travail arrive
+PRIORITY_CLASSES = {"interactive": 0, "bulk": 1, "idle": 2}
+
+
+def clone_model_key(model_size: str) -> str:
+    """Retourne la clé du modèle Base pour une taille ("1.7B" -> "clone_1_7b")."""
+    return "clone_" + model_size.lower().replace(".", "_")
+
+
+def text_cost(text) -> int:
+    """Coût estimé d'une génération : nombre de caractères à synthétiser."""
+    if isinstance(text, str):
+        return len(text)
+    return sum(len(t) for t in text)
+
+
+class ServerOverloadedError(HTTPException):
+    """Requête refusée par le contrôle d'admission (503 + Retry-After)."""
+
+    def __init__(self, model_key: str, retry_after: int, reason: str):
+        self.retry_after = retry_after
+        super().__init__(
+            status_code=503,
+            detail=f"{reason} ({MODEL_NAMES.get(model_key, model_key)}), réessayez dans {retry_after}s",
+            headers={"Retry-After": str(retry_after)},
+        )
+
+
+@app.exception_handler(ServerOverloadedError)
+async def server_overloaded_handler(request: Request, exc: ServerOverloadedError):
+    """Handler pour les refus d'admission (REST et MCP)."""
+    return JSONResponse(
+        status_code=exc.status_code,
+        content={
+            "error": "Server overloaded",
+            "code": "SERVER_OVERLOADED",
+            "detail": exc.detail,
+            "retry_after": exc.retry_after,
+        },
+        headers=exc.headers,
+    )
+
+
+class IdlePreemptedError(Exception):
+    """Travail "idle" interrompu pour laisser la place à du trafic réel."""
+
+
+def _set_future_result(future: asyncio.Future, result: Any):
+    """Résout un future asyncio (appelé dans la boucle via call_soon_threadsafe)."""
+    if not future.done():
+        future.set_result(result)
+
+
+def _set_future_exception(future: asyncio.Future, exc: BaseException):
+    """Propage une exception vers un future asyncio (appelé dans la boucle)."""
+    if not future.done():
+        future.set_exception(exc)
+
+
+class InferenceJob:
+    """Travail d'inférence en file : fonction à exécuter et future de l'appelant."""
+
+    __slots__ = ("fn", "args", "kwargs", "loop", "future", "priority", "cost", "enqueued_at",
+                 "cancel_event", "deadline")
+
+    def __init__(self, fn, args: tuple, kwargs: dict, loop: asyncio.AbstractEventLoop,
+                 future: asyncio.Future, priority: str, cost: int, deadline: Optional[float] = None):
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.loop = loop
+        self.future = future
+        self.priority = priority
+        self.cost = cost
+        self.enqueued_at = time.perf_counter()
+        self.deadline = deadline
+        # Positionné quand l'appelant abandonne : interrompt la génération en cours
+        self.cancel_event = threading.Event()
+        future.add_done_callback(self._on_future_done)
+
+    def _on_future_done(self, future: asyncio.Future):
+        if future.cancelled():
+            self.cancel_event.set()
+
+
+class InferenceExecutor:
+    """
+    Exécuteur d'inférence : une file de priorité bornée et des threads dédiés par modèle.
+
+    Les routes (REST et MCP) soumettent leurs générations ici au lieu de bloquer
+    la boucle d'événements ou le pool de threads d'AnyIO. Chaque modèle exécute
+    au plus `workers_per_model` générations simultanées ; le surplus attend dans
+    une file de `max_queue_size` éléments, au-delà la requête est refusée (503).
+
+    Les travaux "interactive" passent toujours devant les travaux "bulk" en
+    attente. Les routes bulk soumettent leurs lots un par un : une requête
+    interactive n'attend donc au plus que la fin du lot en cours.
+
+    Contrôle d'admission : chaque travail porte un coût (caractères à
+    synthétiser). Le débit mesuré par modèle (caractères/s) convertit le
+    travail en attente en secondes ; au-delà de MAX_BACKLOG_SECONDS, la requête
+    est refusée avec un Retry-After calculé sur ce débit. Il est mesuré sur la
+    génération seule (un travail qui a attendu le chargement du modèle n'est
+    pas compté), et ignoré sans échantillon depuis THROUGHPUT_MAX_AGE_SECONDS.
+
+    Deadlines : un travail dont la deadline (request_deadline) est dépassée, ou
+    que le débit mesuré ne permet plus de terminer à temps, est abandonné avant
+    d'occuper le modèle ; un travail en cours est interrompu à sa deadline.
+    L'appelant reçoit alors DeadlineExceededError (504).
+
+    Les travaux "idle" (prégénération) ne passent pas le contrôle d'admission ;
+    tout autre travail soumis sur le modèle interrompt ceux en cours, dont
+    l'appelant reçoit IdlePreemptedError.
+    """
+
+    def __init__(self, workers_per_model: int = 1, max_queue_size: int = 64):
+        self.workers_per_model = max(1, workers_per_model)
+        self.max_queue_size = max_queue_size
+        self._queues: Dict[str, queue.PriorityQueue] = {}
+        self._workers: Dict[str, List[threading.Thread]] = {}
+        self._stats: Dict[str, Dict[str, int]] = {}
+        # Temps d'attente récents en file par classe (ms), pour p50/p99
+        self._waits: Dict[str, collections.deque] = {
+            priority: collections.deque(maxlen=1000) for priority in PRIORITY_CLASSES
+        }
+        # Travail en attente ou en cours (caractères) et débit mesuré (caractères/s)
+        self._outstanding: Dict[str, int] = collections.defaultdict(int)
+        self._throughput: Dict[str, float] = {}
+        self._throughput_at: Dict[str, float] = {}
+        self._sequence = itertools.count()
+        # Travaux idle en cours par modèle (interrompus à l'arrivée d'un autre travail)
+        self._running_idle: Dict[str, set] = collections.defaultdict(set)
+        # Travaux non idle en file ou en cours, et fin du dernier (pour idle_seconds)
+        self._active = 0
+        self._last_active = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def _get_queue(self, model_key: str) -> queue.PriorityQueue:
+        """Retourne la file du modèle, en démarrant ses workers au premier appel."""
+        with self._lock:
+            work_queue = self._queues.get(model_key)
+            if work_queue is None:
+                work_queue = queue.PriorityQueue(maxsize=self.max_queue_size)
+                self._queues[model_key] = work_queue
+                self._stats[model_key] = {
+                    "submitted": 0, "completed": 0, "failed": 0, "rejected": 0, "running": 0,
+                    "cancelled": 0, "interrupted": 0, "expired": 0, "preempted": 0,
+                }
+                self._workers[model_key] = [
+                    threading.Thread(
+                        target=self._worker_loop,
+                        args=(model_key, work_queue),
+                        name=f"inference-{model_key}-{i}",
+                        daemon=True,
+                    )
+                    for i in range(self.workers_per_model)
+                ]
+                for worker in self._workers[model_key]:
+                    worker.start()
+            return work_queue
+
+    def _count(self, model_key: str, stat: str, delta: int = 1):
+        with self._lock:
+            self._stats[model_key][stat] += delta
+
+    def _measured_throughput(self, model_key: str) -> Optional[float]:
+        """Débit mesuré du modèle, None sans échantillon depuis THROUGHPUT_MAX_AGE_SECONDS."""
+        measured_at = self._throughput_at.get(model_key)
+        if measured_at is None or time.perf_counter() - measured_at > THROUGHPUT_MAX_AGE_SECONDS:
+            return None
+        return self._throughput[model_key]
+
+    def _backlog_seconds(self, model_key: str, extra_cost: int = 0) -> Optional[float]:
+        """Backlog estimé en secondes (None sans débit mesuré récent)."""
+        throughput = self._measured_throughput(model_key)
+        if not throughput:
+            return None
+        return (self._outstanding[model_key] + extra_cost) / (throughput * self.workers_per_model)
+
+    def check_admission(self, model_key: str, cost: int):
+        """
+        Refuse la requête si le backlog estimé du modèle dépasse MAX_BACKLOG_SECONDS.
+
+        Les routes bulk l'appellent une fois pour tout le batch avant de
+        soumettre leurs lots ; les travaux interactifs sont vérifiés dans submit().
+
+        Raises:
+            ServerOverloadedError: 503 avec Retry-After
+        """
+        with self._lock:
+            backlog = self._backlog_seconds(model_key, cost)
+        if backlog is not None and backlog > MAX_BACKLOG_SECONDS:
+            self._get_queue(model_key)
+            self._count(model_key, "rejected")
+            raise ServerOverloadedError(
+                model_key,
+                max(1, math.ceil(backlog - MAX_BACKLOG_SECONDS)),
+                "Trop de travail en attente",
+            )
+
+    async def submit(self, model_key: str, fn, *args, priority: str = "interactive",
+                     cost: int = 0, **kwargs):
+        """
+        Exécute fn(*args, **kwargs) sur un worker du modèle et attend le résultat.
+
+        Args:
+            model_key: Clé du modèle (voir MODEL_NAMES)
+            fn: Fonction bloquante (chargement + génération)
+            priority: Classe de priorité ("interactive" ou "bulk")
+            cost: Coût estimé (caractères à synthétiser, voir text_cost)
+
+        Returns:
+            Le résultat de fn, ou lève l'exception levée par fn
+        """
+        deadline = request_deadline.get()
+        if deadline_expired(deadline):
+            self._get_queue(model_key)
+            self._count(model_key, "expired")
+            raise DeadlineExceededError("Deadline dépassée avant la mise en file")
+        if priority == "interactive":
+            self.check_admission(model_key, cost)
+        if priority != "idle":
+            self._preempt_idle(model_key)
+
+        loop = asyncio.get_running_loop()
+        job = InferenceJob(fn, args, kwargs, loop, loop.create_future(), priority, cost, deadline)
+        work_queue = self._get_queue(model_key)
+        if priority != "idle":
+            with self._lock:
+                self._active += 1
+        try:
+            work_queue.put_nowait((PRIORITY_CLASSES[priority], next(self._sequence), job))
+        except queue.Full:
+            self._count(model_key, "rejected")
+            with self._lock:
+                if priority != "idle":
+                    self._active -= 1
+                backlog = self._backlog_seconds(model_key)
+            raise ServerOverloadedError(
+                model_key,
+                max(1, math.ceil(backlog)) if backlog is not None else 1,
+                "File d'inférence pleine",
+            )
+        with self._lock:
+            self._stats[model_key]["submitted"] += 1
+            self._outstanding[model_key] += cost
+        return await job.future
+
+    def _preempt_idle(self, model_key: str):
+        """Interrompt les travaux idle en cours sur le modèle (voir call_generate)."""
+        with self._lock:
+            running = list(self._running_idle.get(model_key, ()))
+        for job in running:
+            job.cancel_event.set()
+
+    def is_busy(self, model_key: str) -> bool:
+        """True si le modèle a du travail en file ou en cours (ne pas le décharger)."""
+        with self._lock:
+            work_queue = self._queues.get(model_key)
+            if work_queue is None:
+                return False
+            return self._stats[model_key]["running"] > 0 or not work_queue.empty()
+
+    def idle_seconds(self) -> float:
+        """Durée depuis la fin du dernier travail non idle (0 si du travail est en cours)."""
+        with self._lock:
+            if self._active:
+                return 0.0
+            return time.perf_counter() - self._last_active
+
+    def _worker_loop(self, model_key: str, work_queue: queue.PriorityQueue):
+        """Boucle d'un worker : exécute les travaux de la file par ordre de priorité."""
+        while True:
+            _, _, job = work_queue.get()
+            try:
+                # Requête annulée pendant l'attente : ne pas consommer de temps modèle
+                if job.cancel_event.is_set():
+                    self._count(model_key, "cancelled")
+                    continue
+                # Deadline dépassée en file, ou intenable au débit mesuré
+                reason = self._deadline_miss(model_key, job)
+                if reason is not None:
+                    self._count(model_key, "expired")
+                    job.loop.call_soon_threadsafe(
+                        _set_future_exception, job.future, DeadlineExceededError(reason)
+                    )
+                    continue
+                with self._lock:
+                    self._waits[job.priority].append((time.perf_counter() - job.enqueued_at) * 1000)
+                self._count(model_key, "running")
+                if job.priority == "idle":
+                    with self._lock:
+                        self._running_idle[model_key].add(job)
+                _worker_context.cancel_event = job.cancel_event
+                _worker_context.priority = job.priority
+                _worker_context.model_key = model_key
+                _worker_context.waited_for_load = False
+                # Interrompt la génération à la deadline (même mécanisme que l'annulation)
+                timer = None
+                if job.deadline is not None:
+                    timer = threading.Timer(max(0.0, job.deadline - time.perf_counter()), job.cancel_event.set)
+                    timer.daemon = True
+                    timer.start()
+                started = time.perf_counter()
+                try:
+                    result = job.fn(*job.args, **job.kwargs)
+                except BaseException as e:
+                    if deadline_expired(job.deadline):
+                        self._count(model_key, "expired")
+                        e = DeadlineExceededError("Deadline dépassée pendant la génération")
+                    else:
+                        self._count(model_key, "failed")
+                    job.loop.call_soon_threadsafe(_set_future_exception, job.future, e)
+                else:
+                    if deadline_expired(job.deadline):
+                        # Résultat tronqué ou trop tardif : l'appelant a déjà reçu un 504
+                        self._count(model_key, "expired")
+                        job.loop.call_soon_threadsafe(
+                            _set_future_exception, job.future,
+                            DeadlineExceededError("Deadline dépassée pendant la génération"),
+                        )
+                    elif job.priority == "idle" and job.cancel_event.is_set():
+                        # Prégénération interrompue : audio tronqué, à ne pas mettre en cache
+                        self._count(model_key, "preempted")
+                        job.loop.call_soon_threadsafe(
+                            _set_future_exception, job.future,
+                            IdlePreemptedError("Prégénération interrompue par du trafic"),
+                        )
+                    else:
+                        if job.cancel_event.is_set():
+                            # Génération interrompue en cours de route (voir call_generate)
+                            self._count(model_key, "interrupted")
+                        else:
+                            self._count(model_key, "completed")
+                            # Un travail qui a chargé le modèle ne mesure pas le débit de génération
+                            if not _worker_context.waited_for_load:
+                                self._record_throughput(model_key, job.cost, time.perf_counter() - started)
+                        job.loop.call_soon_threadsafe(_set_future_result, job.future, result)
+                finally:
+                    if timer is not None:
+                        timer.cancel()
+                    _worker_context.cancel_event = None
+                    _worker_context.priority = None
+                    _worker_context.model_key = None
+                    self._count(model_key, "running", -1)
+                    with self._lock:
+                        self._running_idle[model_key].discard(job)
+            finally:
+                with self._lock:
+                    self._outstanding[model_key] -= job.cost
+                    if job.priority != "idle":
+                        self._active -= 1
+                        self._last_active = time.perf_counter()
+                work_queue.task_done()
+
+    def _deadline_miss(self, model_key: str, job: InferenceJob) -> Optional[str]:
+        """Raison de l'abandon si le travail ne peut plus tenir sa deadline, sinon None."""
+        if job.deadline is None:
+            return None
+        remaining = job.deadline - time.perf_counter()
+        if remaining <= 0:
+            return "Deadline dépassée en file d'attente"
+        throughput = self._measured_throughput(model_key)
+        if throughput and job.cost / throughput > remaining:
+            return (
+                f"Deadline intenable : génération estimée à {job.cost / throughput:.1f}s, "
+                f"{remaining:.1f}s restantes"
+            )
+        return None
+
+    def _record_throughput(self, model_key: str, cost: int, elapsed: float):
+        """Met à jour le débit mesuré du modèle (moyenne mobile exponentielle)."""
+        if cost <= 0 or elapsed <= 0:
+            return
+        rate = cost / elapsed
+        with self._lock:
+            previous = self._throughput.get(model_key)
+            self._throughput[model_key] = rate if previous is None else 0.8 * previous + 0.2 * rate
+            self._throughput_at[model_key] = time.perf_counter()
+
+    def stats(self) -> Dict[str, Any]:
+        """Statistiques par modèle (file, exécution, compteurs) et attente par classe."""
+        with self._lock:
+            models = {}
+            for model_key, stats in self._stats.items():
+                backlog = self._backlog_seconds(model_key)
+                models[model_key] = {
+                    "queued": self._queues[model_key].qsize(),
+                    "workers": len(self._workers[model_key]),
+                    **stats,
+                    "outstanding_chars": self._outstanding[model_key],
+                    "throughput_chars_per_s": round(self._throughput.get(model_key, 0.0), 1),
+                    "estimated_backlog_s": round(backlog, 1) if backlog is not None else None,
+                }
+            waits = {priority: sorted(samples) for priority, samples in self._waits.items()}
+        return {
+            "models": models,
+            "queue_wait_ms": {
+                priority: {
+                    "samples": len(samples),
+                    "p50": round(samples[len(samples) // 2], 1) if samples else 0,
+                    "p99": round(samples[min(len(samples) - 1, int(len(samples) * 0.99))], 1) if samples else 0,
+                    "max": round(samples[-1], 1) if samples else 0,
+                }
+                for priority, samples in waits.items()
+            },
+        }
+
+
+inference_executor = InferenceExecutor(INFERENCE_WORKERS_PER_MODEL, INFERENCE_QUEUE_SIZE)
+
+
+# ==============================================================================
+# CANCELLATION (déconnexion client, interruption des générations)
+# ==============================================================================
+
+# Interruption token par token des générations abandonnées (stopping_criteria)
+STOP_ON_CANCEL = os.getenv("VOXQWEN_STOP_ON_CANCEL", "1") == "1"
+DISCONNECT_POLL_INTERVAL = 0.5
+
+# Contexte du worker d'inférence courant (cancel_event, priorité et modèle du travail en cours)
+_worker_context = threading.local()
+
+# Modèles dont la génération n'accepte pas stopping_criteria (détecté au premier appel)
+_stop_unsupported: set = set()
+
+cancellation_stats = {"client_disconnects": 0}
+
+
+class ClientDisconnectedError(HTTPException):
+    """
+    Client déconnecté pendant la génération.
+
+    La réponse n'est lue par personne : un 408 sans corps, pour que les logs
+    d'accès distinguent ces abandons des erreurs serveur.
+    """
+
+    def __init__(self):
+        super().__init__(status_code=408, detail="Client déconnecté, génération annulée")
+
+
+@app.exception_handler(ClientDisconnectedError)
+async def client_disconnected_handler(request: Request, exc: ClientDisconnectedError):
+    """Handler pour les clients déconnectés (aucun corps de réponse)."""
+    return Response(status_code=exc.status_code)
+
+
+def _cancel_stopping_criteria(cancel_event: threading.Event):
+    """Critère d'arrêt transformers qui stoppe la génération quand cancel_event est positionné."""
+    from transformers import StoppingCriteria, StoppingCriteriaList
+
+    class CancelledCriteria(StoppingCriteria):
+        def __call__(self, input_ids, scores, **kwargs):
+            return torch.full((input_ids.shape[0],), cancel_event.is_set(), dtype=torch.bool, device=input_ids.device)
+
+    return StoppingCriteriaList([CancelledCriteria()])
+
+
+def call_generate(method, **kwargs):
+    """
+    Appelle une méthode generate_* du modèle, interruptible si le travail est annulé.
+
+    Si le modèle ne transmet pas stopping_criteria à la génération, l'interruption
+    est désactivée pour ce modèle et seule l'annulation des travaux en file s'applique.
+    """
+    cancel_event = getattr(_worker_context, "cancel_event", None)
+    model_key = getattr(_worker_context, "model_key", None)
+    with rng_guard.shared():
+        if STOP_ON_CANCEL and cancel_event is not None and model_key not in _stop_unsupported:
+            try:
+                return method(**kwargs, stopping_criteria=_cancel_stopping_criteria(cancel_event))
+            except TypeError as e:
+                if "stopping_criteria" not in str(e):
+                    raise
+                print(f"Interruption des générations non supportée par {model_key} : {e}")
+                _stop_unsupported.add(model_key)
+        return method(**kwargs)
+
+
+async def run_for_request(request: Request, coro):
+    """
+    Exécute une génération en surveillant la connexion du client et sa deadline.
+
+    Si le client se déconnecte, la génération est annulée : les travaux en file
+    sont abandonnés, les batchs s'arrêtent entre deux lots et la génération en
+    cours est interrompue si le modèle le permet. Il en va de même à l'expiration
+    de la deadline (en-tête X-Request-Deadline ou champ MCP deadline_ms).
+
+    Raises:
+        ClientDisconnectedError: 408 (sans corps) si le client s'est déconnecté
+        DeadlineExceededError: 504 si la deadline est dépassée
+    """
+    deadline = request_deadline.get()
+    task = asyncio.ensure_future(coro)
+    try:
+        while True:
+            timeout = DISCONNECT_POLL_INTERVAL
+            if deadline is not None:
+                timeout = max(0.0, min(timeout, deadline - time.perf_counter()))
+            done, _ = await asyncio.wait({task}, timeout=timeout)
+            if done:
+                return task.result()
+            if deadline_expired(deadline):
+                deadline_stats["expired_waiting"] += 1
+                raise DeadlineExceededError()
+            if await request.is_disconnected():
+                cancellation_stats["client_disconnects"] += 1
+                raise ClientDisconnectedError()
+    finally:
+        if not task.done():
+            task.cancel()
+
+
+# ==============================================================================
+# RNG ET GÉNÉRATIONS SEEDÉES
+# ==============================================================================
+# qwen_tts échantillonne avec torch.multinomial sur le RNG global (talker et
+# sous-talker), sans accepter de torch.Generator par appel. Une génération seedée
+# n'est donc reproductible que si aucune autre ne tire dans ce RNG pendant
+# qu'elle tourne : elle prend le RNG en exclusif, les générations non seedées le
+# partagent entre elles (plusieurs peuvent tourner en même temps).
+
+class RNGGuard:
+    """Verrou lecteurs/rédacteur sur le RNG de torch (priorité aux générations seedées)."""
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._shared = 0
+        self._exclusive = False
+        self._waiting_exclusive = 0
+        self._local = threading.local()
+
+    @property
+    def held_exclusive(self) -> bool:
+        """True si le thread courant exécute une génération seedée."""
+        return getattr(self._local, "exclusive", False)
+
+    @contextlib.contextmanager
+    def shared(self):
+        """Génération non seedée : attend les générations seedées en cours ou en attente."""
+        if self.held_exclusive:
+            yield
+            return
+        with self._cond:
+            self._cond.wait_for(lambda: not self._exclusive and not self._waiting_exclusive)
+            self._shared += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._shared -= 1
+                self._cond.notify_all()
+
+    @contextlib.contextmanager
+    def exclusive(self):
+        """Génération seedée : seule à tirer dans le RNG pendant son exécution."""
+        with self._cond:
+            self._waiting_exclusive += 1
+            self._cond.wait_for(lambda: not self._exclusive and not self._shared)
+            self._waiting_exclusive -= 1
+            self._exclusive = True
+        self._local.exclusive = True
+        try:
+            yield
+        finally:
+            self._local.exclusive = False
+            with self._cond:
+                self._exclusive = False
+                self._cond.notify_all()
+
+
+rng_guard = RNGGuard()
+
+
+def _rng_devices() -> List[int]:
+    """Devices CUDA dont fork_rng doit sauvegarder et restaurer l'état."""
+    if DEVICE.startswith("cuda"):
+        return [torch.device(DEVICE).index or 0]
+    return []
+
+
+def run_seeded(seed: Optional[int], fn, *args, **kwargs):
+    """
+    Exécute fn(*args, **kwargs) avec un RNG initialisé par seed (tel quel si None).
+
+    L'état du RNG est restauré ensuite (fork_rng) : le seed ne rend pas
+    prévisibles les générations non seedées qui suivent.
+    """
+    if seed is None:
+        return fn(*args, **kwargs)
+    with rng_guard.exclusive(), torch.random.fork_rng(devices=_rng_devices()):
+        torch.manual_seed(seed)
+        return fn(*args, **kwargs)
+
+
+# ==============================================================================
+# GENERATION HELPERS (exécutés sur les workers d'inférence)
+# ==============================================================================
+
+def generate_preset(text, language, speaker):
+    """Génère avec une voix native du modèle 0.6B-CustomVoice."""
+    model = load_preset_voice_model()
+    return call_generate(model.generate_custom_voice, text=text, language=language, speaker=speaker)
+
+
+def generate_preset_instruct(text, language, speaker, instruct: str = ""):
+    """Génère avec une voix native et une instruction (1.7B-CustomVoice)."""
+    model = load_voice_clone_model()
+    return call_generate(model.generate_custom_voice, text=text, language=language, speaker=speaker, instruct=instruct)
+
+
+def generate_design(text, language, instruct: str):
+    """Génère avec une voix décrite en texte (1.7B-VoiceDesign)."""
+    model = load_voice_design_model()
+    return call_generate(model.generate_voice_design, text=text, language=language, instruct=instruct)
+
+
+def generate_clone(model_size: str, text, language, voice_clone_prompt=None,
+                   ref_audio: Optional[str] = None, ref_text: Optional[str] = None):
+    """Génère avec une voix clonée (prompt existant ou audio de référence)."""
+    model = load_clone_base_model(model_size)
+    if voice_clone_prompt is not None:
+        return call_generate(model.generate_voice_clone, text=text, language=language, voice_clone_prompt=voice_clone_prompt)
+    return call_generate(model.generate_voice_clone, text=text, language=language, ref_audio=ref_audio, ref_text=ref_text)
+
+
+def create_clone_prompt_items(model_size: str, ref_audio: str, ref_text: str):
+    """Calcule le prompt de clonage d'un audio de référence (modèle Base)."""
+    model = load_clone_base_model(model_size)
+    return model.create_voice_clone_prompt(ref_audio=ref_audio, ref_text=ref_text)
+
+
+# Phrases de référence générées à la création d'une voix design (quelques secondes
+# de parole : assez pour un prompt de clonage stable)
+DESIGN_REFERENCE_TEXTS = {
+    "fr": "Bonjour, je suis ravi de vous rencontrer. Aujourd'hui, nous allons découvrir ensemble une histoire étonnante.",
+    "en": "Hello, I am delighted to meet you. Today, we are going to discover an amazing story together.",
+    "zh": "你好，很高兴认识你。今天，我们将一起探索一个令人惊叹的故事。",
+    "ja": "こんにちは、お会いできてうれしいです。今日は一緒に素晴らしい物語を見つけましょう。",
+    "ko": "안녕하세요, 만나서 반갑습니다. 오늘은 함께 놀라운 이야기를 알아보겠습니다.",
+    "de": "Hallo, ich freue mich, Sie kennenzulernen. Heute entdecken wir gemeinsam eine erstaunliche Geschichte.",
+    "ru": "Здравствуйте, рад с вами познакомиться. Сегодня мы вместе откроем удивительную историю.",
+    "pt": "Olá, é um prazer conhecê-lo. Hoje vamos descobrir juntos uma história incrível.",
+    "es": "Hola, encantado de conocerte. Hoy vamos a descubrir juntos una historia asombrosa.",
+    "it": "Ciao, sono felice di conoscerti. Oggi scopriremo insieme una storia sorprendente.",
+}
+
+
+def is_design_voice(meta: Dict[str, Any], prompt_items: Any) -> bool:
+    """
+    Indique si une voix personnalisée est une voix design régénérée par description.
+
+    Seules les voix design antérieures à la matérialisation en prompt de clonage
+    sont concernées ; les autres passent par le chemin clone.
+    """
+    return (
+        meta.get("source") == "design"
+        and isinstance(prompt_items, dict)
+        and prompt_items.get("type") == "design"
+    )
+
+
+def custom_voice_model_key(meta: Dict[str, Any], prompt_items: Any) -> str:
+    """Retourne la clé du modèle utilisé par une voix personnalisée."""
+    if is_design_voice(meta, prompt_items):
+        return "voice_design"
+    return clone_model_key(meta.get("model", "1.7B"))
+
+
+def generate_custom(meta: Dict[str, Any], prompt_items: Any, text, language):
+    """Génère avec une voix personnalisée (design ou clone)."""
+    if is_design_voice(meta, prompt_items):
+        return generate_design(text, language, prompt_items["voice_description"])
+    return generate_clone(meta.get("model", "1.7B"), text, language, voice_clone_prompt=prompt_items)
+
+
+def get_audio_duration(path: str) -> float:
+    """Retourne la durée (secondes) d'un fichier audio."""
+    import torchaudio
+    waveform, sample_rate = torchaudio.load(path)
+    return waveform.shape[1] / sample_rate
+
+
+def reference_fingerprint(path: str, ref_text: str, model_size: str) -> str:
+    """
+    Empreinte d'un audio de référence : échantillons décodés, transcription et modèle.
+
+    Hasher les échantillons plutôt que le fichier rend l'empreinte indépendante
+    du conteneur et des métadonnées (même enregistrement, même prompt).
+    """
+    import torchaudio
+    waveform, sample_rate = torchaudio.load(path)
+    digest = hashlib.sha256()
+    digest.update(f"{model_size}\0{sample_rate}\0{ref_text.strip()}\0".encode("utf-8"))
+    digest.update(waveform.to(torch.float32).contiguous().numpy().tobytes())
+    return digest.hexdigest()
+
+
+# ==============================================================================
+# MICRO-BATCHING
+# ==============================================================================
+
+# Fenêtre de regroupement (ms) et taille max d'un lot ; fenêtre 0 = désactivé
+MICRO_BATCH_WINDOW_MS = float(os.getenv("VOXQWEN_BATCH_WINDOW_MS", "5"))
+MICRO_BATCH_MAX_SIZE = int(os.getenv("VOXQWEN_MAX_BATCH_SIZE", "8"))
+
+
+def generate_preset_batch(items: List[tuple]):
+    """Génère un lot de voix natives en un appel. items: [(text, language, speaker), ...]"""
+    texts, languages, speakers = (list(column) for column in zip(*items))
+    return generate_preset(texts, languages, speakers)
+
+
+def generate_clone_batch(model_size: str, voice_clone_prompt: Any, items: List[tuple]):
+    """Génère un lot de textes avec le même prompt de clonage. items: [(text, language), ...]"""
+    texts, languages = (list(column) for column in zip(*items))
+    # Un prompt d'un seul élément est répété pour chaque texte du lot
+    if isinstance(voice_clone_prompt, list) and len(voice_clone_prompt) == 1:
+        voice_clone_prompt = voice_clone_prompt * len(texts)
+    return generate_clone(model_size, texts, languages, voice_clone_prompt=voice_clone_prompt)
+
+
+class MicroBatcher:
+    """
+    Regroupe les requêtes compatibles arrivant dans une courte fenêtre.
+
+    Les requêtes de même clé de lot (même modèle, même prompt) reçues pendant
+    `window_ms` sont exécutées en un seul appel batché du modèle, plafonné à
+    `max_batch_size` éléments. Chaque appelant reçoit son propre audio, au même
+    format qu'un appel unitaire : ([wav], sr).
+
+    Toutes les méthodes s'exécutent dans la boucle d'événements (pas de verrou).
+    """
+
+    def __init__(self, window_ms: float = 5, max_batch_size: int = 8):
+        self.window = max(0.0, window_ms) / 1000
+        self.max_batch_size = max(1, max_batch_size)
+        self._pending: Dict[tuple, List[tuple]] = {}
+        self._timers: Dict[tuple, asyncio.TimerHandle] = {}
+        self._stats = {"batches": 0, "items": 0, "largest_batch": 0}
+
+    async def submit(self, batch_key: tuple, model_key: str, batch_fn, item: tuple):
+        """
+        Ajoute un élément au lot en cours et attend son résultat.
+
+        Args:
+            batch_key: Clé de compatibilité (les éléments de même clé sont regroupés)
+            model_key: Clé du modèle pour l'exécuteur d'inférence
+            batch_fn: Fonction bloquante batch_fn(items) -> (wavs, sr)
+            item: Arguments de l'élément (tuple passé tel quel à batch_fn)
+
+        Returns:
+            ([wav], sr) pour cet élément
+        """
+        if self.window == 0 or self.max_batch_size == 1:
+            wavs, sr = await inference_executor.submit(model_key, batch_fn, [item], cost=text_cost(item[0]))
+            return [wavs[0]], sr
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        pending = self._pending.setdefault(batch_key, [])
+        pending.append((item, future, request_deadline.get()))
+
+        if len(pending) >= self.max_batch_size:
+            self._flush(batch_key, model_key, batch_fn)
+        elif len(pending) == 1:
+            self._timers[batch_key] = loop.call_later(
+                self.window, self._flush, batch_key, model_key, batch_fn
+            )
+        return await future
+
+    def _flush(self, batch_key: tuple, model_key: str, batch_fn):
+        """Envoie le lot en attente pour cette clé à l'exécuteur."""
+        timer = self._timers.pop(batch_key, None)
+        if timer is not None:
+            timer.cancel()
+        # Ignorer les appelants déjà partis (requête annulée)
+        pending = [entry for entry in self._pending.pop(batch_key, []) if not entry[1].done()]
+        if pending:
+            asyncio.ensure_future(self._run(model_key, batch_fn, pending))
+
+    async def _run(self, model_key: str, batch_fn, pending: List[tuple]):
+        # Le lot tient tant qu'un de ses appelants attend encore : deadline la plus lointaine
+        deadlines = [deadline for _, _, deadline in pending]
+        request_deadline.set(None if None in deadlines else max(deadlines))
+        self._stats["batches"] += 1
+        self._stats["items"] += len(pending)
+        self._stats["largest_batch"] = max(self._stats["largest_batch"], len(pending))
+        try:
+            wavs, sr = await inference_executor.submit(
+                model_key,
+                batch_fn,
+                [item for item, _, _ in pending],
+                cost=sum(text_cost(item[0]) for item, _, _ in pending),
+            )
+        except Exception as e:
+            for _, future, _ in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future, _), wav in zip(pending, wavs):
+            if not future.done():
+                future.set_result(([wav], sr))
+
+    def stats(self) -> Dict[str, Any]:
+        """Statistiques de regroupement (lots, éléments, taille moyenne)."""
+        batches = self._stats["batches"]
+        return {
+            "window_ms": self.window * 1000,
+            "max_batch_size": self.max_batch_size,
+            **self._stats,
+            "avg_batch_size": round(self._stats["items"] / batches, 2) if batches else 0,
+        }
+
+
+micro_batcher = MicroBatcher(MICRO_BATCH_WINDOW_MS, MICRO_BATCH_MAX_SIZE)
+
+
+# ==============================================================================
+# AUDIO CACHE (audio synthétisé, adressé par contenu)
+# ==============================================================================
+
+# Budgets du cache audio (0 = tier désactivé)
+AUDIO_CACHE_DIR = OUTPUTS_DIR / "audio_cache"
+AUDIO_CACHE_MEMORY_MB = float(os.getenv("VOXQWEN_AUDIO_CACHE_MB", "256"))
+AUDIO_CACHE_DISK_MB = float(os.getenv("VOXQWEN_AUDIO_CACHE_DISK_MB", "2048"))
+
+# Statut du cache pour la requête courante, renvoyé dans l'en-tête X-Audio-Cache
+audio_cache_status: contextvars.ContextVar[Optional[Dict[str, str]]] = contextvars.ContextVar(
+    "audio_cache_status", default=None
+)
+
+
+def normalize_cache_text(text: str) -> str:
+    """Normalise le texte pour la clé de cache (Unicode NFC, espaces fusionnés)."""
+    return unicodedata.normalize("NFC", " ".join(text.split()))
+
+
+def _cache_tag_dir(tag: str) -> str:
+    """Sous-répertoire disque d'un tag d'invalidation ("shared" sans tag)."""
+    return hashlib.sha256(tag.encode("utf-8")).hexdigest()[:16] if tag else "shared"
+
+
+class AudioCache:
+    """
+    Cache LRU à deux niveaux des audios synthétisés.
+
+    La clé est un hash du modèle, de l'identité de la voix ou du prompt, de la
+    langue, de l'instruction, des paramètres de génération et du texte
+    normalisé. Le tier mémoire est borné en octets ; le tier disque (WAV float
+    sous AUDIO_CACHE_DIR) est borné en taille et survit aux redémarrages.
+
+    Chaque entrée porte un tag ("voice:<nom>", "prompt:<id>") : supprimer la
+    voix ou le prompt invalide ses entrées dans les deux tiers. Les entrées
+    produites par la prégénération sont suivies pour mesurer la part du trafic
+    réel qu'elles servent (pregen_hits). Le tier mémoire
+    n'est manipulé que depuis la boucle d'événements ; le tier disque est écrit
+    depuis des threads et protégé par un verrou.
+    """
+
+    def __init__(self, directory: Path, memory_budget: int, disk_budget: int):
+        self.directory = directory
+        self.memory_budget = memory_budget
+        self.disk_budget = disk_budget
+        # Structure mémoire: {key: (wav, sr, tag_dir, nbytes)}
+        self._memory: "collections.OrderedDict[str, tuple]" = collections.OrderedDict()
+        self._memory_bytes = 0
+        # Structure disque: {key: (path, size)}
+        self._disk: "collections.OrderedDict[str, tuple]" = collections.OrderedDict()
+        self._disk_bytes = 0
+        # Incrémenté à chaque invalidation : ignore les écritures d'une génération antérieure
+        self._epochs: Dict[str, int] = collections.defaultdict(int)
+        # Clés mises en cache par la prégénération (et pas régénérées depuis par une requête)
+        self._pregenerated: set = set()
+        self._lock = threading.Lock()
+        self._stats = {
+            "memory_hits": 0, "disk_hits": 0, "misses": 0, "stores": 0,
+            "memory_evictions": 0, "disk_evictions": 0, "invalidated": 0,
+            "pregenerated": 0, "pregen_hits": 0,
+        }
+        if self.disk_budget > 0:
+            self._scan_disk()
+
+    @property
+    def enabled(self) -> bool:
+        return self.memory_budget > 0 or self.disk_budget > 0
+
+    @staticmethod
+    def make_key(kind: str, model_key: str, voice: str, language: str, instruct: str,
+                 text: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """Clé de cache d'une génération (sha256 de son identité complète)."""
+        identity = [kind, model_key, voice, language, instruct, params or {}, normalize_cache_text(text)]
+        payload = json.dumps(identity, ensure_ascii=False, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _scan_disk(self):
+        """Reconstruit l'index du tier disque au démarrage (ordre LRU = mtime)."""
+        entries = []
+        for path in self.directory.glob("*/*.wav"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, path, stat.st_size))
+        for _, path, size in sorted(entries):
+            self._disk[path.stem] = (path, size)
+            self._disk_bytes += size
+        self._evict_disk()
+
+    async def run(self, key: str, tag: str, coro_fn, pregenerated: bool = False):
+        """
+        Retourne l'audio en cache ou exécute coro_fn() et met le résultat en cache.
+
+        Args:
+            key: Clé de cache (voir make_key)
+            tag: Tag d'invalidation ("" si aucun)
+            coro_fn: Fonction sans argument retournant la coroutine de génération
+            pregenerated: Génération de fond (hors compteurs de hits/miss du trafic réel)
+
+        Returns:
+            ([wav], sr), au même format que les générations unitaires
+        """
+        if not self.enabled:
+            return await coro_fn()
+        status = None if pregenerated else audio_cache_status.get()
+        cached = await self.get(key, count=not pregenerated)
+        if cached is not None:
+            if status is not None:
+                status["status"] = "HIT"
+            if not pregenerated and key in self._pregenerated:
+                self._stats["pregen_hits"] += 1
+            return [cached[0]], cached[1]
+
+        if not pregenerated:
+            self._stats["misses"] += 1
+        tag_dir = _cache_tag_dir(tag)
+        epoch = self._epochs[tag_dir]
+        wavs, sr = await coro_fn()
+        if status is not None:
+            status["status"] = "MISS"
+        if self._epochs[tag_dir] == epoch:
+            self.put(key, tag_dir, wavs[0], sr)
+            if pregenerated:
+                self._pregenerated.add(key)
+                self._stats["pregenerated"] += 1
+            else:
+                self._pregenerated.discard(key)
+        return wavs, sr
+
+    def contains(self, key: str) -> bool:
+        """True si la clé est présente dans l'un des deux tiers (sans la remonter)."""
+        if key in self._memory:
+            return True
+        with self._lock:
+            return key in self._disk
+
+    async def get(self, key: str, count: bool = True) -> Optional[tuple]:
+        """Cherche (wav, sr) en mémoire puis sur disque (remonté en mémoire)."""
+        entry = self._memory.get(key)
+        if entry is not None:
+            self._memory.move_to_end(key)
+            if count:
+                self._stats["memory_hits"] += 1
+            return entry[0], entry[1]
+
+        with self._lock:
+            disk_entry = self._disk.get(key)
+        if disk_entry is None:
+            return None
+        try:
+            wav, sr = await run_in_threadpool(self._read_disk, key, disk_entry[0])
+        except Exception:
+            self._drop_disk(key)
+            return None
+        if count:
+            self._stats["disk_hits"] += 1
+        self._store_memory(key, disk_entry[0].parent.name, wav, sr)
+        return wav, sr
+
+    def put(self, key: str, tag_dir: str, wav, sr: int):
+        """Ajoute un audio aux deux tiers (écriture disque en arrière-plan)."""
+        self._stats["stores"] += 1
+        self._store_memory(key, tag_dir, wav, sr)
+        if self.disk_budget > 0:
+            asyncio.get_running_loop().run_in_executor(
+                None, self._write_disk, key, tag_dir, self._epochs[tag_dir], wav, sr
+            )
+
+    def _store_memory(self, key: str, tag_dir: str, wav, sr: int):
+        nbytes = getattr(wav, "nbytes", 0)
+        if nbytes > self.memory_budget:
+            return
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= previous[3]
+        self._memory[key] = (wav, sr, tag_dir, nbytes)
+        self._memory_bytes += nbytes
+        while self._memory_bytes > self.memory_budget:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= evicted[3]
+            self._stats["memory_evictions"] += 1
+
+    def _read_disk(self, key: str, path: Path) -> tuple:
+        wav, sr = sf.read(str(path), dtype="float32")
+        # mtime = dernier accès, pour l'ordre LRU après redémarrage
+        os.utime(path)
+        with self._lock:
+            if key in self._disk:
+                self._disk.move_to_end(key)
+        return wav, sr
+
+    def _write_disk(self, key: str, tag_dir: str, epoch: int, wav, sr: int):
+        path = self.directory / tag_dir / f"{key}.wav"
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            sf.write(str(tmp_path), wav, sr, format="WAV", subtype="FLOAT")
+            os.replace(tmp_path, path)
+        except Exception as e:
+            print(f"Cache audio : écriture impossible ({e})")
+            tmp_path.unlink(missing_ok=True)
+            return
+        with self._lock:
+            if self._epochs[tag_dir] != epoch:
+                path.unlink(missing_ok=True)
+                return
+            previous = self._disk.pop(key, None)
+            if previous is not None:
+                self._disk_bytes -= previous[1]
+            size = path.stat().st_size
+            self._disk[key] = (path, size)
+            self._disk_bytes += size
+            self._evict_disk()
+
+    def _evict_disk(self):
+        """Supprime les fichiers les moins récemment utilisés au-delà du budget (sous verrou)."""
+        while self._disk_bytes > self.disk_budget and self._disk:
+            _, (path, size) = self._disk.popitem(last=False)
+            self._disk_bytes -= size
+            self._stats["disk_evictions"] += 1
+            path.unlink(missing_ok=True)
+
+    def _drop_disk(self, key: str):
+        with self._lock:
+            entry = self._disk.pop(key, None)
+            if entry is not None:
+                self._disk_bytes -= entry[1]
+                entry[0].unlink(missing_ok=True)
+
+    def invalidate(self, tag: str) -> int:
+        """
+        Supprime toutes les entrées d'un tag (voix ou prompt supprimé).
+
+        Returns:
+            Nombre d'entrées supprimées
+        """
+        tag_dir = _cache_tag_dir(tag)
+        with self._lock:
+            self._epochs[tag_dir] += 1
+        removed = 0
+        for key in [k for k, entry in self._memory.items() if entry[2] == tag_dir]:
+            self._memory_bytes -= self._memory.pop(key)[3]
+            self._pregenerated.discard(key)
+            removed += 1
+        with self._lock:
+            for key in [k for k, (path, _) in self._disk.items() if path.parent.name == tag_dir]:
+                self._disk_bytes -= self._disk.pop(key)[1]
+                self._pregenerated.discard(key)
+                removed += 1
+        shutil.rmtree(self.directory / tag_dir, ignore_errors=True)
+        self._stats["invalidated"] += removed
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        """Occupation des deux tiers et compteurs de hits/miss."""
+        lookups = self._stats["memory_hits"] + self._stats["disk_hits"] + self._stats["misses"]
+        with self._lock:
+            disk_entries, disk_bytes = len(self._disk), self._disk_bytes
+        return {
+            "memory_entries": len(self._memory),
+            "memory_mb": round(self._memory_bytes / 1024 / 1024, 1),
+            "memory_budget_mb": round(self.memory_budget / 1024 / 1024, 1),
+            "disk_entries": disk_entries,
+            "disk_mb": round(disk_bytes / 1024 / 1024, 1),
+            "disk_budget_mb": round(self.disk_budget / 1024 / 1024, 1),
+            **self._stats,
+            "hit_rate": round((lookups - self._stats["misses"]) / lookups, 3) if lookups else 0,
+            # Part des requêtes réelles servies par une entrée prégénérée
+            "pregen_hit_rate": round(self._stats["pregen_hits"] / lookups, 3) if lookups else 0,
+            "pregenerated_entries": len(self._pregenerated),
+        }
+
+
+class AudioCacheHeaderMiddleware:
+    """Middleware ASGI qui ajoute X-Audio-Cache: HIT|MISS aux réponses de synthèse."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        status: Dict[str, str] = {}
+        audio_cache_status.set(status)
+
+        async def send_with_cache_header(message):
+            if message["type"] == "http.response.start" and "status" in status:
+                message = {
+                    **message,
+                    "headers": [*message.get("headers", []), (b"x-audio-cache", status["status"].encode())],
+                }
+            await send(message)
+
+        await self.app(scope, receive, send_with_cache_header)
+
+
+app.add_middleware(AudioCacheHeaderMiddleware)
+
+audio_cache = AudioCache(
+    AUDIO_CACHE_DIR,
+    int(AUDIO_CACHE_MEMORY_MB * 1024 * 1024),
+    int(AUDIO_CACHE_DISK_MB * 1024 * 1024),
+)
+
+
+# ==============================================================================
+# SYNTHESIS (dédoublonnage des requêtes identiques en cours)
+# ==============================================================================
+
+class RequestCoalescer:
+    """
+    Single-flight des générations identiques en cours.
+
+    Une requête dont la clé (celle du cache audio : type, modèle, voix ou prompt,
+    langue, instruct, texte normalisé) correspond à une génération déjà en cours attend ce résultat au lieu
+    d'en lancer une seconde. La génération est annulée si plus personne ne
+    l'attend. Elle porte la deadline du premier appelant : si celle-ci expire,
+    un appelant dont la deadline court encore relance sa propre génération.
+    Toutes les méthodes s'exécutent dans la boucle d'événements.
+    """
+
+    def __init__(self):
+        # Structure: {key: [task, nombre d'appelants en attente]}
+        self._inflight: Dict[tuple, list] = {}
+        self._stats = {"generations": 0, "coalesced": 0}
+
+    async def run(self, key: tuple, coro_fn):
+        """
+        Exécute coro_fn() une seule fois pour toutes les requêtes de même clé.
+
+        Args:
+            key: Clé d'identité de la génération
+            coro_fn: Fonction sans argument retournant la coroutine de génération
+
+        Returns:
+            Le résultat partagé de la génération
+        """
+        entry = self._inflight.get(key)
+        leader = entry is None
+        if leader:
+            task = asyncio.ensure_future(coro_fn())
+            entry = [task, 0]
+            self._inflight[key] = entry
+            task.add_done_callback(lambda _: self._forget(key, entry))
+            self._stats["generations"] += 1
+        else:
+            self._stats["coalesced"] += 1
+
+        task = entry[0]
+        entry[1] += 1
+        try:
+            return await asyncio.shield(task)
+        except DeadlineExceededError:
+            if leader or deadline_expired(request_deadline.get()):
+                raise
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0 and not task.done():
+                task.cancel()
+        return await self.run(key, coro_fn)
+
+    def _forget(self, key: tuple, entry: list):
+        if self._inflight.get(key) is entry:
+            del self._inflight[key]
+
+    def stats(self) -> Dict[str, int]:
+        """Compteurs : générations lancées et générations économisées."""
+        return {"in_flight": len(self._inflight), **self._stats}
+
+
+request_coalescer = RequestCoalescer()
+
+
+async def cached_generation(key: str, tag: str, generate):
+    """
+    Génération unitaire servie par le cache audio et dédoublonnée par request_coalescer.
+
+    La recherche en cache, la génération et la mise en cache ont lieu une seule
+    fois par vol : une requête qui rejoint une génération en cours ne compte
+    pas de miss et ne réécrit pas l'entrée. Elle reçoit le statut de cache
+    (X-Audio-Cache) du vol.
+    """
+    async def flight():
+        flight_status: Dict[str, str] = {}
+        audio_cache_status.set(flight_status)
+        result = await audio_cache.run(key, tag, generate)
+        return result, flight_status.get("status")
+
+    result, cache_status = await request_coalescer.run(key, flight)
+    status = audio_cache_status.get()
+    if status is not None and cache_status is not None:
+        status["status"] = cache_status
+    return result
+
+
+def synthesis_key(kind: str, model_key: str, voice: str, language: str, instruct: str,
+                  text: str, seed: Optional[int] = None) -> str:
+    """Clé d'une génération unitaire : cache audio, dédoublonnage et ETag."""
+    return AudioCache.make_key(
+        kind, model_key, voice, language, instruct, text, {"seed": seed} if seed is not None else None
+    )
+
+
+def clone_cache_identity(prompt_key: str) -> tuple:
+    """
+    Identité et tag de cache d'un prompt de clonage.
+
+    Args:
+        prompt_key: prompt_id, ou identité de voix custom (voir custom_voice_identity)
+
+    Returns:
+        (identité pour la clé, tag d'invalidation)
+    """
+    if prompt_key.startswith("voice:"):
+        return prompt_key, prompt_key.split("@", 1)[0]
+    return f"prompt:{prompt_key}", f"prompt:{prompt_key}"
+
+
+def custom_voice_identity(meta: Dict[str, Any]) -> str:
+    """Identité d'une voix custom : nom et date de création (un nom supprimé peut être réutilisé)."""
+    return f"voice:{meta.get('name')}@{meta.get('created_at', '')}"
+
+
+def custom_synthesis_key(meta: Dict[str, Any], prompt_items: Any, text: str, language: str,
+                         seed: Optional[int] = None) -> str:
+    """Clé de génération d'une voix custom (même logique que synthesize_custom)."""
+    if is_design_voice(meta, prompt_items):
+        return synthesis_key("design", "voice_design", "", language, prompt_items["voice_description"], text, seed)
+    identity, _ = clone_cache_identity(custom_voice_identity(meta))
+    return synthesis_key("clone", clone_model_key(meta.get("model", "1.7B")), identity, language, "", text, seed)
+
+
+async def synthesize_preset(text: str, language: str, speaker: str, seed: Optional[int] = None):
+    """Génère avec une voix native via le micro-batcher du modèle 0.6B-CustomVoice."""
+    key = synthesis_key("preset", "preset_voice", speaker, language, "", text, seed)
+    if seed is None:
+        pregenerator.record(speaker, language, text)
+
+        def generate():
+            return micro_batcher.submit(
+                ("preset_voice",), "preset_voice", generate_preset_batch, (text, language, speaker)
+            )
+    else:
+        # Seed : génération isolée, la composition d'un lot changerait l'échantillonnage
+        def generate():
+            return inference_executor.submit(
+                "preset_voice", run_seeded, seed, generate_preset, text, language, speaker,
+                cost=text_cost(text),
+            )
+    return await cached_generation(key, "", generate)
+
+
+async def synthesize_instruct(text: str, language: str, speaker: str, instruct: str,
+                              seed: Optional[int] = None):
+    """Génère avec une voix native et une instruction (1.7B-CustomVoice)."""
+    key = synthesis_key("instruct", "voice_clone", speaker, language, instruct, text, seed)
+    return await cached_generation(key, "", lambda: inference_executor.submit(
+        "voice_clone", run_seeded, seed, generate_preset_instruct, text, language, speaker, instruct,
+        cost=text_cost(text),
+    ))
+
+
+async def synthesize_design(text: str, language: str, instruct: str, seed: Optional[int] = None):
+    """Génère avec une voix décrite en texte (1.7B-VoiceDesign)."""
+    key = synthesis_key("design", "voice_design", "", language, instruct, text, seed)
+    return await cached_generation(key, "", lambda: inference_executor.submit(
+        "voice_design", run_seeded, seed, generate_design, text, language, instruct,
+        cost=text_cost(text),
+    ))
+
+
+async def synthesize_clone(model_size: str, voice_clone_prompt: Any, text: str, language: str,
+                           prompt_key: Optional[str] = None, seed: Optional[int] = None):
+    """
+    Génère avec un prompt de clonage via le micro-batcher du modèle Base.
+
+    Args:
+        prompt_key: Identité du prompt (prompt_id ou custom_voice_identity) pour le
+            cache et le dédoublonnage ; sans elle, la génération n'est pas mise en cache
+        seed: Graine de génération ; le travail est alors exécuté hors micro-batch
+    """
+    model_key = clone_model_key(model_size)
+
+    if seed is None:
+        def generate():
+            return micro_batcher.submit(
+                (model_key, id(voice_clone_prompt)),
+                model_key,
+                functools.partial(generate_clone_batch, model_size, voice_clone_prompt),
+                (text, language),
+            )
+    else:
+        def generate():
+            return inference_executor.submit(
+                model_key, run_seeded, seed, generate_clone, model_size, text, language,
+                voice_clone_prompt=voice_clone_prompt, cost=text_cost(text),
+            )
+
+    if prompt_key is None:
+        return await request_coalescer.run(
+            ("clone", model_key, id(voice_clone_prompt), language, "", text, seed), generate
+        )
+    identity, tag = clone_cache_identity(prompt_key)
+    key = synthesis_key("clone", model_key, identity, language, "", text, seed)
+    return await cached_generation(key, tag, generate)
+
+
+async def synthesize_custom(meta: Dict[str, Any], prompt_items: Any, text: str, language: str,
+                            seed: Optional[int] = None):
+    """Génère avec une voix personnalisée : design par description, clone via le prompt."""
+    if seed is None:
+        pregenerator.record(meta.get("name"), language, text)
+    if is_design_voice(meta, prompt_items):
+        return await synthesize_design(text, language, prompt_items["voice_description"], seed)
+    return await synthesize_clone(
+        meta.get("model", "1.7B"), prompt_items, text, language,
+        prompt_key=custom_voice_identity(meta), seed=seed,
+    )
+
+
+# ==============================================================================
+# PREGENERATION (hot set synthétisé en période creuse)
+# ==============================================================================
+
+# Désactivée par défaut : elle occupe le device et la mémoire sur les modèles résidents
+PREGEN_ENABLED = os.getenv("VOXQWEN_PREGEN", "0") == "1"
+PREGEN_FILE = Path(os.getenv("VOXQWEN_PREGEN_FILE", str(Path(__file__).parent / "pregen.json")))
+PREGEN_LEARN_TOP = int(os.getenv("VOXQWEN_PREGEN_LEARN_TOP", "300"))
+PREGEN_IDLE_SECONDS = float(os.getenv("VOXQWEN_PREGEN_IDLE_SECONDS", "5"))
+PREGEN_RESCAN_SECONDS = 60  # Pause après une passe complète du hot set
+PREGEN_MIN_COUNT = 2  # Demandes minimales d'une phrase pour entrer dans le hot set appris
+PREGEN_TRACKED_MAX = 20000  # Phrases distinctes comptées (les moins demandées sont oubliées)
+
+
+async def pregenerate(voice: str, language: str, text: str) -> str:
+    """
+    Met en cache une synthèse sans seed, sous la clé exacte d'une requête réelle.
+
+    Le travail passe en priorité "idle" hors micro-batch : il est interrompu
+    (IdlePreemptedError) dès qu'un autre travail arrive sur le modèle.
+
+    Returns:
+        "generated", "cached" (déjà en cache) ou "unloaded" (modèle non chargé, ignoré)
+    """
+    if voice in PRESET_VOICES:
+        key, tag = synthesis_key("preset", "preset_voice", voice, language, "", text), ""
+        model_key, fn, args, kwargs = "preset_voice", generate_preset, (text, language, voice), {}
+    elif voice in custom_voices:
+        meta = custom_voices[voice]["meta"]
+        prompt_items = await run_in_threadpool(get_custom_voice_prompt, voice)
+        if prompt_items is None:
+            raise ValueError(f"Embeddings introuvables pour la voix '{voice}'")
+        key = custom_synthesis_key(meta, prompt_items, text, language)
+        if is_design_voice(meta, prompt_items):
+            tag = ""
+            model_key, fn = "voice_design", generate_design
+            args, kwargs = (text, language, prompt_items["voice_description"]), {}
+        else:
+            _, tag = clone_cache_identity(custom_voice_identity(meta))
+            model_size = meta.get("model", "1.7B")
+            model_key, fn = clone_model_key(model_size), generate_clone
+            args, kwargs = (model_size, text, language), {"voice_clone_prompt": prompt_items}
+    else:
+        raise ValueError(f"Voix inconnue : '{voice}'")
+
+    if audio_cache.contains(key):
+        return "cached"
+    # Ne jamais charger un modèle pour de la prégénération
+    if not model_manager.is_loaded(model_key):
+        return "unloaded"
+    await audio_cache.run(
+        key, tag,
+        lambda: inference_executor.submit(model_key, fn, *args, priority="idle", **kwargs),
+        pregenerated=True,
+    )
+    return "generated"
+
+
+class Pregenerator:
+    """
+    Prégénère en période creuse le hot set (voix, langue, texte) dans le cache audio.
+
+    Le hot set réunit la liste configurée (PREGEN_FILE : JSON
+    [{"voice", "language", "text"}], relu à chaque modification) et les phrases
+    les plus demandées (synthèses unitaires sans seed, comptées par voix). Une
+    passe ne démarre que si les files d'inférence sont vides depuis
+    PREGEN_IDLE_SECONDS ; elle s'arrête dès que du trafic réel arrive et reprend
+    à la période creuse suivante.
+    """
+
+    def __init__(self, path: Path, learn_top: int, idle_seconds: float):
+        self.path = path
+        self.learn_top = learn_top
+        self.idle_seconds = idle_seconds
+        self._configured: List[tuple] = []
+        self._mtime: Optional[float] = None
+        self._counts: collections.Counter = collections.Counter()
+        # Éléments en erreur (voix inconnue...) : ignorés jusqu'au prochain rechargement
+        self._failed: set = set()
+        self._task: Optional[asyncio.Task] = None
+        self._stats = {
+            "passes": 0, "completed_passes": 0, "generated": 0, "already_cached": 0,
+            "skipped_unloaded": 0, "preempted": 0, "failed": 0,
+        }
+
+    def start(self) -> asyncio.Task:
+        """Démarre la boucle de prégénération (une seule fois) et retourne sa tâche."""
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._run())
+        return self._task
+
+    def record(self, voice: str, language: str, text: str):
+        """Compte une synthèse réelle pour le hot set appris (rien si VOXQWEN_PREGEN est désactivé)."""
+        if not PREGEN_ENABLED or self.learn_top <= 0:
+            return
+        self._counts[(voice, language, normalize_cache_text(text))] += 1
+        if len(self._counts) > PREGEN_TRACKED_MAX:
+            self._counts = collections.Counter(dict(self._counts.most_common(PREGEN_TRACKED_MAX // 2)))
+
+    def _load_configured(self):
+        """Relit la liste configurée si le fichier a changé."""
+        try:
+            mtime = self.path.stat().st_mtime
+        except OSError:
+            self._configured, self._mtime = [], None
+            return
+        if mtime == self._mtime:
+            return
+        self._mtime = mtime
+        self._failed.clear()
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Prégénération : {self.path} illisible ({e})")
+            self._configured = []
+            return
+        items = []
+        for entry in entries if isinstance(entries, list) else []:
+            if not isinstance(entry, dict) or not entry.get("voice") or not entry.get("text"):
+                continue
+            text = normalize_cache_text(entry["text"])
+            items.append((entry["voice"], resolve_language(entry.get("language", "fr"), text), text))
+        self._configured = items
+
+    def items(self) -> List[tuple]:
+        """Hot set courant : liste configurée puis phrases apprises, sans doublon."""
+        learned = [
+            item for item, count in self._counts.most_common(self.learn_top)
+            if count >= PREGEN_MIN_COUNT
+        ]
+        return [item for item in dict.fromkeys(self._configured + learned) if item not in self._failed]
+
+    async def _run(self):
+        # Travail de fond : aucune deadline de requête
+        request_deadline.set(None)
+        while True:
+            await self._wait_idle()
+            self._load_configured()
+            self._stats["passes"] += 1
+            completed = await self._pass()
+            if completed:
+                self._stats["completed_passes"] += 1
+            await asyncio.sleep(PREGEN_RESCAN_SECONDS if completed else 1)
+
+    async def _wait_idle(self):
+        while True:
+            idle = inference_executor.idle_seconds()
+            if idle >= self.idle_seconds:
+                return
+            await asyncio.sleep(max(0.5, self.idle_seconds - idle))
+
+    async def _pass(self) -> bool:
+        """Parcourt le hot set ; False si la passe a cédé la place à du trafic."""
+        outcomes = {"generated": "generated", "cached": "already_cached", "unloaded": "skipped_unloaded"}
+        for item in self.items():
+            if inference_executor.idle_seconds() < self.idle_seconds:
+                return False
+            try:
+                outcome = await pregenerate(*item)
+            except IdlePreemptedError:
+                self._stats["preempted"] += 1
+                return False
+            except Exception as e:
+                print(f"Prégénération impossible pour {item[0]} : {e}")
+                self._stats["failed"] += 1
+                self._failed.add(item)
+                continue
+            self._stats[outcomes[outcome]] += 1
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        """Taille du hot set et compteurs (la part de trafic servie est dans audio_cache)."""
+        items = self.items()
+        return {
+            "enabled": self._task is not None,
+            "hot_set": len(items),
+            "configured": len(self._configured),
+            "learned": len(set(items) - set(self._configured)),
+            "tracked_phrases": len(self._counts),
+            **self._stats,
+        }
+
+
+pregenerator = Pregenerator(PREGEN_FILE, PREGEN_LEARN_TOP, PREGEN_IDLE_SECONDS)
+
+
+async def _model_maintenance_loop():
+    """Décharge périodiquement les modèles inactifs (VOXQWEN_MODEL_IDLE_TTL_MINUTES)."""
+    while True:
+        await asyncio.sleep(MODEL_MAINTENANCE_INTERVAL)
+        try:
+            await run_in_threadpool(model_manager.maintain)
+        except Exception as e:
+            print(f"Maintenance des modeles en erreur : {e}")
+
+
+# Durée de cache HTTP des réponses déterministes (seed fourni)
+HTTP_CACHE_MAX_AGE = int(os.getenv("VOXQWEN_HTTP_CACHE_MAX_AGE", "86400"))
+
+
+def synthesis_etag(key: str, seed: Optional[int]) -> Optional[str]:
+    """ETag fort d'une génération seedée (identité complète + version de l'API), None sans seed."""
+    if seed is None:
+        return None
+    return f'"{API_VERSION}-{key[:40]}"'
+
+
+def etag_headers(etag: Optional[str]) -> Dict[str, str]:
+    """En-têtes de cache HTTP d'une réponse audio (vides sans seed)."""
+    if etag is None:
+        return {}
+    return {"ETag": etag, "Cache-Control": f"public, max-age={HTTP_CACHE_MAX_AGE}"}
+
+
+def etag_matches(request: Request, etag: Optional[str]) -> bool:
+    """True si If-None-Match désigne cet ETag : la requête peut recevoir un 304."""
+    header = request.headers.get("if-none-match")
+    if etag is None or not header:
+        return False
+    if header.strip() == "*":
+        return True
+    candidates = [candidate.strip() for candidate in header.split(",")]
+    return any(candidate.removeprefix("W/") == etag for candidate in candidates)
+
+
+def not_modified(etag: str) -> Response:
+    """Réponse 304 sans corps (le client réutilise sa copie)."""
+    return Response(status_code=304, headers=etag_headers(etag))
+
+
+# ==============================================================================
+# BATCH GENERATION (routes /batch/*)
+# ==============================================================================
+
+# Nombre max de textes par appel batché du modèle dans les routes /batch/*
+BATCH_CHUNK_SIZE = int(os.getenv("VOXQWEN_BATCH_CHUNK_SIZE", "8"))
+
+
+def generate_design_batch(instruct: str, items: List[tuple]):
+    """Génère un lot de textes avec la même description de voix. items: [(text, language), ...]"""
+    texts, languages = (list(column) for column in zip(*items))
+    return generate_design(texts, languages, [instruct] * len(texts))
+
+
+def generate_custom_batch(meta: Dict[str, Any], prompt_items: Any, items: List[tuple]):
+    """Génère un lot de textes avec une voix personnalisée. items: [(text, language), ...]"""
+    if is_design_voice(meta, prompt_items):
+        return generate_design_batch(prompt_items["voice_description"], items)
+    return generate_clone_batch(meta.get("model", "1.7B"), prompt_items, items)
+
+
+async def iter_batch_items(model_key: str, batch_fn, items: List[tuple]):
+    """
+    Génère les éléments d'un batch par lots homogènes, au fil de l'eau.
+
+    - Les éléments identiques ne sont générés qu'une seule fois
+    - Les éléments sont groupés par langue puis triés par longueur de texte
+      (approximation du nombre de tokens), et découpés en lots de
+      BATCH_CHUNK_SIZE pour limiter le padding
+
+    Args:
+        model_key: Clé du modèle pour l'exécuteur d'inférence
+        batch_fn: Fonction bloquante batch_fn(items) -> (wavs, sr)
+        items: [(text, language, ...), ...] dans l'ordre de la requête
+
+    Yields:
+        (indices, wav, sr) : positions dans items de chaque élément généré
+    """
+    positions: Dict[tuple, List[int]] = {}
+    for i, item in enumerate(items):
+        positions.setdefault(item, []).append(i)
+
+    buckets: Dict[str, List[tuple]] = {}
+    for item in positions:
+        buckets.setdefault(item[1], []).append(item)
+
+    chunk_size = max(1, BATCH_CHUNK_SIZE)
+    for bucket in buckets.values():
+        bucket.sort(key=lambda item: len(item[0]))
+        for start in range(0, len(bucket), chunk_size):
+            chunk = bucket[start:start + chunk_size]
+            # Classe "bulk" : les requêtes interactives passent devant entre deux lots
+            wavs, sr = await inference_executor.submit(
+                model_key, batch_fn, chunk, priority="bulk", cost=text_cost(item[0] for item in chunk)
+            )
+            for item, wav in zip(chunk, wavs):
+                yield positions[item], wav, sr
+
+
+async def run_batch_items(model_key: str, batch_fn, items: List[tuple]) -> List[tuple]:
+    """
+    Génère tous les éléments d'un batch (voir iter_batch_items).
+
+    Returns:
+        [(wav, sr), ...] aligné sur items
+    """
+    # Admission du batch entier avant de consommer du temps modèle
+    inference_executor.check_admission(model_key, text_cost(item[0] for item in set(items)))
+
+    results: List[Optional[tuple]] = [None] * len(items)
+    async for indices, wav, sr in iter_batch_items(model_key, batch_fn, items):
+        for i in indices:
+            results[i] = (wav, sr)
+    return results
+
+
+def batch_languages(texts: List[str], language: str) -> List[str]:
+    """Résout la langue de chaque texte d'un batch (détection par texte si "auto")."""
+    if language == "auto":
+        return [LANGUAGE_MAP.get(code, "French") for code in detect_languages(texts)]
+    return [resolve_language(language, texts[0] if texts else "")] * len(texts)
+
+
+def build_wav_zip(results: List[tuple]) -> io.BytesIO:
+    """Construit un ZIP en mémoire (001.wav, 002.wav, ...) à partir de [(wav, sr), ...]."""
+    zip_buffer = io.BytesIO()
+    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zf:
+        for i, (wav, sr) in enumerate(results):
+            audio_buffer = io.BytesIO()
+            sf.write(audio_buffer, wav, sr, format="WAV")
+            zf.writestr(f"{i+1:03d}.wav", audio_buffer.getvalue())
+    zip_buffer.seek(0)
+    return zip_buffer
+
+
+# ==============================================================================
+# PROMPT STORAGE HELPERS
+# ==============================================================================
+
+# Budgets du store de prompts : mémoire (LRU + TTL d'inactivité) puis disque
+PROMPTS_DIR = OUTPUTS_DIR / "prompts"
+PROMPT_MEMORY_MB = float(os.getenv("VOXQWEN_PROMPT_MEMORY_MB", "512"))
+PROMPT_DISK_MB = float(os.getenv("VOXQWEN_PROMPT_DISK_MB", "2048"))
+PROMPT_IDLE_TTL_MINUTES = float(os.getenv("VOXQWEN_PROMPT_TTL_MINUTES", "60"))
+PROMPT_DISK_TTL_DAYS = float(os.getenv("VOXQWEN_PROMPT_DISK_TTL_DAYS", "7"))
+PROMPT_MAINTENANCE_INTERVAL = 60  # secondes
 
 
-def load_voice_clone_model():
-    """Charge le modele Voice Clone."""
-    global voice_clone_model
-    if voice_clone_model is None:
-        print("=" * 60)
-        print("Chargement du modele Voice Clone...")
-        print("Cela peut prendre quelques minutes au premier lancement.")
-        print("=" * 60)
-
-        from qwen_tts import Qwen3TTSModel
-
-        # Chemin local du modele (CustomVoice pour le clonage)
-        model_path = MODELS_DIR / "1.7B-CustomVoice"
-
-        voice_clone_model = Qwen3TTSModel.from_pretrained(
-            str(model_path),
-            device_map=DEVICE,
-            dtype=torch.float16,
-        )
-        print(f"Modele Voice Clone charge sur {DEVICE}")
-    return voice_clone_model
+def _prompt_nbytes(obj: Any) -> int:
+    """Taille mémoire des tenseurs d'un prompt (parcours récursif)."""
+    if isinstance(obj, torch.Tensor):
+        return obj.numel() * obj.element_size()
+    if hasattr(obj, "nbytes"):
+        return int(obj.nbytes)
+    if isinstance(obj, (list, tuple)):
+        return sum(_prompt_nbytes(item) for item in obj)
+    if isinstance(obj, dict):
+        return sum(_prompt_nbytes(item) for item in obj.values())
+    if hasattr(obj, "__dict__"):
+        return sum(_prompt_nbytes(item) for item in vars(obj).values())
+    return 0
 
 
-def load_preset_voice_model():
-    """Charge le modele Preset Voice (0.6B-CustomVoice)."""
-    global preset_voice_model
-    if preset_voice_model is None:
-        print("=" * 60)
-        print("Chargement du modele Preset Voice...")
-        print("Cela peut prendre quelques minutes au premier lancement.")
-        print("=" * 60)
+# Champs de qwen_tts VoiceClonePromptItem
+PROMPT_ITEM_FIELDS = ("ref_code", "ref_spk_embedding", "x_vector_only_mode", "icl_mode", "ref_text")
 
-        from qwen_tts import Qwen3TTSModel
 
-        model_path = MODELS_DIR / "0.6B-CustomVoice"
+def prompt_state(prompt_items: Any) -> Any:
+    """
+    Forme sérialisable d'un prompt : champs des VoiceClonePromptItem (tenseurs, booléens, texte).
 
-        preset_voice_model = Qwen3TTSModel.from_pretrained(
-            str(model_path),
-            device_map=DEVICE,
-            dtype=torch.float32,  # float32 pour MPS (float16 cause des NaN avec ce modele)
-        )
-        print(f"Modele Preset Voice charge sur {DEVICE}")
-    return preset_voice_model
+    Le dictionnaire des voix design antérieures (voir is_design_voice) est déjà
+    sérialisable : il est conservé tel quel.
+    """
+    if isinstance(prompt_items, dict):
+        return prompt_items
+    return [{field: getattr(item, field) for field in PROMPT_ITEM_FIELDS} for item in prompt_items]
 
 
-def load_clone_base_model(model_size: str = "1.7B"):
+def load_prompt_file(path: Path) -> Any:
     """
-    Charge le modele Base pour le clonage vocal.
+    Charge un prompt écrit par torch.save, sans exécuter de code (weights_only=True).
 
-    Les modeles Base supportent create_voice_clone_prompt() contrairement aux CustomVoice.
+    Les fichiers écrits par prompt_state contiennent des dictionnaires ; les
+    prompt.pt plus anciens contiennent directement des VoiceClonePromptItem,
+    seule classe autorisée au chargement. Le dictionnaire d'une voix design
+    antérieure ({"type": "design", ...}) est retourné tel quel.
+    """
+    from qwen_tts.inference.qwen3_tts_model import VoiceClonePromptItem
+
+    with torch.serialization.safe_globals([VoiceClonePromptItem]):
+        data = torch.load(path, map_location=DEVICE, weights_only=True)
+    if isinstance(data, dict):
+        return data
+    return [VoiceClonePromptItem(**item) if isinstance(item, dict) else item for item in data]
+
+
+def _compact_prompt(obj: Any) -> Any:
+    """Copie CPU compacte d'un prompt (tenseurs détachés, sans stockage partagé)."""
+    if isinstance(obj, torch.Tensor):
+        return obj.detach().to("cpu").clone()
+    if isinstance(obj, list):
+        return [_compact_prompt(item) for item in obj]
+    if isinstance(obj, tuple):
+        return tuple(_compact_prompt(item) for item in obj)
+    if isinstance(obj, dict):
+        return {key: _compact_prompt(item) for key, item in obj.items()}
+    if hasattr(obj, "__dict__"):
+        clone = copy.copy(obj)
+        clone.__dict__.update({key: _compact_prompt(item) for key, item in vars(obj).items()})
+        return clone
+    return obj
+
+
+class PromptStore:
+    """
+    Store borné des prompts de clonage vocal.
 
-    Args:
-        model_size: "1.7B" (qualite) ou "0.6B" (rapide)
+    Les prompts résident en mémoire dans la limite de `memory_budget` octets.
+    Au-delà, ou après `idle_ttl` secondes sans utilisation, les moins récemment
+    utilisés sont déchargés sur disque (tenseurs CPU compacts, `<id>.pt` +
+    métadonnées `<id>.json`) et rechargés à la demande. Le disque est lui-même
+    borné (`disk_budget`, LRU) et purgé après `disk_ttl` secondes d'inactivité :
+    ces prompts sont alors définitivement supprimés.
 
-    Returns:
-        Le modele charge
+    Les prompts déchargés survivent au redémarrage. Les écritures disque ont
+    lieu hors de la boucle d'événements (voir maintain_prompt_store).
     """
-    global clone_model_1_7b, clone_model_0_6b
 
-    if model_size == "1.7B":
-        if clone_model_1_7b is None:
-            print("=" * 60)
-            print("Chargement du modele 1.7B-Base pour clonage...")
-            print("Cela peut prendre quelques minutes au premier lancement.")
-            print("=" * 60)
+    def __init__(self, directory: Path, memory_budget: int, disk_budget: int,
+                 idle_ttl: float, disk_ttl: float):
+        self.directory = directory
+        self.memory_budget = memory_budget
+        self.disk_budget = disk_budget
+        self.idle_ttl = idle_ttl
+        self.disk_ttl = disk_ttl
+        # Structure: {prompt_id: {"model", "name", "created_at", "fingerprint", "last_used",
+        #                         "nbytes", "disk_bytes", "prompt_items" (None si déchargé)}}
+        # Ordre LRU : le moins récemment utilisé en tête
+        self._entries: "collections.OrderedDict[str, Dict[str, Any]]" = collections.OrderedDict()
+        self._fingerprints: Dict[str, str] = {}
+        self._memory_bytes = 0
+        self._disk_bytes = 0
+        self._maintaining = False
+        self._lock = threading.RLock()
+        self._stats = {
+            "memory_hits": 0, "disk_hits": 0, "misses": 0,
+            "spilled": 0, "expired": 0, "disk_evictions": 0,
+        }
+        self._scan_disk()
+
+    def _paths(self, prompt_id: str) -> tuple:
+        return self.directory / f"{prompt_id}.pt", self.directory / f"{prompt_id}.json"
+
+    def _scan_disk(self):
+        """Réindexe les prompts déchargés lors d'une exécution précédente."""
+        if not self.directory.exists():
+            return
+        entries = []
+        for meta_file in self.directory.glob("*.json"):
+            prompt_file = meta_file.with_suffix(".pt")
+            try:
+                with open(meta_file, "r", encoding="utf-8") as f:
+                    meta = json.load(f)
+                last_used = prompt_file.stat().st_mtime
+            except Exception as e:
+                print(f"Prompt ignoré {meta_file.name}: {e}")
+                continue
+            entries.append((last_used, meta_file.stem, meta))
+        for last_used, prompt_id, meta in sorted(entries):
+            self._entries[prompt_id] = {
+                "model": meta["model"],
+                "name": meta.get("name"),
+                "created_at": datetime.fromisoformat(meta["created_at"]),
+                "fingerprint": meta.get("fingerprint"),
+                "last_used": last_used,
+                "nbytes": meta.get("nbytes", 0),
+                "disk_bytes": meta.get("disk_bytes", 0),
+                "prompt_items": None,
+            }
+            self._disk_bytes += meta.get("disk_bytes", 0)
+            if meta.get("fingerprint"):
+                self._fingerprints[meta["fingerprint"]] = prompt_id
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, prompt_items: Any, model: str, name: Optional[str] = None,
+            fingerprint: Optional[str] = None) -> str:
+        """Ajoute un prompt (résident) et retourne son ID."""
+        prompt_id = str(uuid.uuid4())
+        nbytes = _prompt_nbytes(prompt_items)
+        with self._lock:
+            self._entries[prompt_id] = {
+                "model": model,
+                "name": name,
+                "created_at": datetime.now(),
+                "fingerprint": fingerprint,
+                "last_used": time.time(),
+                "nbytes": nbytes,
+                "disk_bytes": 0,
+                "prompt_items": prompt_items,
+            }
+            self._memory_bytes += nbytes
+            if fingerprint:
+                self._fingerprints[fingerprint] = prompt_id
+        return prompt_id
+
+    def is_resident(self, prompt_id: str) -> bool:
+        entry = self._entries.get(prompt_id)
+        return entry is not None and entry["prompt_items"] is not None
+
+    def find_by_fingerprint(self, fingerprint: str) -> Optional[str]:
+        """prompt_id du prompt créé depuis cette référence, s'il existe encore."""
+        with self._lock:
+            prompt_id = self._fingerprints.get(fingerprint)
+            return prompt_id if prompt_id in self._entries else None
+
+    def info(self, prompt_id: str) -> Optional[Dict[str, Any]]:
+        """Métadonnées d'un prompt, sans le recharger."""
+        with self._lock:
+            entry = self._entries.get(prompt_id)
+            if entry is None:
+                return None
+            return {key: value for key, value in entry.items() if key != "prompt_items"}
+
+    def get(self, prompt_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Retourne une copie de l'entrée avec ses prompt_items, rechargés du disque si besoin.
+
+        Bloquant si le prompt est déchargé : appeler via load_prompt() depuis la boucle.
+        """
+        with self._lock:
+            entry = self._entries.get(prompt_id)
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            entry["last_used"] = time.time()
+            self._entries.move_to_end(prompt_id)
+            if entry["prompt_items"] is not None:
+                self._stats["memory_hits"] += 1
+                return dict(entry)
+
+        prompt_file, _ = self._paths(prompt_id)
+        try:
+            prompt_items = load_prompt_file(prompt_file)
+            os.utime(prompt_file)
+        except Exception as e:
+            print(f"Erreur rechargement prompt {prompt_id}: {e}")
+            with self._lock:
+                self._remove(prompt_id)
+            return None
+
+        with self._lock:
+            if self._entries.get(prompt_id) is not entry:
+                # Supprimé pendant le rechargement
+                return None
+            if entry["prompt_items"] is None:
+                entry["prompt_items"] = prompt_items
+                self._memory_bytes += entry["nbytes"]
+            self._stats["disk_hits"] += 1
+            return dict(entry)
+
+    def delete(self, prompt_id: str) -> bool:
+        """Supprime un prompt de la mémoire et du disque."""
+        with self._lock:
+            return self._remove(prompt_id)
+
+    def _remove(self, prompt_id: str) -> bool:
+        """Supprime une entrée et ses fichiers (sous verrou)."""
+        entry = self._entries.pop(prompt_id, None)
+        if entry is None:
+            return False
+        if entry["prompt_items"] is not None:
+            self._memory_bytes -= entry["nbytes"]
+        self._disk_bytes -= entry["disk_bytes"]
+        fingerprint = entry.get("fingerprint")
+        if fingerprint and self._fingerprints.get(fingerprint) == prompt_id:
+            del self._fingerprints[fingerprint]
+        for path in self._paths(prompt_id):
+            path.unlink(missing_ok=True)
+        return True
+
+    def maintain(self) -> List[str]:
+        """
+        Applique les budgets et les TTL (bloquant : écritures disque).
+
+        Returns:
+            IDs des prompts définitivement supprimés
+        """
+        with self._lock:
+            if self._maintaining:
+                return []
+            self._maintaining = True
+        try:
+            return self._maintain()
+        finally:
+            with self._lock:
+                self._maintaining = False
+
+    def _maintain(self) -> List[str]:
+        now = time.time()
+        # 1. Choisir les prompts à décharger : inactifs, puis LRU au-delà du budget
+        with self._lock:
+            victims = []
+            projected = self._memory_bytes
+            for prompt_id, entry in self._entries.items():
+                if entry["prompt_items"] is None:
+                    continue
+                if now - entry["last_used"] > self.idle_ttl or projected > self.memory_budget:
+                    victims.append((prompt_id, entry))
+                    projected -= entry["nbytes"]
+
+        # 2. Décharger sur disque (hors verrou), puis libérer la mémoire
+        for prompt_id, entry in victims:
+            if entry["disk_bytes"] == 0 and not self._write(prompt_id, entry):
+                continue
+            with self._lock:
+                if self._entries.get(prompt_id) is entry and entry["prompt_items"] is not None:
+                    entry["prompt_items"] = None
+                    self._memory_bytes -= entry["nbytes"]
+                    self._stats["spilled"] += 1
+
+        # 3. Purger le disque : TTL puis budget (LRU), seulement les prompts non résidents
+        removed = []
+        with self._lock:
+            for prompt_id, entry in list(self._entries.items()):
+                if entry["prompt_items"] is None and now - entry["last_used"] > self.disk_ttl:
+                    self._remove(prompt_id)
+                    self._stats["expired"] += 1
+                    removed.append(prompt_id)
+            for prompt_id, entry in list(self._entries.items()):
+                if self._disk_bytes <= self.disk_budget:
+                    break
+                if entry["prompt_items"] is None and entry["disk_bytes"]:
+                    self._remove(prompt_id)
+                    self._stats["disk_evictions"] += 1
+                    removed.append(prompt_id)
+        return removed
+
+    def _write(self, prompt_id: str, entry: Dict[str, Any]) -> bool:
+        """Écrit le prompt sur disque (atomic write) ; False en cas d'échec."""
+        prompt_file, meta_file = self._paths(prompt_id)
+        tmp_file = prompt_file.with_suffix(".pt.tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            torch.save(prompt_state(_compact_prompt(entry["prompt_items"])), tmp_file)
+            tmp_file.rename(prompt_file)
+            disk_bytes = prompt_file.stat().st_size
+            meta = {
+                "model": entry["model"],
+                "name": entry["name"],
+                "created_at": entry["created_at"].isoformat(),
+                "fingerprint": entry["fingerprint"],
+                "nbytes": entry["nbytes"],
+                "disk_bytes": disk_bytes,
+            }
+            with open(meta_file, "w", encoding="utf-8") as f:
+                json.dump(meta, f, ensure_ascii=False, indent=2)
+        except Exception as e:
+            print(f"Erreur déchargement prompt {prompt_id}: {e}")
+            tmp_file.unlink(missing_ok=True)
+            return False
+        with self._lock:
+            if self._entries.get(prompt_id) is not entry:
+                # Supprimé pendant l'écriture
+                prompt_file.unlink(missing_ok=True)
+                meta_file.unlink(missing_ok=True)
+                return False
+            entry["disk_bytes"] = disk_bytes
+            self._disk_bytes += disk_bytes
+        return True
 
-            from qwen_tts import Qwen3TTSModel
+    def list(self) -> List[Dict[str, Any]]:
+        """Métadonnées de tous les prompts (ordre de création)."""
+        with self._lock:
+            entries = sorted(self._entries.items(), key=lambda item: item[1]["created_at"])
+            return [
+                {
+                    "prompt_id": prompt_id,
+                    "name": entry["name"],
+                    "model": entry["model"],
+                    "created_at": entry["created_at"].isoformat(),
+                    "last_used": datetime.fromtimestamp(entry["last_used"]).isoformat(),
+                    "resident": entry["prompt_items"] is not None,
+                    "size_kb": round(entry["nbytes"] / 1024, 1),
+                }
+                for prompt_id, entry in entries
+            ]
+
+    def stats(self) -> Dict[str, Any]:
+        """Occupation mémoire/disque, budgets et taux de hit."""
+        with self._lock:
+            lookups = self._stats["memory_hits"] + self._stats["disk_hits"] + self._stats["misses"]
+            resident = sum(1 for entry in self._entries.values() if entry["prompt_items"] is not None)
+            return {
+                "count": len(self._entries),
+                "resident": resident,
+                "on_disk_only": len(self._entries) - resident,
+                "memory_mb": round(self._memory_bytes / 1024 / 1024, 1),
+                "memory_budget_mb": round(self.memory_budget / 1024 / 1024, 1),
+                "disk_mb": round(self._disk_bytes / 1024 / 1024, 1),
+                "disk_budget_mb": round(self.disk_budget / 1024 / 1024, 1),
+                "idle_ttl_s": self.idle_ttl,
+                "disk_ttl_s": self.disk_ttl,
+                **self._stats,
+                "hit_rate": round((lookups - self._stats["misses"]) / lookups, 3) if lookups else 0,
+            }
 
-            model_path = MODELS_DIR / "1.7B-Base"
-            clone_model_1_7b = Qwen3TTSModel.from_pretrained(
-                str(model_path),
-                device_map=DEVICE,
-                dtype=torch.float16,
-            )
-            print(f"Modele 1.7B-Base charge sur {DEVICE}")
-        return clone_model_1_7b
-
-    elif model_size == "0.6B":
-        if clone_model_0_6b is None:
-            print("=" * 60)
-            print("Chargement du modele 0.6B-Base pour clonage...")
-            print("Cela peut prendre quelques minutes au premier lancement.")
-            print("=" * 60)
-
-            from qwen_tts import Qwen3TTSModel
-
-            model_path = MODELS_DIR / "0.6B-Base"
-            clone_model_0_6b = Qwen3TTSModel.from_pretrained(
-                str(model_path),
-                device_map=DEVICE,
-                dtype=torch.float32,  # float32 pour MPS avec modele 0.6B
-            )
-            print(f"Modele 0.6B-Base charge sur {DEVICE}")
-        return clone_model_0_6b
 
-    else:
-        raise ValueError(f"model_size doit etre '1.7B' ou '0.6B', pas '{model_size}'")
+prompt_store = PromptStore(
+    PROMPTS_DIR,
+    int(PROMPT_MEMORY_MB * 1024 * 1024),
+    int(PROMPT_DISK_MB * 1024 * 1024),
+    PROMPT_IDLE_TTL_MINUTES * 60,
+    PROMPT_DISK_TTL_DAYS * 86400,
+)
 
+reference_prompt_stats = {"hits": 0, "misses": 0}
+# Calculs de prompts en cours, par empreinte de l'audio de référence
+reference_prompt_coalescer = RequestCoalescer()
+
+
+async def maintain_prompt_store():
+    """Applique budgets et TTL du store hors de la boucle, puis invalide le cache audio des prompts purgés."""
+    removed = await run_in_threadpool(prompt_store.maintain)
+    for prompt_id in removed:
+        audio_cache.invalidate(f"prompt:{prompt_id}")
+
+
+_prompt_maintenance_task: Optional[asyncio.Task] = None
+
+
+def schedule_prompt_maintenance():
+    """
+    Planifie maintain_prompt_store() en arrière-plan (sans effet hors boucle).
+
+    Appelé après un ajout ou un rechargement pour appliquer les budgets sans
+    attendre la maintenance périodique ; une seule passe à la fois.
+    """
+    global _prompt_maintenance_task
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    if _prompt_maintenance_task is None or _prompt_maintenance_task.done():
+        _prompt_maintenance_task = asyncio.ensure_future(maintain_prompt_store())
+
+
+async def _prompt_maintenance_loop():
+    """Applique périodiquement les TTL du store de prompts, même sans nouvelle requête."""
+    while True:
+        await asyncio.sleep(PROMPT_MAINTENANCE_INTERVAL)
+        try:
+            await maintain_prompt_store()
+        except Exception as e:
+            print(f"Maintenance des prompts en erreur : {e}")
 
-# ==============================================================================
-# PROMPT STORAGE HELPERS
-# ==============================================================================
 
-def store_prompt(prompt_items: Any, model: str, name: Optional[str] = None) -> str:
+def store_prompt(prompt_items: Any, model: str, name: Optional[str] = None,
+                 fingerprint: Optional[str] = None) -> str:
     """
     Stocke un prompt de clonage vocal et retourne son ID.
 
-    ⚠️ IMPORTANT: Les prompts sont stockes en MEMOIRE uniquement.
-    Ils sont perdus au redemarrage du serveur.
+    ⚠️ IMPORTANT: Le store est borné : les prompts inactifs sont déchargés sur
+    disque puis supprimés après PROMPT_DISK_TTL_DAYS sans utilisation.
 
     Args:
         prompt_items: Resultat de create_voice_clone_prompt()
         model: Taille du modele utilise ("1.7B" ou "0.6B")
         name: Nom optionnel pour identifier le prompt (ex: "voix_yves")
+        fingerprint: Empreinte de l'audio de référence (voir reference_fingerprint)
 
     Returns:
         prompt_id: UUID unique pour ce prompt
     """
-    prompt_id = str(uuid.uuid4())
-    voice_clone_prompts[prompt_id] = {
-        "prompt_items": prompt_items,
-        "model": model,
-        "name": name,
-        "created_at": datetime.now(),
-    }
+    prompt_id = prompt_store.add(prompt_items, model, name, fingerprint)
+    schedule_prompt_maintenance()
     return prompt_id
 
 
 def get_prompt(prompt_id: str) -> Optional[Dict[str, Any]]:
     """
-    Recupere un prompt stocke par son ID.
+    Recupere un prompt stocke par son ID (recharge depuis le disque si decharge).
 
     Args:
         prompt_id: UUID du prompt
@@ -520,7 +3760,17 @@ def get_prompt(prompt_id: str) -> Optional[Dict[str, Any]]:
     Returns:
         Le prompt ou None si non trouve
     """
-    return voice_clone_prompts.get(prompt_id)
+    return prompt_store.get(prompt_id)
+
+
+async def load_prompt(prompt_id: str) -> Optional[Dict[str, Any]]:
+    """get_prompt() depuis la boucle : rechargement disque dans le pool de threads."""
+    if prompt_store.is_resident(prompt_id):
+        return prompt_store.get(prompt_id)
+    prompt_data = await run_in_threadpool(prompt_store.get, prompt_id)
+    if prompt_data is not None:
+        schedule_prompt_maintenance()
+    return prompt_data
 
 
 def delete_prompt(prompt_id: str) -> bool:
@@ -533,31 +3783,60 @@ def delete_prompt(prompt_id: str) -> bool:
     Returns:
         True si supprime, False si non trouve
     """
-    if prompt_id in voice_clone_prompts:
-        del voice_clone_prompts[prompt_id]
+    if prompt_store.delete(prompt_id):
+        audio_cache.invalidate(f"prompt:{prompt_id}")
         return True
     return False
 
 
 def list_prompts() -> list:
     """
-    Liste tous les prompts stockes.
-
-    ⚠️ IMPORTANT: Les prompts sont stockes en MEMOIRE uniquement.
-    Ils sont perdus au redemarrage du serveur.
+    Liste tous les prompts stockes (en mémoire ou déchargés sur disque).
 
     Returns:
         Liste des prompts avec leurs metadonnees (sans prompt_items)
     """
-    return [
-        {
-            "prompt_id": pid,
-            "name": data.get("name"),
-            "model": data["model"],
-            "created_at": data["created_at"].isoformat(),
-        }
-        for pid, data in voice_clone_prompts.items()
-    ]
+    return prompt_store.list()
+
+
+async def get_or_create_reference_prompt(model_size: str, audio_path: str, ref_text: str,
+                                         name: Optional[str] = None, store: bool = True) -> tuple:
+    """
+    Retourne le prompt d'un audio de référence, calculé une seule fois par empreinte.
+
+    Un audio déjà vu (mêmes échantillons, même transcription, même modèle)
+    réutilise le prompt stocké sans solliciter le modèle. Des envois simultanés
+    du même audio attendent le calcul en cours (single-flight par empreinte).
+
+    Args:
+        store: Stocker un prompt nouvellement calculé (False : mode x_vector_only)
+
+    Returns:
+        (prompt_id, prompt_items, cached) ; prompt_id est None si non stocké
+    """
+    fingerprint = await run_in_threadpool(reference_fingerprint, audio_path, ref_text, model_size)
+    led = False
+
+    async def resolve() -> tuple:
+        nonlocal led
+        led = True
+        prompt_id = prompt_store.find_by_fingerprint(fingerprint)
+        prompt_data = await load_prompt(prompt_id) if prompt_id else None
+        if prompt_data is not None:
+            return prompt_id, prompt_data["prompt_items"], True
+
+        prompt_items = await inference_executor.submit(
+            clone_model_key(model_size), create_clone_prompt_items, model_size, audio_path, ref_text
+        )
+        if not store:
+            return None, prompt_items, False
+        return store_prompt(prompt_items, model_size, name, fingerprint=fingerprint), prompt_items, False
+
+    prompt_id, prompt_items, cached = await reference_prompt_coalescer.run((fingerprint, store), resolve)
+    # Un appelant qui a attendu le calcul d'un autre réutilise son prompt
+    cached = cached or not led
+    reference_prompt_stats["hits" if cached else "misses"] += 1
+    return prompt_id, prompt_items, cached
 
 
 # ==============================================================================
@@ -590,6 +3869,148 @@ def get_native_voice_names() -> set:
     return set(PRESET_VOICES.keys())
 
 
+# Budget mémoire des embeddings de voix personnalisées et voix épinglées (jamais évincées)
+VOICE_MEMORY_MB = float(os.getenv("VOXQWEN_VOICE_MEMORY_MB", "1024"))
+PINNED_VOICES = {name.strip() for name in os.getenv("VOXQWEN_PINNED_VOICES", "").split(",") if name.strip()}
+
+
+class VoiceResidency:
+    """
+    Résidence en mémoire des embeddings des voix personnalisées (prompt.pt).
+
+    Les embeddings sont chargés à la demande dans custom_voices[name]["prompt_items"]
+    dans la limite de `budget` octets ; au-delà, les voix les moins récemment
+    utilisées sont évincées (le disque reste la source de vérité). Les voix
+    épinglées (VOXQWEN_PINNED_VOICES ou meta "pinned") ne sont jamais évincées.
+    prefetch() charge une voix en arrière-plan dès qu'une requête en file la
+    référence.
+    """
+
+    def __init__(self, budget: int, pinned: set):
+        self.budget = budget
+        self._pinned = set(pinned)
+        # Structure: {name: nbytes}, ordre LRU (le moins récemment utilisé en tête)
+        self._resident: "collections.OrderedDict[str, int]" = collections.OrderedDict()
+        self._bytes = 0
+        self._load_locks: Dict[str, threading.Lock] = collections.defaultdict(threading.Lock)
+        self._lock = threading.RLock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "prefetches": 0, "load_errors": 0}
+
+    def get(self, name: str):
+        """
+        Retourne les embeddings d'une voix, chargés depuis le disque si besoin (bloquant).
+
+        Returns:
+            Les prompt_items ou None si la voix n'existe pas ou ne se charge pas
+        """
+        voice_data = custom_voices.get(name)
+        if voice_data is None:
+            return None
+        if self._touch(name, voice_data):
+            return voice_data["prompt_items"]
+
+        # Un seul chargement par voix (requête et prefetch simultanés)
+        with self._load_locks[name]:
+            if self._touch(name, voice_data):
+                return voice_data["prompt_items"]
+            prompt_file = CUSTOM_VOICES_DIR / name / "prompt.pt"
+            if not prompt_file.exists():
+                return None
+            try:
+                prompt_items = load_prompt_file(prompt_file)
+            except Exception as e:
+                print(f"Erreur chargement embeddings {name}: {e}")
+                with self._lock:
+                    self._stats["load_errors"] += 1
+                return None
+            with self._lock:
+                self._stats["misses"] += 1
+                if custom_voices.get(name) is voice_data:
+                    self._admit(name, voice_data, prompt_items)
+        return prompt_items
+
+    def _touch(self, name: str, voice_data: Dict[str, Any]) -> bool:
+        """Compte un hit et rafraîchit l'ordre LRU si la voix est résidente."""
+        with self._lock:
+            if voice_data["prompt_items"] is None:
+                return False
+            self._stats["hits"] += 1
+            if name in self._resident:
+                self._resident.move_to_end(name)
+            return True
+
+    def _admit(self, name: str, voice_data: Dict[str, Any], prompt_items: Any):
+        """Rend une voix résidente puis applique le budget (sous verrou)."""
+        self._bytes -= self._resident.pop(name, 0)
+        voice_data["prompt_items"] = prompt_items
+        nbytes = _prompt_nbytes(prompt_items)
+        self._resident[name] = nbytes
+        self._bytes += nbytes
+        for victim in list(self._resident):
+            if self._bytes <= self.budget:
+                break
+            if victim == name or victim in self._pinned:
+                continue
+            self._bytes -= self._resident.pop(victim)
+            if victim in custom_voices:
+                custom_voices[victim]["prompt_items"] = None
+            self._stats["evictions"] += 1
+
+    def register(self, name: str, prompt_items: Any):
+        """Enregistre des embeddings déjà en mémoire (voix tout juste créée)."""
+        with self._lock:
+            if name in custom_voices:
+                self._admit(name, custom_voices[name], prompt_items)
+
+    def forget(self, name: str):
+        """Retire une voix supprimée de la comptabilité."""
+        with self._lock:
+            self._bytes -= self._resident.pop(name, 0)
+            self._pinned.discard(name)
+
+    def reset(self):
+        """Vide la comptabilité (rechargement des voix depuis le disque)."""
+        with self._lock:
+            self._resident.clear()
+            self._bytes = 0
+
+    def prefetch(self, name: str):
+        """Charge une voix en arrière-plan si elle n'est pas résidente (sans attendre)."""
+        voice_data = custom_voices.get(name)
+        if voice_data is None or voice_data["prompt_items"] is not None:
+            return
+        with self._lock:
+            self._stats["prefetches"] += 1
+        asyncio.get_running_loop().run_in_executor(None, self.get, name)
+
+    def pin(self, name: str):
+        with self._lock:
+            self._pinned.add(name)
+
+    def unpin(self, name: str):
+        with self._lock:
+            self._pinned.discard(name)
+
+    def is_pinned(self, name: str) -> bool:
+        return name in self._pinned
+
+    def stats(self) -> Dict[str, Any]:
+        """Voix résidentes, octets, budget et compteurs."""
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                "resident": len(self._resident),
+                "resident_mb": round(self._bytes / 1024 / 1024, 1),
+                "budget_mb": round(self.budget / 1024 / 1024, 1),
+                "pinned": sorted(self._pinned),
+                **self._stats,
+                "hit_rate": round(self._stats["hits"] / lookups, 3) if lookups else 0,
+            }
+
+
+voice_residency = VoiceResidency(int(VOICE_MEMORY_MB * 1024 * 1024), PINNED_VOICES)
+
+
 def load_custom_voices():
     """
     Charge les métadonnées des voix personnalisées depuis le disque.
@@ -597,6 +4018,7 @@ def load_custom_voices():
     """
     global custom_voices
     custom_voices = {}
+    voice_residency.reset()
 
     if not CUSTOM_VOICES_DIR.exists():
         return
@@ -615,15 +4037,17 @@ def load_custom_voices():
 
             custom_voices[voice_dir.name] = {
                 "meta": meta,
-                "prompt_items": None,  # Lazy loading
+                "prompt_items": None,  # Lazy loading (voir VoiceResidency)
             }
+            if meta.get("pinned"):
+                voice_residency.pin(voice_dir.name)
         except Exception as e:
             print(f"Erreur chargement voix {voice_dir.name}: {e}")
 
 
 def get_custom_voice_prompt(name: str):
     """
-    Récupère les embeddings d'une voix personnalisée (lazy loading).
+    Récupère les embeddings d'une voix personnalisée (lazy loading, budget mémoire).
 
     Args:
         name: Nom de la voix
@@ -631,26 +4055,13 @@ def get_custom_voice_prompt(name: str):
     Returns:
         Les prompt_items ou None si non trouvé
     """
-    if name not in custom_voices:
-        return None
-
-    voice_data = custom_voices[name]
-
-    # Lazy loading: charger les embeddings si pas encore en mémoire
-    if voice_data["prompt_items"] is None:
-        prompt_file = CUSTOM_VOICES_DIR / name / "prompt.pt"
-        if prompt_file.exists():
-            try:
-                voice_data["prompt_items"] = torch.load(prompt_file, map_location=DEVICE, weights_only=False)
-            except Exception as e:
-                print(f"Erreur chargement embeddings {name}: {e}")
-                return None
-
-    return voice_data["prompt_items"]
+    return voice_residency.get(name)
 
 
 def save_custom_voice(name: str, prompt_items: Any, source: str, model: str,
-                      description: str = "", language: str = "fr") -> Dict[str, Any]:
+                      description: str = "", language: str = "fr",
+                      extra_meta: Optional[Dict[str, Any]] = None,
+                      reference_wav: Optional[tuple] = None) -> Dict[str, Any]:
     """
     Sauvegarde une voix personnalisée sur disque.
 
@@ -661,6 +4072,8 @@ def save_custom_voice(name: str, prompt_items: Any, source: str, model: str,
         model: "1.7B" ou "0.6B"
         description: Description optionnelle
         language: Langue de la voix
+        extra_meta: Métadonnées supplémentaires (ex. description d'une voix design)
+        reference_wav: (wav, sr) de l'audio de référence, conservé en reference.wav
 
     Returns:
         Les métadonnées de la voix créée
@@ -678,6 +4091,13 @@ def save_custom_voice(name: str, prompt_items: Any, source: str, model: str,
         "created_at": datetime.now().isoformat(),
         "version": "1.0",
     }
+    if extra_meta:
+        meta.update(extra_meta)
+
+    # Conserver l'audio de référence (permet de recalculer le prompt)
+    if reference_wav is not None:
+        sf.write(str(voice_dir / "reference.wav"), reference_wav[0], reference_wav[1])
+        meta["reference_audio"] = "reference.wav"
 
     # Sauvegarder meta.json
     meta_file = voice_dir / "meta.json"
@@ -687,18 +4107,31 @@ def save_custom_voice(name: str, prompt_items: Any, source: str, model: str,
     # Sauvegarder prompt.pt (atomic write)
     prompt_file = voice_dir / "prompt.pt"
     tmp_file = voice_dir / "prompt.pt.tmp"
-    torch.save(prompt_items, tmp_file)
+    torch.save(prompt_state(prompt_items), tmp_file)
     tmp_file.rename(prompt_file)
 
     # Mettre en cache
     custom_voices[name] = {
         "meta": meta,
-        "prompt_items": prompt_items,
+        "prompt_items": None,
     }
+    voice_residency.register(name, prompt_items)
 
     return meta
 
 
+def set_custom_voice_pinned(name: str, pinned: bool):
+    """Persiste l'épinglage d'une voix dans son meta.json et met à jour la résidence."""
+    meta = custom_voices[name]["meta"]
+    meta["pinned"] = pinned
+    with open(CUSTOM_VOICES_DIR / name / "meta.json", "w", encoding="utf-8") as f:
+        json.dump(meta, f, ensure_ascii=False, indent=2)
+    if pinned:
+        voice_residency.pin(name)
+    else:
+        voice_residency.unpin(name)
+
+
 def delete_custom_voice(name: str) -> bool:
     """
     Supprime une voix personnalisée du disque et de la mémoire.
@@ -717,6 +4150,8 @@ def delete_custom_voice(name: str) -> bool:
         shutil.rmtree(voice_dir)
 
     del custom_voices[name]
+    voice_residency.forget(name)
+    audio_cache.invalidate(f"voice:{name}")
     return True
 
 
@@ -742,6 +4177,118 @@ def get_all_voice_names() -> set:
     return get_native_voice_names() | set(custom_voices.keys())
 
 
+# ==============================================================================
+# DÉMARRAGE (voix personnalisées, préchargement, warmup)
+# ==============================================================================
+
+# Modèles chargés puis chauffés au démarrage, séparés par des virgules (clés de MODEL_NAMES)
+PRELOAD_MODELS = [key.strip() for key in os.getenv("VOXQWEN_PRELOAD_MODELS", "").split(",") if key.strip()]
+WARMUP_ENABLED = os.getenv("VOXQWEN_WARMUP", "1") == "1"
+WARMUP_MAX_NEW_TOKENS = 32  # Génération courte : assez pour initialiser les noyaux du device
+WARMUP_TEXT = "Bonjour."
+
+# Progression du démarrage, exposée par /ready et /models/status
+# Structure: {"state": "starting|loading|warming|ready|failed", "phases": {"loading_seconds": ...}, ...}
+startup_status: Dict[str, Any] = {"state": "starting", "models": PRELOAD_MODELS, "phases": {}}
+
+
+def sample_generation(model, model_key: str, text: str, **kwargs):
+    """
+    Génère text avec une voix par défaut du modèle (warmup, benchmarks).
+
+    Les modèles Base utilisent un prompt x-vector calculé sur un bruit faible :
+    aucune référence audio n'est nécessaire.
+
+    Returns:
+        (wavs, sample_rate)
+    """
+    kwargs = {"text": text, "language": "French", **kwargs}
+    if model_key in ("preset_voice", "voice_clone"):
+        instruct = {"instruct": "Ton neutre."} if model_key == "voice_clone" else {}
+        return call_generate(model.generate_custom_voice, speaker="Serena", **instruct, **kwargs)
+    if model_key == "voice_design":
+        return call_generate(model.generate_voice_design, instruct="Voix neutre et posée.", **kwargs)
+    noise = (torch.randn(24000) * 0.01).numpy()
+    prompt = model.create_voice_clone_prompt(ref_audio=(noise, 24000), x_vector_only_mode=True)
+    return call_generate(model.generate_voice_clone, voice_clone_prompt=prompt, **kwargs)
+
+
+def warmup_model(model_key: str):
+    """
+    Exécute une génération courte sur le modèle (bloquant).
+
+    La première inférence paie l'initialisation des noyaux (MPS, CUDA) et des
+    caches d'allocation : autant la payer avant le premier client.
+    """
+    sample_generation(model_manager.get(model_key), model_key, WARMUP_TEXT, max_new_tokens=WARMUP_MAX_NEW_TOKENS)
+
+
+async def load_models(model_keys: List[str], fn=None):
+    """
+    Charge (ou applique fn à) plusieurs modèles en parallèle, chacun sur ses workers.
+
+    Raises:
+        La première exception levée, une fois tous les chargements terminés
+    """
+    fn = fn or model_manager.get
+    results = await asyncio.gather(
+        *(inference_executor.submit(key, fn, key, priority="bulk") for key in model_keys),
+        return_exceptions=True,
+    )
+    for key, result in zip(model_keys, results):
+        if isinstance(result, BaseException):
+            raise RuntimeError(f"{key} : {result}") from result
+
+
+async def preload_and_warmup():
+    """Charge puis chauffe les modèles de VOXQWEN_PRELOAD_MODELS ; /ready passe ensuite à ready."""
+    started = time.perf_counter()
+    unknown = [key for key in PRELOAD_MODELS if key not in MODEL_NAMES]
+    if unknown:
+        startup_status.update({"state": "failed", "error": f"Modèles inconnus : {', '.join(unknown)}"})
+        print(f"VOXQWEN_PRELOAD_MODELS : modèles inconnus {unknown}")
+        return
+
+    # Détail par modèle des phases de chargement : /models/status, "loading"
+    for phase, fn in (("loading", model_manager.get), ("warming", warmup_model)):
+        if phase == "warming" and not WARMUP_ENABLED:
+            break
+        startup_status["state"] = phase
+        phase_started = time.perf_counter()
+        try:
+            await load_models(PRELOAD_MODELS, fn)
+        except Exception as e:
+            startup_status.update({"state": "failed", "error": f"{phase} : {e}"})
+            print(f"Démarrage : échec ({phase}) : {e}")
+            return
+        startup_status["phases"][f"{phase}_seconds"] = round(time.perf_counter() - phase_started, 2)
+
+    startup_status.update({
+        "state": "ready",
+        "ready_at": datetime.now().isoformat(),
+        "elapsed_seconds": round(time.perf_counter() - started, 2),
+    })
+
+
+def start_background_tasks() -> List[asyncio.Task]:
+    """
+    Démarrage du serveur (appelé par le lifespan, quel que soit le lanceur).
+
+    Les voix personnalisées sont chargées immédiatement (métadonnées seules) ;
+    le préchargement, la prégénération et la maintenance des modèles, des
+    prompts et des jobs tournent en tâches de fond, annulées à l'arrêt.
+    """
+    load_custom_voices()
+    tasks = [asyncio.create_task(preload_and_warmup())]
+    if PREGEN_ENABLED:
+        tasks.append(pregenerator.start())
+    if MODEL_IDLE_TTL_MINUTES > 0:
+        tasks.append(asyncio.create_task(_model_maintenance_loop()))
+    tasks.append(asyncio.create_task(_prompt_maintenance_loop()))
+    tasks.append(asyncio.create_task(_job_maintenance_loop()))
+    return tasks
+
+
 # ==============================================================================
 # ROUTES
 # ==============================================================================
@@ -762,6 +4309,18 @@ async def root():
     }
 
 
+@app.get("/ready", tags=["Santé"])
+async def ready():
+    """
+    Sonde de disponibilité (readiness), distincte de / (liveness).
+
+    503 tant que les modèles de VOXQWEN_PRELOAD_MODELS ne sont pas chargés et
+    chauffés (ou si le démarrage a échoué), 200 ensuite.
+    """
+    status_code = 200 if startup_status["state"] == "ready" else 503
+    return JSONResponse(status_code=status_code, content=startup_status)
+
+
 @app.get("/languages", response_model=LanguagesResponse, tags=["Informations"])
 async def list_languages():
     """Liste les langues supportees et les modeles disponibles."""
@@ -782,7 +4341,7 @@ async def list_languages():
 
 
 @app.post("/design", tags=["Synthèse vocale"])
-async def voice_design(request: DesignRequest):
+async def voice_design(request: DesignRequest, http_request: Request):
     """
     Voice Design - Génère un audio avec une voix décrite en texte.
 
@@ -794,17 +4353,22 @@ async def voice_design(request: DesignRequest):
     Retourne : fichier WAV
     """
     try:
-        model = load_voice_design_model()
-
         # Convertir code langue en nom complet
         language = LANGUAGE_MAP.get(request.language, "French")
+        instruct = request.voice_instruct or "Voix naturelle et claire"
 
-        # Generer l'audio
-        wavs, sr = model.generate_voice_design(
-            text=request.text,
-            language=language,
-            instruct=request.voice_instruct or "Voix naturelle et claire",
+        # Avec seed : réponse déterministe, le client peut revalider son ETag
+        etag = synthesis_etag(
+            synthesis_key("design", "voice_design", "", language, instruct, request.text, request.seed),
+            request.seed,
         )
+        if etag_matches(http_request, etag):
+            return not_modified(etag)
+
+        # Generer l'audio (worker d'inference du modele)
+        wavs, sr = await run_for_request(http_request, synthesize_design(
+            request.text, language, instruct, request.seed
+        ))
 
         # Sauvegarder en memoire
         audio_buffer = io.BytesIO()
@@ -815,30 +4379,38 @@ async def voice_design(request: DesignRequest):
             audio_buffer,
             media_type="audio/wav",
             headers={
-                "Content-Disposition": "attachment; filename=voice_design.wav"
+                "Content-Disposition": "attachment; filename=voice_design.wav",
+                **etag_headers(etag),
             }
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/clone", tags=["Synthèse vocale"])
 async def voice_clone(
+    http_request: Request,
     text: str = Form(..., description="Texte à synthétiser"),
     reference_audio: Optional[UploadFile] = File(None, description="Audio de référence (1-30 sec). Requis si pas de prompt_id."),
     reference_text: str = Form("", description="Transcription de l'audio de référence (REQUIS pour le clonage)"),
     language: str = Form("fr", description="Langue cible"),
     model: str = Form("1.7B", description="Modèle : '1.7B' (qualité) ou '0.6B' (rapide)"),
     prompt_id: str = Form("", description="ID d'un prompt existant (si fourni, reference_audio est ignoré)"),
+    seed: Optional[int] = Form(None, ge=0, le=4294967295, description="Graine : audio reproductible, ETag"),
 ):
     """
     Voice Clone - Clone une voix depuis un audio de référence ou un prompt existant.
 
     Deux modes d'utilisation :
-    1. Avec reference_audio + reference_text : L'audio est traité à chaque requête (plus lent)
+    1. Avec reference_audio + reference_text : le prompt est calculé au premier envoi
+       de cette référence, puis réutilisé (empreinte des échantillons + transcription + modèle)
     2. Avec prompt_id : Réutilise un prompt créé via /clone/prompt (plus rapide)
 
+    L'en-tête X-Prompt-Id indique le prompt utilisé, réutilisable en mode 2.
+
     **IMPORTANT** : reference_text est obligatoire quand on utilise reference_audio.
     C'est la transcription exacte de ce qui est dit dans l'audio de référence.
 
@@ -861,7 +4433,7 @@ async def voice_clone(
 
         # Mode 1: Utiliser un prompt existant
         if prompt_id:
-            prompt_data = get_prompt(prompt_id)
+            prompt_data = await load_prompt(prompt_id)
             if not prompt_data:
                 raise HTTPException(
                     status_code=404,
@@ -874,18 +4446,9 @@ async def voice_clone(
                     status_code=400,
                     detail=f"Le prompt a ete cree avec le modele {prompt_data['model']}, pas {model}"
                 )
+            prompt_items = prompt_data["prompt_items"]
 
-            # Charger le modele Base
-            tts_model = load_clone_base_model(model)
-
-            # Generer avec le prompt stocke
-            wavs, sr = tts_model.generate_voice_clone(
-                text=text,
-                language=lang_full,
-                voice_clone_prompt=prompt_data["prompt_items"],
-            )
-
-        # Mode 2: Traiter l'audio de reference a la volee
+        # Mode 2: Traiter l'audio de reference (prompt calcule une fois par empreinte)
         else:
             # Verifier le fichier audio
             if not reference_audio or not reference_audio.filename:
@@ -911,26 +4474,32 @@ async def voice_clone(
                 tmp_path = tmp.name
 
             # Verifier la duree
-            import torchaudio
-            waveform, sample_rate = torchaudio.load(tmp_path)
-            duration = waveform.shape[1] / sample_rate
+            duration = await run_in_threadpool(get_audio_duration, tmp_path)
 
             if duration < 1:
                 raise HTTPException(status_code=400, detail=f"Audio trop court: {duration:.1f}s (min: 1s)")
             if duration > 30:
                 raise HTTPException(status_code=400, detail=f"Audio trop long: {duration:.1f}s (max: 30s)")
 
-            # Charger le modele Base (pas CustomVoice!)
-            tts_model = load_clone_base_model(model)
-
-            # Generer l'audio clone
-            wavs, sr = tts_model.generate_voice_clone(
-                text=text,
-                language=lang_full,
-                ref_audio=tmp_path,
-                ref_text=reference_text,
+            # Reference deja vue : prompt reutilise, sinon calcule avec le modele Base et stocke
+            prompt_id, prompt_items, _ = await run_for_request(
+                http_request, get_or_create_reference_prompt(model, tmp_path, reference_text)
             )
 
+        etag = synthesis_etag(
+            synthesis_key(
+                "clone", clone_model_key(model), clone_cache_identity(prompt_id)[0], lang_full, "", text, seed
+            ),
+            seed,
+        )
+        if etag_matches(http_request, etag):
+            return not_modified(etag)
+
+        # Generer avec le prompt (modele Base, regroupe par micro-batch)
+        wavs, sr = await run_for_request(http_request, synthesize_clone(
+            model, prompt_items, text, lang_full, prompt_key=prompt_id, seed=seed
+        ))
+
         # Sauvegarder en memoire
         audio_buffer = io.BytesIO()
         sf.write(audio_buffer, wavs[0], sr, format="WAV")
@@ -940,7 +4509,9 @@ async def voice_clone(
             audio_buffer,
             media_type="audio/wav",
             headers={
-                "Content-Disposition": "attachment; filename=voice_clone.wav"
+                "Content-Disposition": "attachment; filename=voice_clone.wav",
+                "X-Prompt-Id": prompt_id,
+                **etag_headers(etag),
             }
         )
 
@@ -955,6 +4526,7 @@ async def voice_clone(
 
 @app.post("/clone/prompt", tags=["Synthèse vocale"])
 async def create_clone_prompt(
+    http_request: Request,
     reference_audio: UploadFile = File(..., description="Audio de référence (1-30 sec)"),
     reference_text: str = Form(..., description="Transcription de l'audio de référence (REQUIS)"),
     model: str = Form("1.7B", description="Modèle : '1.7B' (qualité) ou '0.6B' (rapide)"),
@@ -985,6 +4557,7 @@ async def create_clone_prompt(
     - name : Nom du prompt (si fourni)
     - model : Modèle utilisé
     - created_at : Date de création
+    - cached : True si cette référence avait déjà un prompt (aucun recalcul)
     - x_vector : Embeddings (si x_vector_only=True)
     """
     tmp_path = None
@@ -1008,23 +4581,17 @@ async def create_clone_prompt(
             tmp_path = tmp.name
 
         # Verifier la duree
-        import torchaudio
-        waveform, sample_rate = torchaudio.load(tmp_path)
-        duration = waveform.shape[1] / sample_rate
+        duration = await run_in_threadpool(get_audio_duration, tmp_path)
 
         if duration < 1:
             raise HTTPException(status_code=400, detail=f"Audio trop court: {duration:.1f}s (min: 1s)")
         if duration > 30:
             raise HTTPException(status_code=400, detail=f"Audio trop long: {duration:.1f}s (max: 30s)")
 
-        # Charger le modele Base (pas CustomVoice!)
-        tts_model = load_clone_base_model(model)
-
-        # Creer le prompt
-        prompt_items = tts_model.create_voice_clone_prompt(
-            ref_audio=tmp_path,
-            ref_text=reference_text,
-        )
+        # Creer le prompt avec le modele Base (pas CustomVoice!), sauf reference deja vue
+        prompt_id, prompt_items, cached = await run_for_request(http_request, get_or_create_reference_prompt(
+            model, tmp_path, reference_text, name, store=not x_vector_only
+        ))
 
         # Nettoyer le fichier temporaire
         os.unlink(tmp_path)
@@ -1068,15 +4635,15 @@ async def create_clone_prompt(
                 "x_vector": x_vector_data,
             })
 
-        # Stocker le prompt
-        prompt_id = store_prompt(prompt_items, model, name)
-        prompt_data = get_prompt(prompt_id)
+        # Prompt stocke (ou deja existant pour cette reference)
+        prompt_data = prompt_store.info(prompt_id)
 
         return JSONResponse({
             "prompt_id": prompt_id,
-            "name": name,
+            "name": prompt_data.get("name"),
             "model": model,
             "created_at": prompt_data["created_at"].isoformat(),
+            "cached": cached,
         })
 
     except HTTPException:
@@ -1093,19 +4660,25 @@ async def list_clone_prompts():
     """
     Liste tous les prompts de clonage vocal en cache.
 
-    ⚠️ **ATTENTION** : Les prompts sont stockés en MÉMOIRE uniquement.
-    Ils sont perdus au redémarrage du serveur.
+    Le store est borné : les prompts inactifs sont déchargés sur disque et
+    rechargés à la demande, puis supprimés après une longue inactivité.
+
+    ⚠️ **ATTENTION** : Les prompts encore en mémoire sont perdus au redémarrage
+    du serveur (seuls les prompts déchargés sur disque sont conservés).
 
     Retourne :
-    - prompts : Liste des prompts avec leurs métadonnées (prompt_id, name, model, created_at)
+    - prompts : Liste des prompts avec leurs métadonnées (prompt_id, name, model,
+      created_at, last_used, resident, size_kb)
     - count : Nombre total de prompts
+    - store : Occupation mémoire/disque, budgets et taux de hit
     - warning : Rappel que les prompts sont volatils
     """
     prompts = list_prompts()
     return {
         "prompts": prompts,
         "count": len(prompts),
-        "warning": "Les prompts sont stockés en mémoire et perdus au redémarrage du serveur.",
+        "store": prompt_store.stats(),
+        "warning": "Les prompts en mémoire sont perdus au redémarrage ; les prompts inactifs expirent.",
     }
 
 
@@ -1173,6 +4746,7 @@ async def create_custom_voice(
     # Pour source=design
     voice_description: str = Form("", description="Description textuelle de la voix (requis si source=design)"),
     language: str = Form("fr", description="Langue : fr, en, zh, ja, ko, de, ru, pt, es, it"),
+    seed: Optional[int] = Form(None, description="Graine de génération de l'audio de référence (source=design)"),
 ):
     """
     Crée une voix personnalisée persistante.
@@ -1181,6 +4755,10 @@ async def create_custom_voice(
     - **source=clone** : Clone une voix depuis un audio de référence
     - **source=design** : Crée une voix depuis une description textuelle
 
+    Une voix design est générée une fois (1.7B-VoiceDesign) sur une phrase de
+    référence, puis convertie en prompt de clonage sur le modèle Base choisi :
+    ses synthèses passent ensuite par le chemin clone, au timbre fixe.
+
     La voix est sauvegardée sur disque et disponible après redémarrage.
     Elle apparaît dans GET /voices et peut être utilisée dans POST /preset.
 
@@ -1189,6 +4767,7 @@ async def create_custom_voice(
     - type : "custom"
     - source : "clone" ou "design"
     - created_at : Date de création
+    - prompt_id : Prompt de clonage en mémoire pour cette référence
     """
     tmp_path = None
     try:
@@ -1226,6 +4805,8 @@ async def create_custom_voice(
 
         # Convertir code langue en nom complet
         lang_full = LANGUAGE_MAP.get(language, "French")
+        extra_meta = None
+        reference_wav = None
 
         if source == "clone":
             # Mode clonage
@@ -1248,21 +4829,15 @@ async def create_custom_voice(
                 tmp_path = tmp.name
 
             # Vérifier la durée
-            import torchaudio
-            waveform, sample_rate = torchaudio.load(tmp_path)
-            duration = waveform.shape[1] / sample_rate
+            duration = await run_in_threadpool(get_audio_duration, tmp_path)
 
             if duration < 1:
                 raise HTTPException(status_code=400, detail=f"Audio trop court : {duration:.1f}s (min: 1s)")
             if duration > 30:
                 raise HTTPException(status_code=400, detail=f"Audio trop long : {duration:.1f}s (max: 30s)")
 
-            # Charger le modèle et créer le prompt
-            tts_model = load_clone_base_model(model)
-            prompt_items = tts_model.create_voice_clone_prompt(
-                ref_audio=tmp_path,
-                ref_text=reference_text,
-            )
+            # Créer le prompt avec le modèle Base (réutilisé si la référence est connue)
+            prompt_id, prompt_items, _ = await get_or_create_reference_prompt(model, tmp_path, reference_text)
 
         else:
             # Mode design
@@ -1272,24 +4847,21 @@ async def create_custom_voice(
                     detail="voice_description est requis pour source=design"
                 )
 
-            # Charger le modèle Voice Design
-            tts_model = load_voice_design_model()
+            # Générer une référence avec Voice Design, puis la matérialiser en
+            # prompt de clonage : le modèle VoiceDesign n'est plus sollicité ensuite
+            reference_text = DESIGN_REFERENCE_TEXTS.get(language, DESIGN_REFERENCE_TEXTS["en"])
+            wavs, sr = await synthesize_design(reference_text, lang_full, voice_description, seed)
+            reference_wav = (wavs[0], sr)
 
-            # Générer un audio court pour extraire les embeddings
-            # Note: Voice Design ne crée pas de prompt réutilisable directement,
-            # on génère un échantillon et on stocke la description pour régénérer
-            wavs, sr = tts_model.generate_voice_design(
-                text="Test de voix.",
-                language=lang_full,
-                instruct=voice_description,
-            )
+            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
+                tmp_path = tmp.name
+            await run_in_threadpool(sf.write, tmp_path, wavs[0], sr)
 
-            # Pour Voice Design, on stocke la description comme "prompt"
-            # car il n'y a pas d'embeddings extractibles
-            prompt_items = {
-                "type": "design",
+            prompt_id, prompt_items, _ = await get_or_create_reference_prompt(model, tmp_path, reference_text)
+            extra_meta = {
                 "voice_description": voice_description,
-                "language": lang_full,
+                "reference_text": reference_text,
+                "materialized": True,
             }
 
         # Sauvegarder la voix
@@ -1300,6 +4872,8 @@ async def create_custom_voice(
             model=model,
             description=description,
             language=language,
+            extra_meta=extra_meta,
+            reference_wav=reference_wav,
         )
 
         return JSONResponse({
@@ -1311,6 +4885,7 @@ async def create_custom_voice(
                 "description": description,
                 "model": model,
                 "created_at": meta["created_at"],
+                "prompt_id": prompt_id,
             }
         }, status_code=201)
 
@@ -1349,6 +4924,7 @@ async def get_custom_voice_details(name: str):
         **{k: v for k, v in meta.items() if k != "name"},
         "file_size_bytes": file_size,
         "loaded_in_memory": voice_data["prompt_items"] is not None,
+        "pinned": voice_residency.is_pinned(name),
     }
 
 
@@ -1383,41 +4959,49 @@ async def delete_custom_voice_route(name: str):
     }
 
 
-@app.post("/preset", tags=["Synthèse vocale"])
-async def preset_voice(
-    text: str = Form(..., min_length=1, max_length=10000, description="Texte à synthétiser"),
-    voice: str = Form("Serena", description="Nom de la voix (native ou personnalisée)"),
-    language: str = Form("fr", description="Langue : fr, en, zh, ja, ko, de, ru, pt, es, it")
-):
+@app.put("/voices/custom/{name}/pin", tags=["Synthèse vocale"])
+async def pin_custom_voice(name: str):
     """
-    Preset Voice - Génère un audio avec une voix préréglée ou personnalisée.
+    Épingle une voix personnalisée (voix VIP).
 
-    Accepte les voix natives (Vivian, Serena, etc.) et les voix personnalisées
-    créées via POST /voices/custom.
+    Ses embeddings sont chargés et ne sont jamais évincés de la mémoire,
+    quel que soit VOXQWEN_VOICE_MEMORY_MB. L'épinglage persiste au redémarrage.
+    """
+    if name not in custom_voices:
+        raise HTTPException(status_code=404, detail=f"Voix personnalisée '{name}' non trouvée")
+    await run_in_threadpool(set_custom_voice_pinned, name, True)
+    voice_residency.prefetch(name)
+    return {"status": "pinned", "name": name}
 
-    Pour les voix natives : utilise le modèle 0.6B (rapide).
-    Pour les voix custom : utilise le modèle avec lequel elles ont été créées.
 
-    Retourne : fichier WAV
-    """
+@app.delete("/voices/custom/{name}/pin", tags=["Synthèse vocale"])
+async def unpin_custom_voice(name: str):
+    """Désépingle une voix personnalisée : elle redevient évinçable (LRU)."""
+    if name not in custom_voices:
+        raise HTTPException(status_code=404, detail=f"Voix personnalisée '{name}' non trouvée")
+    await run_in_threadpool(set_custom_voice_pinned, name, False)
+    return {"status": "unpinned", "name": name}
+
+
+async def preset_response(http_request: Request, text: str, voice: str, language: str,
+                          seed: Optional[int]) -> Response:
+    """Synthèse /preset commune aux variantes POST et GET (WAV, ETag si seed)."""
     try:
         # Convertir code langue en nom complet
         language_full = LANGUAGE_MAP.get(language, "French")
 
         # Vérifier si c'est une voix native
         if voice in PRESET_VOICES:
-            model = load_preset_voice_model()
-            wavs, sr = model.generate_custom_voice(
-                text=text,
-                language=language_full,
-                speaker=voice,
-            )
+            etag = synthesis_etag(synthesis_key("preset", "preset_voice", voice, language_full, "", text, seed), seed)
+            if etag_matches(http_request, etag):
+                return not_modified(etag)
+            wavs, sr = await run_for_request(http_request, synthesize_preset(text, language_full, voice, seed))
 
         # Vérifier si c'est une voix personnalisée
         elif voice in custom_voices:
             voice_data = custom_voices[voice]
             meta = voice_data["meta"]
-            prompt_items = get_custom_voice_prompt(voice)
+            prompt_items = await run_in_threadpool(get_custom_voice_prompt, voice)
 
             if prompt_items is None:
                 raise HTTPException(
@@ -1425,23 +5009,14 @@ async def preset_voice(
                     detail=f"Impossible de charger les embeddings de la voix '{voice}'"
                 )
 
-            # Si c'est une voix design, régénérer avec la description
-            if meta.get("source") == "design" and isinstance(prompt_items, dict) and prompt_items.get("type") == "design":
-                tts_model = load_voice_design_model()
-                wavs, sr = tts_model.generate_voice_design(
-                    text=text,
-                    language=language_full,
-                    instruct=prompt_items["voice_description"],
-                )
-            else:
-                # Voix clonée : utiliser le prompt
-                model_size = meta.get("model", "1.7B")
-                tts_model = load_clone_base_model(model_size)
-                wavs, sr = tts_model.generate_voice_clone(
-                    text=text,
-                    language=language_full,
-                    voice_clone_prompt=prompt_items,
-                )
+            etag = synthesis_etag(custom_synthesis_key(meta, prompt_items, text, language_full, seed), seed)
+            if etag_matches(http_request, etag):
+                return not_modified(etag)
+
+            # Voix design : régénérer avec la description ; voix clonée : utiliser le prompt
+            wavs, sr = await run_for_request(
+                http_request, synthesize_custom(meta, prompt_items, text, language_full, seed)
+            )
 
         else:
             all_voices = list(PRESET_VOICES.keys()) + list(custom_voices.keys())
@@ -1459,7 +5034,8 @@ async def preset_voice(
             audio_buffer,
             media_type="audio/wav",
             headers={
-                "Content-Disposition": f"attachment; filename=preset_{voice.lower()}.wav"
+                "Content-Disposition": f"attachment; filename=preset_{voice.lower()}.wav",
+                **etag_headers(etag),
             }
         )
 
@@ -1469,12 +5045,61 @@ async def preset_voice(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/preset", tags=["Synthèse vocale"])
+async def preset_voice(
+    http_request: Request,
+    text: str = Form(..., min_length=1, max_length=10000, description="Texte à synthétiser"),
+    voice: str = Form("Serena", description="Nom de la voix (native ou personnalisée)"),
+    language: str = Form("fr", description="Langue : fr, en, zh, ja, ko, de, ru, pt, es, it"),
+    seed: Optional[int] = Form(None, ge=0, le=4294967295, description="Graine : audio reproductible, ETag"),
+):
+    """
+    Preset Voice - Génère un audio avec une voix préréglée ou personnalisée.
+
+    Accepte les voix natives (Vivian, Serena, etc.) et les voix personnalisées
+    créées via POST /voices/custom.
+
+    Pour les voix natives : utilise le modèle 0.6B (rapide).
+    Pour les voix custom : utilise le modèle avec lequel elles ont été créées.
+
+    Avec `seed`, l'audio est reproductible : la réponse porte un ETag fort
+    et If-None-Match renvoie 304.
+
+    Retourne : fichier WAV
+    """
+    return await preset_response(http_request, text, voice, language, seed)
+
+
+@app.get("/preset", tags=["Synthèse vocale"])
+async def preset_voice_get(
+    http_request: Request,
+    text: str = Query(..., min_length=1, max_length=2000, description="Texte à synthétiser"),
+    voice: str = Query("Serena", description="Nom de la voix (native ou personnalisée)"),
+    language: str = Query("fr", description="Langue : fr, en, zh, ja, ko, de, ru, pt, es, it"),
+    seed: int = Query(0, ge=0, le=4294967295, description="Graine (défaut 0 : réponse toujours déterministe)"),
+):
+    """
+    Preset Voice (GET) - Variante idempotente et cacheable de POST /preset.
+
+    Toujours seedée (seed=0 par défaut) : même URL, même audio. La réponse
+    porte un ETag fort et un Cache-Control public, pour que les proxys et CDN
+    placés devant l'API absorbent le trafic répété.
+
+    Exemple : GET /preset?text=Bonjour&voice=Serena&language=fr
+
+    Retourne : fichier WAV
+    """
+    return await preset_response(http_request, text, voice, language, seed)
+
+
 @app.post("/preset/instruct", tags=["Synthèse vocale"])
 async def preset_voice_with_instruct(
+    http_request: Request,
     text: str = Form(..., min_length=1, max_length=10000, description="Texte à synthétiser"),
     voice: str = Form("Serena", description="Nom de la voix (native uniquement pour instruct)"),
     instruct: str = Form("", description="Instruction pour contrôler l'émotion/style (ex : 'Ton joyeux et excité', 'Chuchotant doucement')"),
-    language: str = Form("fr", description="Langue : fr, en, zh, ja, ko, de, ru, pt, es, it")
+    language: str = Form("fr", description="Langue : fr, en, zh, ja, ko, de, ru, pt, es, it"),
+    seed: Optional[int] = Form(None, ge=0, le=4294967295, description="Graine : audio reproductible, ETag"),
 ):
     """
     Preset Voice avec contrôle émotionnel - Génère un audio avec une voix préréglée
@@ -1507,17 +5132,19 @@ async def preset_voice_with_instruct(
                 detail=f"Voix '{voice}' inconnue. Disponibles : {', '.join(PRESET_VOICES.keys())}"
             )
 
-        model = load_voice_clone_model()  # 1.7B-CustomVoice
-
         # Convertir code langue en nom complet
         language_full = LANGUAGE_MAP.get(language, "French")
 
-        # Générer l'audio avec instruction
-        wavs, sr = model.generate_custom_voice(
-            text=text,
-            language=language_full,
-            speaker=voice,
-            instruct=instruct if instruct else "",
+        instruct = instruct if instruct else ""
+        etag = synthesis_etag(
+            synthesis_key("instruct", "voice_clone", voice, language_full, instruct, text, seed), seed
+        )
+        if etag_matches(http_request, etag):
+            return not_modified(etag)
+
+        # Générer l'audio avec instruction (1.7B-CustomVoice)
+        wavs, sr = await run_for_request(
+            http_request, synthesize_instruct(text, language_full, voice, instruct, seed)
         )
 
         # Sauvegarder en mémoire
@@ -1529,7 +5156,8 @@ async def preset_voice_with_instruct(
             audio_buffer,
             media_type="audio/wav",
             headers={
-                "Content-Disposition": f"attachment; filename=preset_instruct_{voice.lower()}.wav"
+                "Content-Disposition": f"attachment; filename=preset_instruct_{voice.lower()}.wav",
+                **etag_headers(etag),
             }
         )
 
@@ -1539,18 +5167,43 @@ async def preset_voice_with_instruct(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def selected_models(design: bool, clone: bool, preset: bool, clone_1_7b: bool,
+                    clone_0_6b: bool) -> Dict[str, bool]:
+    """Paramètres booléens de /models/preload et /models/unload, par clé de modèle."""
+    return {
+        "voice_design": design,
+        "voice_clone": clone,
+        "preset_voice": preset,
+        "clone_1_7b": clone_1_7b,
+        "clone_0_6b": clone_0_6b,
+    }
+
+
 @app.get("/models/status", tags=["Informations"])
 async def models_status():
     """Vérifie le statut des modèles chargés et des voix."""
     return {
-        "voice_design_loaded": voice_design_model is not None,
-        "voice_clone_loaded": voice_clone_model is not None,  # 1.7B-CustomVoice
-        "preset_voice_loaded": preset_voice_model is not None,  # 0.6B-CustomVoice
-        "clone_1_7b_loaded": clone_model_1_7b is not None,  # 1.7B-Base
-        "clone_0_6b_loaded": clone_model_0_6b is not None,  # 0.6B-Base
-        "prompts_cached": len(voice_clone_prompts),
+        **model_manager.loaded_flags(),
+        "models": model_manager.stats(),
+        "prompts_cached": len(prompt_store),
+        "prompt_store": prompt_store.stats(),
+        "reference_prompts": {**reference_prompt_stats, "coalescing": reference_prompt_coalescer.stats()},
         "custom_voices_count": len(custom_voices),
         "custom_voices_loaded_in_memory": sum(1 for v in custom_voices.values() if v["prompt_items"] is not None),
+        "voice_residency": voice_residency.stats(),
+        "loading": model_load_status,
+        "inference": inference_executor.stats(),
+        "micro_batching": micro_batcher.stats(),
+        "coalescing": request_coalescer.stats(),
+        "jobs": jobs_stats(),
+        "cancellation": {**cancellation_stats, "stop_unsupported_models": sorted(map(str, _stop_unsupported))},
+        "audio_cache": audio_cache.stats(),
+        "deadlines": deadline_stats,
+        "language_detection": language_detection_status(),
+        "tokenizer": tokenizer_status,
+        "prefix_cache": prefix_kv_cache.stats(),
+        "pregeneration": pregenerator.stats(),
+        "startup": startup_status,
         "device": DEVICE,
         "mps_available": torch.backends.mps.is_available(),
         "cuda_available": torch.cuda.is_available(),
@@ -1566,12 +5219,15 @@ async def preload_models(
     preset: bool = True,
     clone_1_7b: bool = False,
     clone_0_6b: bool = False,
+    pin: bool = False,
 ):
     """
     Pré-charge les modèles en mémoire.
 
     Utile pour éviter le temps de chargement au premier appel.
-    Par défaut, charge le modèle preset (le plus léger).
+    Par défaut, charge le modèle preset (le plus léger). Les modèles demandés
+    sont chargés en parallèle ; la durée de chaque phase (io, materialize,
+    device) figure ensuite dans /models/status sous "loading".
 
     Paramètres :
         design : Charger 1.7B-VoiceDesign
@@ -1579,33 +5235,73 @@ async def preload_models(
         preset : Charger 0.6B-CustomVoice (pour /preset)
         clone_1_7b : Charger 1.7B-Base (pour /clone haute qualité)
         clone_0_6b : Charger 0.6B-Base (pour /clone rapide)
+        pin : Épingler les modèles chargés (jamais évincés ni déchargés pour inactivité)
     """
-    loaded = []
+    if pin:
+        # Épingler avant de charger : les modèles demandés ne s'évincent pas entre eux
+        for model_key, selected in selected_models(design, clone, preset, clone_1_7b, clone_0_6b).items():
+            if selected:
+                model_manager.pin(model_key)
+
+    # Chaque modèle a ses propres workers : les chargements se font en parallèle
+    model_keys = [key for key, flag in selected_models(design, clone, preset, clone_1_7b, clone_0_6b).items() if flag]
+    await load_models(model_keys)
+    loaded = [f"{key} ({MODEL_NAMES[key]})" for key in model_keys]
+
+    return {
+        "status": "success",
+        "loaded": loaded,
+        "pinned": model_manager.stats()["pinned"],
+        "device": DEVICE
+    }
 
-    if preset:
-        load_preset_voice_model()
-        loaded.append("preset_voice (0.6B-CustomVoice)")
 
-    if design:
-        load_voice_design_model()
-        loaded.append("voice_design (1.7B-VoiceDesign)")
+@app.post("/models/unload", tags=["Informations"])
+async def unload_models(
+    design: bool = False,
+    clone: bool = False,
+    preset: bool = False,
+    clone_1_7b: bool = False,
+    clone_0_6b: bool = False,
+    force: bool = False,
+):
+    """
+    Décharge des modèles de la mémoire (et les désépingle).
 
-    if clone:
-        load_voice_clone_model()
-        loaded.append("voice_clone (1.7B-CustomVoice)")
+    Un modèle avec du travail en file ou en cours est refusé (409), sauf avec
+    force : ses poids sont alors libérés à la fin des générations en cours et
+    le prochain appel le recharge.
 
-    if clone_1_7b:
-        load_clone_base_model("1.7B")
-        loaded.append("clone_1_7b (1.7B-Base)")
+    Paramètres :
+        design : Décharger 1.7B-VoiceDesign
+        clone : Décharger 1.7B-CustomVoice
+        preset : Décharger 0.6B-CustomVoice
+        clone_1_7b : Décharger 1.7B-Base
+        clone_0_6b : Décharger 0.6B-Base
+        force : Décharger même si le modèle est occupé
+    """
+    selected = [
+        model_key
+        for model_key, flag in selected_models(design, clone, preset, clone_1_7b, clone_0_6b).items()
+        if flag
+    ]
+    busy = [model_key for model_key in selected if inference_executor.is_busy(model_key)]
+    if busy and not force:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Modèles occupés : {', '.join(busy)} (utiliser force=true)",
+        )
 
-    if clone_0_6b:
-        load_clone_base_model("0.6B")
-        loaded.append("clone_0_6b (0.6B-Base)")
+    unloaded = []
+    for model_key in selected:
+        model_manager.unpin(model_key)
+        if await run_in_threadpool(model_manager.unload, model_key):
+            unloaded.append(f"{model_key} ({MODEL_NAMES[model_key]})")
 
     return {
         "status": "success",
-        "loaded": loaded,
-        "device": DEVICE
+        "unloaded": unloaded,
+        "models": model_manager.stats(),
     }
 
 
@@ -1614,7 +5310,7 @@ async def preload_models(
 # ==============================================================================
 
 @app.post("/batch/preset", tags=["Batch Processing"])
-async def batch_preset_voice(request: BatchPresetRequest):
+async def batch_preset_voice(request: BatchPresetRequest, http_request: Request):
     """
     Batch Preset - Génère plusieurs audios avec la même voix.
 
@@ -1641,10 +5337,6 @@ async def batch_preset_voice(request: BatchPresetRequest):
                     detail=f"Texte {i+1} est vide"
                 )
 
-        # Résoudre la langue (support auto)
-        first_text = request.texts[0] if request.texts else ""
-        language_full = resolve_language(request.language, first_text)
-
         # Vérifier si c'est une voix native ou custom
         is_native = request.voice in PRESET_VOICES
         is_custom = request.voice in custom_voices
@@ -1656,62 +5348,36 @@ async def batch_preset_voice(request: BatchPresetRequest):
                 detail=f"Voix '{request.voice}' inconnue. Disponibles : {', '.join(all_voices)}"
             )
 
-        # Créer le ZIP en mémoire
-        zip_buffer = io.BytesIO()
-
-        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zf:
-            for i, text in enumerate(request.texts):
-                # Résoudre la langue pour chaque texte si auto
-                if request.language == "auto":
-                    lang = resolve_language("auto", text)
-                else:
-                    lang = language_full
-
-                # Générer l'audio
-                if is_native:
-                    model = load_preset_voice_model()
-                    wavs, sr = model.generate_custom_voice(
-                        text=text,
-                        language=lang,
-                        speaker=request.voice,
-                    )
-                else:
-                    # Voix personnalisée
-                    voice_data = custom_voices[request.voice]
-                    meta = voice_data["meta"]
-                    prompt_items = get_custom_voice_prompt(request.voice)
-
-                    if prompt_items is None:
-                        raise HTTPException(
-                            status_code=500,
-                            detail=f"Impossible de charger la voix '{request.voice}'"
-                        )
+        # Résoudre la langue (support auto, détection par texte)
+        languages = batch_languages(request.texts, request.language)
 
-                    if meta.get("source") == "design" and isinstance(prompt_items, dict) and prompt_items.get("type") == "design":
-                        tts_model = load_voice_design_model()
-                        wavs, sr = tts_model.generate_voice_design(
-                            text=text,
-                            language=lang,
-                            instruct=prompt_items["voice_description"],
-                        )
-                    else:
-                        model_size = meta.get("model", "1.7B")
-                        tts_model = load_clone_base_model(model_size)
-                        wavs, sr = tts_model.generate_voice_clone(
-                            text=text,
-                            language=lang,
-                            voice_clone_prompt=prompt_items,
-                        )
+        # Générer l'audio par lots (langue + longueur), textes dupliqués générés une fois
+        if is_native:
+            results = await run_for_request(http_request, run_batch_items(
+                "preset_voice",
+                generate_preset_batch,
+                [(text, lang, request.voice) for text, lang in zip(request.texts, languages)],
+            ))
+        else:
+            # Voix personnalisée
+            voice_data = custom_voices[request.voice]
+            meta = voice_data["meta"]
+            prompt_items = await run_in_threadpool(get_custom_voice_prompt, request.voice)
 
-                # Sauvegarder dans le ZIP
-                audio_buffer = io.BytesIO()
-                sf.write(audio_buffer, wavs[0], sr, format="WAV")
-                audio_buffer.seek(0)
+            if prompt_items is None:
+                raise HTTPException(
+                    status_code=500,
+                    detail=f"Impossible de charger la voix '{request.voice}'"
+                )
 
-                filename = f"{i+1:03d}.wav"
-                zf.writestr(filename, audio_buffer.getvalue())
+            results = await run_for_request(http_request, run_batch_items(
+                custom_voice_model_key(meta, prompt_items),
+                functools.partial(generate_custom_batch, meta, prompt_items),
+                list(zip(request.texts, languages)),
+            ))
 
-        zip_buffer.seek(0)
+        # Créer le ZIP en mémoire
+        zip_buffer = build_wav_zip(results)
 
         return StreamingResponse(
             zip_buffer,
@@ -1728,7 +5394,7 @@ async def batch_preset_voice(request: BatchPresetRequest):
 
 
 @app.post("/batch/design", tags=["Batch Processing"])
-async def batch_voice_design(request: BatchDesignRequest):
+async def batch_voice_design(request: BatchDesignRequest, http_request: Request):
     """
     Batch Voice Design - Génère plusieurs audios avec une voix décrite en texte.
 
@@ -1755,39 +5421,18 @@ async def batch_voice_design(request: BatchDesignRequest):
                     detail=f"Texte {i+1} est vide"
                 )
 
-        model = load_voice_design_model()
+        # Résoudre la langue (support auto, détection par texte)
+        languages = batch_languages(request.texts, request.language)
 
-        # Résoudre la langue (support auto)
-        first_text = request.texts[0] if request.texts else ""
-        language_full = resolve_language(request.language, first_text)
+        # Générer l'audio par lots (langue + longueur), textes dupliqués générés une fois
+        results = await run_for_request(http_request, run_batch_items(
+            "voice_design",
+            functools.partial(generate_design_batch, request.voice_instruct or "Voix naturelle et claire"),
+            list(zip(request.texts, languages)),
+        ))
 
         # Créer le ZIP en mémoire
-        zip_buffer = io.BytesIO()
-
-        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zf:
-            for i, text in enumerate(request.texts):
-                # Résoudre la langue pour chaque texte si auto
-                if request.language == "auto":
-                    lang = resolve_language("auto", text)
-                else:
-                    lang = language_full
-
-                # Générer l'audio
-                wavs, sr = model.generate_voice_design(
-                    text=text,
-                    language=lang,
-                    instruct=request.voice_instruct or "Voix naturelle et claire",
-                )
-
-                # Sauvegarder dans le ZIP
-                audio_buffer = io.BytesIO()
-                sf.write(audio_buffer, wavs[0], sr, format="WAV")
-                audio_buffer.seek(0)
-
-                filename = f"{i+1:03d}.wav"
-                zf.writestr(filename, audio_buffer.getvalue())
-
-        zip_buffer.seek(0)
+        zip_buffer = build_wav_zip(results)
 
         return StreamingResponse(
             zip_buffer,
@@ -1805,6 +5450,7 @@ async def batch_voice_design(request: BatchDesignRequest):
 
 @app.post("/batch/clone", tags=["Batch Processing"])
 async def batch_voice_clone(
+    http_request: Request,
     texts: str = Form(..., description="Textes à synthétiser, séparés par des sauts de ligne (\\n)"),
     prompt_id: str = Form(..., description="ID du prompt créé via /clone/prompt (requis)"),
     language: str = Form("fr", description="Langue : fr, en, zh, ja, ko, de, ru, pt, es, it, auto"),
@@ -1837,7 +5483,7 @@ async def batch_voice_clone(
             )
 
         # Récupérer le prompt
-        prompt_data = get_prompt(prompt_id)
+        prompt_data = await load_prompt(prompt_id)
         if not prompt_data:
             raise HTTPException(
                 status_code=404,
@@ -1845,39 +5491,19 @@ async def batch_voice_clone(
             )
 
         model_size = prompt_data["model"]
-        tts_model = load_clone_base_model(model_size)
 
-        # Résoudre la langue (support auto)
-        first_text = text_list[0] if text_list else ""
-        language_full = resolve_language(language, first_text)
+        # Résoudre la langue (support auto, détection par texte)
+        languages = batch_languages(text_list, language)
 
-        # Créer le ZIP en mémoire
-        zip_buffer = io.BytesIO()
-
-        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zf:
-            for i, text in enumerate(text_list):
-                # Résoudre la langue pour chaque texte si auto
-                if language == "auto":
-                    lang = resolve_language("auto", text)
-                else:
-                    lang = language_full
-
-                # Générer l'audio avec le prompt
-                wavs, sr = tts_model.generate_voice_clone(
-                    text=text,
-                    language=lang,
-                    voice_clone_prompt=prompt_data["prompt_items"],
-                )
-
-                # Sauvegarder dans le ZIP
-                audio_buffer = io.BytesIO()
-                sf.write(audio_buffer, wavs[0], sr, format="WAV")
-                audio_buffer.seek(0)
+        # Générer l'audio avec le prompt, par lots (langue + longueur)
+        results = await run_for_request(http_request, run_batch_items(
+            clone_model_key(model_size),
+            functools.partial(generate_clone_batch, model_size, prompt_data["prompt_items"]),
+            list(zip(text_list, languages)),
+        ))
 
-                filename = f"{i+1:03d}.wav"
-                zf.writestr(filename, audio_buffer.getvalue())
-
-        zip_buffer.seek(0)
+        # Créer le ZIP en mémoire
+        zip_buffer = build_wav_zip(results)
 
         prompt_name = prompt_data.get("name", "clone")
         return StreamingResponse(
@@ -1894,16 +5520,504 @@ async def batch_voice_clone(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# ==============================================================================
+# JOBS API (synthèse batch asynchrone)
+# ==============================================================================
+
+# Les audios des jobs sont écrits dans OUTPUTS_DIR/jobs/<job_id>/001.wav, ...
+JOBS_DIR = OUTPUTS_DIR / "jobs"
+JOB_WORKERS = int(os.getenv("VOXQWEN_JOB_WORKERS", "2"))
+JOB_TERMINAL_STATES = ("completed", "failed", "cancelled")
+# Les jobs terminés (et leurs audios) sont supprimés après ce délai
+JOB_TTL_HOURS = float(os.getenv("VOXQWEN_JOB_TTL_HOURS", "24"))
+JOB_SWEEP_INTERVAL = 300  # secondes
+
+# Jobs connus (in-memory) ; les clés préfixées par "_" ne sont pas exposées
+# Structure: {job_id: {"job_id": ..., "status": "queued|running|...", "finished": [index, ...], ...}}
+jobs: Dict[str, Dict[str, Any]] = {}
+_job_queue: Optional[asyncio.Queue] = None
+_job_workers: List[asyncio.Task] = []
+
+
+def validate_job(data: JobRequest):
+    """
+    Valide un job à la soumission, sans charger voix ni prompt.
+
+    Les embeddings d'une voix personnalisée sont préchargés en arrière-plan
+    pendant que le job attend en file ; plan_job les résout au démarrage.
+    """
+    for i, text in enumerate(data.texts):
+        if not text or not text.strip():
+            raise HTTPException(status_code=400, detail=f"Texte {i+1} est vide")
+
+    if data.type == "preset":
+        if data.voice in custom_voices:
+            voice_residency.prefetch(data.voice)
+        elif data.voice not in PRESET_VOICES:
+            all_voices = list(PRESET_VOICES.keys()) + list(custom_voices.keys())
+            raise HTTPException(
+                status_code=400,
+                detail=f"Voix '{data.voice}' inconnue. Disponibles : {', '.join(all_voices)}"
+            )
+    elif data.type == "clone" and prompt_store.info(data.prompt_id) is None:
+        raise HTTPException(status_code=404, detail=f"Prompt '{data.prompt_id}' non trouvé")
+
+
+async def plan_job(data: JobRequest) -> tuple:
+    """
+    Prépare la génération d'un job au démarrage (voix et prompt chargés ici).
+
+    Returns:
+        (model_key, batch_fn, items) pour iter_batch_items
+    """
+    languages = batch_languages(data.texts, data.language)
+
+    if data.type == "preset":
+        if data.voice in PRESET_VOICES:
+            items = [(text, lang, data.voice) for text, lang in zip(data.texts, languages)]
+            return "preset_voice", generate_preset_batch, items
+
+        if data.voice in custom_voices:
+            meta = custom_voices[data.voice]["meta"]
+            prompt_items = await run_in_threadpool(get_custom_voice_prompt, data.voice)
+            if prompt_items is None:
+                raise HTTPException(
+                    status_code=500,
+                    detail=f"Impossible de charger la voix '{data.voice}'"
+                )
+            return (
+                custom_voice_model_key(meta, prompt_items),
+                functools.partial(generate_custom_batch, meta, prompt_items),
+                list(zip(data.texts, languages)),
+            )
+
+        all_voices = list(PRESET_VOICES.keys()) + list(custom_voices.keys())
+        raise HTTPException(
+            status_code=400,
+            detail=f"Voix '{data.voice}' inconnue. Disponibles : {', '.join(all_voices)}"
+        )
+
+    if data.type == "design":
+        return (
+            "voice_design",
+            functools.partial(generate_design_batch, data.voice_instruct or "Voix naturelle et claire"),
+            list(zip(data.texts, languages)),
+        )
+
+    prompt_data = await load_prompt(data.prompt_id)
+    if not prompt_data:
+        raise HTTPException(status_code=404, detail=f"Prompt '{data.prompt_id}' non trouvé")
+    model_size = prompt_data["model"]
+    return (
+        clone_model_key(model_size),
+        functools.partial(generate_clone_batch, model_size, prompt_data["prompt_items"]),
+        list(zip(data.texts, languages)),
+    )
+
+
+def job_summary(job: Dict[str, Any]) -> Dict[str, Any]:
+    """Vue publique d'un job (sans les champs internes)."""
+    summary = {k: v for k, v in job.items() if not k.startswith("_") and k != "finished"}
+    summary["completed"] = len(job["finished"])
+    summary["progress"] = round(len(job["finished"]) / job["total"], 3) if job["total"] else 1.0
+    summary["items"] = [f"/jobs/{job['job_id']}/items/{i+1}" for i in sorted(job["finished"])]
+    return summary
+
+
+def _notify_job(job: Dict[str, Any]):
+    """Réveille les clients qui suivent le job (/jobs/{id}/stream)."""
+    event = job["_event"]
+    job["_event"] = asyncio.Event()
+    event.set()
+
+
+def _write_job_audio(job_dir: Path, indices: List[int], wav, sr: int):
+    """Écrit l'audio d'un élément de job pour chacune de ses positions."""
+    for i in indices:
+        sf.write(str(job_dir / f"{i+1:03d}.wav"), wav, sr, format="WAV")
+
+
+async def _run_job(job: Dict[str, Any]):
+    """Génère les éléments d'un job et les écrit sur disque au fil de l'eau."""
+    data = job.pop("_request")
+    job_dir = JOBS_DIR / job["job_id"]
+    job["status"] = "running"
+    job["started_at"] = datetime.now().isoformat()
+    _notify_job(job)
+    try:
+        model_key, batch_fn, items = await plan_job(data)
+        async for indices, wav, sr in iter_batch_items(model_key, batch_fn, items):
+            await run_in_threadpool(_write_job_audio, job_dir, indices, wav, sr)
+            job["finished"].extend(indices)
+            _notify_job(job)
+        job["status"] = "completed"
+    except asyncio.CancelledError:
+        job["status"] = "cancelled"
+    except Exception as e:
+        job["status"] = "failed"
+        job["error"] = e.detail if isinstance(e, HTTPException) else str(e)
+    finally:
+        job["finished_at"] = datetime.now().isoformat()
+        _notify_job(job)
+
+
+async def _job_worker_loop():
+    """Worker du pool de jobs : exécute les jobs en file un par un."""
+    # Les jobs sont asynchrones : pas de deadline héritée de la requête qui a démarré le pool
+    request_deadline.set(None)
+    while True:
+        job_id = await _job_queue.get()
+        job = jobs.get(job_id)
+        # Job annulé ou supprimé avant son démarrage
+        if job is None or job["status"] != "queued":
+            continue
+        job["_task"] = asyncio.ensure_future(_run_job(job))
+        await asyncio.wait({job["_task"]})
+
+
+def _ensure_job_workers():
+    """Démarre le pool de workers de jobs au premier job soumis."""
+    global _job_queue
+    if _job_queue is None:
+        _job_queue = asyncio.Queue()
+        for _ in range(max(1, JOB_WORKERS)):
+            _job_workers.append(asyncio.ensure_future(_job_worker_loop()))
+
+
+def cancel_job(job: Dict[str, Any]):
+    """Annule un job en file ou en cours (sans effet sur un job terminé)."""
+    if job["status"] == "queued":
+        job["status"] = "cancelled"
+        job["finished_at"] = datetime.now().isoformat()
+        _notify_job(job)
+    elif job["status"] == "running" and job.get("_task") is not None:
+        job["_task"].cancel()
+
+
+async def remove_job(job: Dict[str, Any]):
+    """
+    Annule un job si nécessaire, attend l'arrêt de son worker puis supprime ses fichiers.
+
+    L'annulation d'une tâche en cours d'écriture (run_in_threadpool) n'aboutit
+    qu'au retour de l'écriture : une fois la tâche terminée, plus rien n'écrit
+    dans le répertoire du job.
+    """
+    cancel_job(job)
+    task = job.get("_task")
+    if task is not None and not task.done():
+        await asyncio.wait({task})
+    jobs.pop(job["job_id"], None)
+    await run_in_threadpool(shutil.rmtree, JOBS_DIR / job["job_id"], True)
+
+
+def _job_expired(job: Dict[str, Any], now: datetime) -> bool:
+    if job["status"] not in JOB_TERMINAL_STATES or job["finished_at"] is None:
+        return False
+    return (now - datetime.fromisoformat(job["finished_at"])).total_seconds() > JOB_TTL_HOURS * 3600
+
+
+async def sweep_jobs() -> int:
+    """
+    Supprime les jobs terminés depuis plus de VOXQWEN_JOB_TTL_HOURS.
+
+    Les répertoires de OUTPUTS_DIR/jobs sans job connu (restes d'une exécution
+    précédente : les jobs ne survivent pas au redémarrage) sont supprimés aussi.
+
+    Returns:
+        Nombre de répertoires supprimés
+    """
+    now = datetime.now()
+    expired = [job for job in jobs.values() if _job_expired(job, now)]
+    for job in expired:
+        await remove_job(job)
+    orphans = [path for path in JOBS_DIR.iterdir() if path.is_dir() and path.name not in jobs] if JOBS_DIR.exists() else []
+    for path in orphans:
+        await run_in_threadpool(shutil.rmtree, path, True)
+    return len(expired) + len(orphans)
+
+
+async def _job_maintenance_loop():
+    """Purge les jobs expirés, et au démarrage les répertoires orphelins."""
+    while True:
+        try:
+            removed = await sweep_jobs()
+            if removed:
+                print(f"Jobs : {removed} repertoire(s) expire(s) supprime(s)")
+        except Exception as e:
+            print(f"Maintenance des jobs en erreur : {e}")
+        await asyncio.sleep(JOB_SWEEP_INTERVAL)
+
+
+def get_job_or_404(job_id: str) -> Dict[str, Any]:
+    """Retourne un job ou lève une 404."""
+    job = jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job '{job_id}' non trouvé")
+    return job
+
+
+def jobs_stats() -> Dict[str, int]:
+    """Nombre de jobs par statut."""
+    counts = collections.Counter(job["status"] for job in jobs.values())
+    return {"workers": JOB_WORKERS, **counts}
+
+
+@app.post("/jobs", status_code=202, tags=["Jobs"])
+async def create_job(data: JobRequest):
+    """
+    Crée un job de synthèse asynchrone (jusqu'à 1000 textes).
+
+    Le job est exécuté en arrière-plan par un pool de workers, indépendamment
+    de la connexion HTTP. Les audios sont écrits au fil de l'eau sur disque.
+
+    Types :
+    - **preset** : voix native ou personnalisée (`voice`)
+    - **design** : voix décrite en texte (`voice_instruct`)
+    - **clone** : prompt de clonage existant (`prompt_id`)
+
+    Retourne :
+    - job_id : Identifiant du job
+    - status : "queued"
+    - Liens de suivi (status, stream, download)
+    """
+    try:
+        validate_job(data)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    job_id = str(uuid.uuid4())
+    (JOBS_DIR / job_id).mkdir(parents=True, exist_ok=True)
+    jobs[job_id] = {
+        "job_id": job_id,
+        "type": data.type,
+        "status": "queued",
+        "total": len(data.texts),
+        "finished": [],
+        "error": None,
+        "created_at": datetime.now().isoformat(),
+        "started_at": None,
+        "finished_at": None,
+        "_request": data,
+        "_task": None,
+        "_event": asyncio.Event(),
+    }
+
+    _ensure_job_workers()
+    await _job_queue.put(job_id)
+
+    return {
+        "job_id": job_id,
+        "status": "queued",
+        "total": len(data.texts),
+        "status_url": f"/jobs/{job_id}",
+        "stream_url": f"/jobs/{job_id}/stream",
+        "download_url": f"/jobs/{job_id}/download",
+    }
+
+
+@app.get("/jobs", tags=["Jobs"])
+async def list_jobs():
+    """Liste les jobs connus et leur progression."""
+    return {
+        "jobs": [job_summary(job) for job in jobs.values()],
+        "count": len(jobs),
+    }
+
+
+@app.get("/jobs/{job_id}", tags=["Jobs"])
+async def get_job(job_id: str):
+    """
+    Statut et progression d'un job.
+
+    Retourne : status, total, completed, progress et la liste des éléments terminés.
+    """
+    return job_summary(get_job_or_404(job_id))
+
+
+@app.get("/jobs/{job_id}/stream", tags=["Jobs"])
+async def stream_job(job_id: str):
+    """
+    Suit un job en direct (NDJSON).
+
+    Émet une ligne JSON par élément terminé ({"event": "item", "index", "url"}),
+    puis une ligne finale {"event": "end", "status"} quand le job est terminé.
+    """
+    job = get_job_or_404(job_id)
+
+    async def events():
+        sent = 0
+        while True:
+            event = job["_event"]
+            while sent < len(job["finished"]):
+                index = job["finished"][sent] + 1
+                yield json.dumps({"event": "item", "index": index, "url": f"/jobs/{job_id}/items/{index}"}) + "\n"
+                sent += 1
+            if job["status"] in JOB_TERMINAL_STATES:
+                yield json.dumps({"event": "end", "status": job["status"], "error": job["error"]}) + "\n"
+                return
+            await event.wait()
+
+    return StreamingResponse(events(), media_type="application/x-ndjson")
+
+
+@app.get("/jobs/{job_id}/items/{index}", tags=["Jobs"])
+async def get_job_item(job_id: str, index: int):
+    """Télécharge l'audio d'un élément terminé (index à partir de 1)."""
+    job = get_job_or_404(job_id)
+    if index - 1 not in job["finished"]:
+        raise HTTPException(status_code=404, detail=f"Élément {index} non disponible")
+    return FileResponse(
+        JOBS_DIR / job_id / f"{index:03d}.wav",
+        media_type="audio/wav",
+        filename=f"{index:03d}.wav",
+    )
+
+
+@app.get("/jobs/{job_id}/download", tags=["Jobs"])
+async def download_job(job_id: str):
+    """
+    Télécharge les audios terminés d'un job dans un ZIP (001.wav, 002.wav, ...).
+
+    Utilisable pendant l'exécution : le ZIP contient les éléments déjà terminés
+    (statut dans l'en-tête X-Job-Status).
+    """
+    job = get_job_or_404(job_id)
+    job_dir = JOBS_DIR / job_id
+
+    def build_zip() -> io.BytesIO:
+        zip_buffer = io.BytesIO()
+        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zf:
+            for i in sorted(job["finished"]):
+                filename = f"{i+1:03d}.wav"
+                zf.write(job_dir / filename, filename)
+        zip_buffer.seek(0)
+        return zip_buffer
+
+    zip_buffer = await run_in_threadpool(build_zip)
+    return StreamingResponse(
+        zip_buffer,
+        media_type="application/zip",
+        headers={
+            "Content-Disposition": f"attachment; filename=job_{job_id[:8]}.zip",
+            "X-Job-Status": job["status"],
+        }
+    )
+
+
+@app.post("/jobs/{job_id}/cancel", tags=["Jobs"])
+async def cancel_job_route(job_id: str):
+    """
+    Annule un job en file ou en cours.
+
+    Les éléments déjà générés restent téléchargeables.
+    """
+    job = get_job_or_404(job_id)
+    cancel_job(job)
+    return {"job_id": job_id, "status": job["status"] if job["status"] != "running" else "cancelling"}
+
+
+@app.delete("/jobs/{job_id}", tags=["Jobs"])
+async def delete_job(job_id: str):
+    """Annule un job si nécessaire et supprime ses fichiers (après l'arrêt de sa génération)."""
+    await remove_job(get_job_or_404(job_id))
+    return {"status": "deleted", "job_id": job_id}
+
+
 # ==============================================================================
 # TOKENIZER API
 # ==============================================================================
 
+# Tokenizer texte chargé seul depuis les fichiers du modèle (sans les poids)
+_text_tokenizer = None
+_text_tokenizer_lock = threading.Lock()
+tokenizer_status = {"state": "not_loaded", "source": None, "path": None, "elapsed_seconds": None}
+
+
+def _tokenizer_model_dir() -> Optional[Path]:
+    """Premier répertoire de modèle local contenant les fichiers du tokenizer texte."""
+    # Tous les checkpoints Qwen3-TTS partagent le même tokenizer texte
+    for model_key in ("preset_voice", "clone_0_6b", "voice_clone", "clone_1_7b", "voice_design"):
+        model_dir = MODELS_DIR / MODEL_NAMES[model_key]
+        if (model_dir / "tokenizer_config.json").exists() or (model_dir / "vocab.json").exists():
+            return model_dir
+    return None
+
+
+def _model_text_tokenizer(model):
+    """Extrait le tokenizer texte d'un modèle chargé."""
+    if hasattr(model, 'processor') and hasattr(model.processor, 'tokenizer'):
+        return model.processor.tokenizer
+    if hasattr(model, 'tokenizer'):
+        return model.tokenizer
+    return None
+
+
+def load_text_tokenizer():
+    """
+    Charge le tokenizer texte sans charger les poids du modèle.
+
+    Lit les fichiers tokenizer (vocab, merges, config) du premier checkpoint
+    local : quelques Mo et une fraction de seconde, au lieu du modèle 0.6B
+    entier sur le device. Repli sur le modèle preset si les fichiers manquent
+    ou si transformers ne sait pas les charger seuls.
+    """
+    global _text_tokenizer
+    if _text_tokenizer is not None:
+        return _text_tokenizer
+
+    with _text_tokenizer_lock:
+        if _text_tokenizer is not None:
+            return _text_tokenizer
+
+        started = time.perf_counter()
+        tokenizer = None
+        model_dir = _tokenizer_model_dir()
+        if model_dir is not None:
+            try:
+                from transformers import AutoTokenizer
+                tokenizer = AutoTokenizer.from_pretrained(str(model_dir))
+                tokenizer_status.update({"source": "files", "path": str(model_dir)})
+            except Exception as e:
+                print(f"Tokenizer seul non chargeable depuis {model_dir} ({e}), repli sur le modele preset")
+
+        if tokenizer is None:
+            tokenizer = _model_text_tokenizer(load_preset_voice_model())
+            if tokenizer is None:
+                raise HTTPException(
+                    status_code=500,
+                    detail="Tokenizer non disponible sur ce modèle"
+                )
+            tokenizer_status.update({"source": "model", "path": str(MODELS_DIR / MODEL_NAMES["preset_voice"])})
+
+        tokenizer_status.update({
+            "state": "loaded",
+            "elapsed_seconds": round(time.perf_counter() - started, 3),
+        })
+        _text_tokenizer = tokenizer
+        return _text_tokenizer
+
+
+def encode_texts(texts: List[str]) -> List[List[int]]:
+    """Encode plusieurs textes en un appel (tokenizer rapide : batch natif)."""
+    tokenizer = load_text_tokenizer()
+    return tokenizer(texts)["input_ids"]
+
+
+def decode_sequences(sequences: List[List[int]]) -> List[str]:
+    """Décode plusieurs séquences de tokens en un appel."""
+    tokenizer = load_text_tokenizer()
+    return tokenizer.batch_decode(sequences)
+
+
 @app.post("/tokenizer/encode", tags=["Tokenizer"])
 async def tokenizer_encode(request: TokenizeRequest):
     """
     Encode un texte en tokens.
 
     Utilise le tokenizer de Qwen3-TTS pour convertir du texte en liste de tokens.
+    Le tokenizer est chargé seul, sans les poids du modèle.
 
     Retourne :
     - text : Le texte original
@@ -1911,24 +6025,7 @@ async def tokenizer_encode(request: TokenizeRequest):
     - count : Nombre de tokens
     """
     try:
-        # Charger n'importe quel modèle pour accéder au tokenizer
-        # Le modèle preset est le plus léger
-        model = load_preset_voice_model()
-
-        # Accéder au tokenizer via le processor
-        tokenizer = None
-        if hasattr(model, 'processor') and hasattr(model.processor, 'tokenizer'):
-            tokenizer = model.processor.tokenizer
-        elif hasattr(model, 'tokenizer'):
-            tokenizer = model.tokenizer
-
-        if tokenizer is None:
-            raise HTTPException(
-                status_code=500,
-                detail="Tokenizer non disponible sur ce modèle"
-            )
-
-        tokens = tokenizer.encode(request.text)
+        tokens = (await run_in_threadpool(encode_texts, [request.text]))[0]
 
         return {
             "text": request.text,
@@ -1948,6 +6045,7 @@ async def tokenizer_decode(request: DetokenizeRequest):
     Décode une liste de tokens en texte.
 
     Utilise le tokenizer de Qwen3-TTS pour convertir des tokens en texte.
+    Le tokenizer est chargé seul, sans les poids du modèle.
 
     Retourne :
     - tokens : La liste de tokens originale
@@ -1955,23 +6053,7 @@ async def tokenizer_decode(request: DetokenizeRequest):
     - count : Nombre de tokens
     """
     try:
-        # Charger n'importe quel modèle pour accéder au tokenizer
-        model = load_preset_voice_model()
-
-        # Accéder au tokenizer via le processor
-        tokenizer = None
-        if hasattr(model, 'processor') and hasattr(model.processor, 'tokenizer'):
-            tokenizer = model.processor.tokenizer
-        elif hasattr(model, 'tokenizer'):
-            tokenizer = model.tokenizer
-
-        if tokenizer is None:
-            raise HTTPException(
-                status_code=500,
-                detail="Tokenizer non disponible sur ce modèle"
-            )
-
-        text = tokenizer.decode(request.tokens)
+        text = (await run_in_threadpool(decode_sequences, [request.tokens]))[0]
 
         return {
             "tokens": request.tokens,
@@ -1985,38 +6067,93 @@ async def tokenizer_decode(request: DetokenizeRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/tokenizer/encode/batch", tags=["Tokenizer"])
+async def tokenizer_encode_batch(request: BatchTokenizeRequest):
+    """
+    Encode plusieurs textes en tokens en un seul appel.
+
+    Pratique pour découper un texte côté client ou estimer un coût :
+    `return_tokens=false` ne renvoie que les comptes.
+
+    Retourne :
+    - counts : Nombre de tokens par texte
+    - total : Nombre total de tokens
+    - tokens : Listes d'IDs de tokens (si return_tokens)
+    """
+    try:
+        sequences = await run_in_threadpool(encode_texts, request.texts)
+        counts = [len(tokens) for tokens in sequences]
+
+        result = {
+            "counts": counts,
+            "total": sum(counts),
+            "count": len(sequences),
+        }
+        if request.return_tokens:
+            result["tokens"] = sequences
+        return result
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.post("/tokenizer/decode/batch", tags=["Tokenizer"])
+async def tokenizer_decode_batch(request: BatchDetokenizeRequest):
+    """
+    Décode plusieurs séquences de tokens en un seul appel.
+
+    Retourne :
+    - texts : Textes décodés
+    - counts : Nombre de tokens par séquence
+    - total : Nombre total de tokens
+    """
+    try:
+        texts = await run_in_threadpool(decode_sequences, request.sequences)
+        counts = [len(tokens) for tokens in request.sequences]
+
+        return {
+            "texts": texts,
+            "counts": counts,
+            "total": sum(counts),
+            "count": len(texts),
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 # ==============================================================================
 # MCP ROUTES (JSON-based for MCP compatibility)
 # ==============================================================================
 
 @app.post("/mcp/preset", response_model=MCPAudioResponse, tags=["MCP Tools"])
 @limiter.limit(MCP_RATE_LIMIT)
-def mcp_preset_voice(request: Request, data: MCPPresetRequest):
+async def mcp_preset_voice(request: Request, data: MCPPresetRequest):
     """
     [MCP Tool] Génère un audio avec une voix préréglée.
 
     Retourne l'audio encodé en base64 pour compatibilité MCP.
     Limite: 2000 caractères max pour le texte.
     """
+    tighten_deadline(data.deadline_ms)
     try:
         # Résoudre la langue
         language_full = resolve_language(data.language, data.text)
 
         # Vérifier si c'est une voix native
         if data.voice in PRESET_VOICES:
-            model = load_preset_voice_model()
-            wavs, sr = model.generate_custom_voice(
-                text=data.text,
-                language=language_full,
-                speaker=data.voice,
-            )
+            wavs, sr = await run_for_request(request, synthesize_preset(data.text, language_full, data.voice, data.seed))
             model_used = "0.6B-CustomVoice"
 
         # Vérifier si c'est une voix personnalisée
         elif data.voice in custom_voices:
             voice_data = custom_voices[data.voice]
             meta = voice_data["meta"]
-            prompt_items = get_custom_voice_prompt(data.voice)
+            prompt_items = await run_in_threadpool(get_custom_voice_prompt, data.voice)
 
             if prompt_items is None:
                 raise HTTPException(
@@ -2024,23 +6161,8 @@ def mcp_preset_voice(request: Request, data: MCPPresetRequest):
                     detail={"error": f"Impossible de charger la voix '{data.voice}'", "code": "VOICE_LOAD_ERROR"}
                 )
 
-            if meta.get("source") == "design" and isinstance(prompt_items, dict) and prompt_items.get("type") == "design":
-                tts_model = load_voice_design_model()
-                wavs, sr = tts_model.generate_voice_design(
-                    text=data.text,
-                    language=language_full,
-                    instruct=prompt_items["voice_description"],
-                )
-                model_used = "1.7B-VoiceDesign"
-            else:
-                model_size = meta.get("model", "1.7B")
-                tts_model = load_clone_base_model(model_size)
-                wavs, sr = tts_model.generate_voice_clone(
-                    text=data.text,
-                    language=language_full,
-                    voice_clone_prompt=prompt_items,
-                )
-                model_used = f"{model_size}-Base"
+            wavs, sr = await run_for_request(request, synthesize_custom(meta, prompt_items, data.text, language_full, data.seed))
+            model_used = MODEL_NAMES[custom_voice_model_key(meta, prompt_items)]
         else:
             all_voices = list(PRESET_VOICES.keys()) + list(custom_voices.keys())
             raise HTTPException(
@@ -2076,21 +6198,19 @@ def mcp_preset_voice(request: Request, data: MCPPresetRequest):
 
 @app.post("/mcp/design", response_model=MCPAudioResponse, tags=["MCP Tools"])
 @limiter.limit(MCP_RATE_LIMIT)
-def mcp_voice_design(request: Request, data: MCPDesignRequest):
+async def mcp_voice_design(request: Request, data: MCPDesignRequest):
     """
     [MCP Tool] Génère un audio avec une voix décrite en langage naturel.
 
     Utilise le modèle 1.7B-VoiceDesign pour créer une voix à partir d'une description.
     """
+    tighten_deadline(data.deadline_ms)
     try:
-        model = load_voice_design_model()
         language_full = resolve_language(data.language, data.text)
 
-        wavs, sr = model.generate_voice_design(
-            text=data.text,
-            language=language_full,
-            instruct=data.voice_description,
-        )
+        wavs, sr = await run_for_request(request, synthesize_design(
+            data.text, language_full, data.voice_description, data.seed
+        ))
 
         # Encoder en base64
         audio_buffer = io.BytesIO()
@@ -2108,13 +6228,15 @@ def mcp_voice_design(request: Request, data: MCPDesignRequest):
             model_used="1.7B-VoiceDesign",
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail={"error": str(e), "code": "GENERATION_ERROR"})
 
 
 @app.post("/mcp/clone", response_model=MCPAudioResponse, tags=["MCP Tools"])
 @limiter.limit(MCP_RATE_LIMIT)
-def mcp_voice_clone(request: Request, data: MCPCloneRequest):
+async def mcp_voice_clone(request: Request, data: MCPCloneRequest):
     """
     [MCP Tool] Génère un audio avec une voix clonée.
 
@@ -2123,8 +6245,9 @@ def mcp_voice_clone(request: Request, data: MCPCloneRequest):
     ⚠️ ATTENTION: Les prompts sont stockés en MÉMOIRE uniquement.
     Ils sont perdus au redémarrage du serveur.
     """
+    tighten_deadline(data.deadline_ms)
     try:
-        prompt_data = get_prompt(data.prompt_id)
+        prompt_data = await load_prompt(data.prompt_id)
         if not prompt_data:
             raise HTTPException(
                 status_code=404,
@@ -2136,14 +6259,12 @@ def mcp_voice_clone(request: Request, data: MCPCloneRequest):
             )
 
         model_size = prompt_data["model"]
-        tts_model = load_clone_base_model(model_size)
         language_full = resolve_language(data.language, data.text)
 
-        wavs, sr = tts_model.generate_voice_clone(
-            text=data.text,
-            language=language_full,
-            voice_clone_prompt=prompt_data["prompt_items"],
-        )
+        wavs, sr = await run_for_request(request, synthesize_clone(
+            model_size, prompt_data["prompt_items"], data.text, language_full,
+            prompt_key=data.prompt_id, seed=data.seed,
+        ))
 
         # Encoder en base64
         audio_buffer = io.BytesIO()
@@ -2170,7 +6291,7 @@ def mcp_voice_clone(request: Request, data: MCPCloneRequest):
 
 @app.post("/mcp/clone/prompt", response_model=MCPPromptResponse, tags=["MCP Tools"])
 @limiter.limit(MCP_RATE_LIMIT)
-def mcp_create_clone_prompt(request: Request, data: MCPCreatePromptRequest):
+async def mcp_create_clone_prompt(request: Request, data: MCPCreatePromptRequest):
     """
     [MCP Tool] Crée un prompt réutilisable pour clonage vocal.
 
@@ -2178,6 +6299,7 @@ def mcp_create_clone_prompt(request: Request, data: MCPCreatePromptRequest):
 
     ⚠️ ATTENTION: Les prompts sont stockés en MÉMOIRE uniquement.
     """
+    tighten_deadline(data.deadline_ms)
     tmp_path = None
     try:
         # Décoder le base64
@@ -2202,29 +6324,23 @@ def mcp_create_clone_prompt(request: Request, data: MCPCreatePromptRequest):
             tmp_path = tmp.name
 
         # Vérifier la durée
-        import torchaudio
-        waveform, sample_rate = torchaudio.load(tmp_path)
-        duration = waveform.shape[1] / sample_rate
+        duration = await run_in_threadpool(get_audio_duration, tmp_path)
 
         if duration < 1:
             raise HTTPException(status_code=422, detail={"error": f"Audio trop court: {duration:.1f}s (min: 1s)", "code": "AUDIO_TOO_SHORT"})
         if duration > 30:
             raise HTTPException(status_code=422, detail={"error": f"Audio trop long: {duration:.1f}s (max: 30s)", "code": "AUDIO_TOO_LONG"})
 
-        # Créer le prompt
-        tts_model = load_clone_base_model(data.model)
-        prompt_items = tts_model.create_voice_clone_prompt(
-            ref_audio=tmp_path,
-            ref_text=data.reference_text,
-        )
-
-        # Stocker le prompt
-        prompt_id = store_prompt(prompt_items, data.model, data.name)
-        prompt_data = get_prompt(prompt_id)
+        # Créer le prompt (réutilisé si cette référence a déjà été envoyée)
+        prompt_id, _, cached = await run_for_request(request, get_or_create_reference_prompt(
+            data.model, tmp_path, data.reference_text, data.name
+        ))
+        prompt_data = prompt_store.info(prompt_id)
 
         return MCPPromptResponse(
             prompt_id=prompt_id,
-            name=data.name,
+            name=prompt_data.get("name"),
+            cached=cached,
             model=data.model,
             created_at=prompt_data["created_at"].isoformat(),
         )
@@ -2240,13 +6356,14 @@ def mcp_create_clone_prompt(request: Request, data: MCPCreatePromptRequest):
 
 @app.post("/mcp/preset/instruct", response_model=MCPAudioResponse, tags=["MCP Tools"])
 @limiter.limit(MCP_RATE_LIMIT)
-def mcp_preset_instruct(request: Request, data: MCPPresetInstructRequest):
+async def mcp_preset_instruct(request: Request, data: MCPPresetInstructRequest):
     """
     [MCP Tool] Génère un audio avec contrôle émotionnel/style.
 
     Utilise le modèle 1.7B-CustomVoice pour un contrôle fin des émotions.
     Voix natives uniquement (Serena, Vivian, etc.).
     """
+    tighten_deadline(data.deadline_ms)
     try:
         if data.voice not in PRESET_VOICES:
             raise HTTPException(
@@ -2258,15 +6375,12 @@ def mcp_preset_instruct(request: Request, data: MCPPresetInstructRequest):
                 }
             )
 
-        model = load_voice_clone_model()  # 1.7B-CustomVoice
         language_full = resolve_language(data.language, data.text)
 
-        wavs, sr = model.generate_custom_voice(
-            text=data.text,
-            language=language_full,
-            speaker=data.voice,
-            instruct=data.instruct if data.instruct else "",
-        )
+        # 1.7B-CustomVoice
+        wavs, sr = await run_for_request(request, synthesize_instruct(
+            data.text, language_full, data.voice, data.instruct if data.instruct else "", data.seed
+        ))
 
         # Encoder en base64
         audio_buffer = io.BytesIO()
@@ -2320,18 +6434,14 @@ def mcp_get_status():
         "mcp_enabled": mcp_server is not None,
         "version": API_VERSION,
         "device": DEVICE,
-        "models": {
-            "voice_design_loaded": voice_design_model is not None,
-            "voice_clone_loaded": voice_clone_model is not None,
-            "preset_voice_loaded": preset_voice_model is not None,
-            "clone_1_7b_loaded": clone_model_1_7b is not None,
-            "clone_0_6b_loaded": clone_model_0_6b is not None,
-        },
+        "models": model_manager.loaded_flags(),
+        "loading": model_load_status,
         "voices": {
             "native_count": len(PRESET_VOICES),
             "custom_count": len(custom_voices),
         },
-        "prompts_cached": len(voice_clone_prompts),
+        "prompts_cached": len(prompt_store),
+        "inference": inference_executor.stats(),
     }
 
 
@@ -2612,12 +6722,8 @@ def get_voices_for_template() -> dict:
 def get_models_status_for_template() -> dict:
     """Retourne le statut des modèles pour le template."""
     return {
-        "voice_design_loaded": voice_design_model is not None,
-        "voice_clone_loaded": voice_clone_model is not None,
-        "preset_voice_loaded": preset_voice_model is not None,
-        "clone_1_7b_loaded": clone_model_1_7b is not None,
-        "clone_0_6b_loaded": clone_model_0_6b is not None,
-        "prompts_cached": len(voice_clone_prompts),
+        **model_manager.loaded_flags(),
+        "prompts_cached": len(prompt_store),
     }
 
 
@@ -2674,9 +6780,8 @@ mcp_server.mount()
 if __name__ == "__main__":
     import uvicorn
 
-    # Charger les voix personnalisées au démarrage
-    load_custom_voices()
-    custom_count = len(custom_voices)
+    # Les voix personnalisées sont chargées par le lifespan (voir start_background_tasks)
+    custom_count = sum(1 for _ in CUSTOM_VOICES_DIR.glob("*/meta.json"))
 
     langdetect_status = "Oui" if langdetect_available else "Non (pip install langdetect)"
 
@@ -0,0 +1,58 @@
+"""
+Tests unitaires rapides de main.py (sans modèle téléchargé ni serveur).
+
+Les modèles sont remplacés par des stubs, ou par un talker Qwen3-TTS minuscule
+initialisé aléatoirement sur CPU. Les tests live du serveur restent dans Test/.
+
+Usage:
+    python -m pytest -q
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+@pytest.fixture(scope="session")
+def main():
+    """Module main importé une seule fois (routes, exécuteur, caches)."""
+    import main as main_module
+    return main_module
+
+
+def tiny_talker_model(model_type: str = "custom_voice"):
+    """Qwen3TTSForConditionalGeneration minuscule, poids aléatoires (seed fixe), sur CPU."""
+    import torch
+    from qwen_tts.core.models.configuration_qwen3_tts import Qwen3TTSConfig
+    from qwen_tts.core.models.modeling_qwen3_tts import Qwen3TTSForConditionalGeneration
+
+    torch.manual_seed(0)
+    config = Qwen3TTSConfig(
+        tts_model_type=model_type,
+        talker_config=dict(
+            vocab_size=4300, hidden_size=64, intermediate_size=128, num_hidden_layers=2,
+            num_attention_heads=4, num_key_value_heads=2, text_hidden_size=32, text_vocab_size=151700,
+            num_code_groups=4,
+            rope_scaling={"rope_type": "default", "mrope_section": [4, 2, 2], "interleaved": True},
+            spk_id={"serena": 4000}, spk_is_dialect={"serena": False},
+            codec_language_id={"french": 4100, "english": 4101},
+            code_predictor_config=dict(
+                vocab_size=2048, hidden_size=32, intermediate_size=64, num_hidden_layers=1,
+                num_attention_heads=2, num_key_value_heads=1, head_dim=16, num_code_groups=4,
+            ),
+        ),
+        speaker_encoder_config=dict(enc_dim=64),
+    )
+    config._attn_implementation = "sdpa"
+    config.talker_config._attn_implementation = "sdpa"
+    config.talker_config.code_predictor_config._attn_implementation = "sdpa"
+    return Qwen3TTSForConditionalGeneration(config).eval()
+
+
+def text_ids(n: int, start: int):
+    """Entrée texte au format du talker : <|im_start|>assistant\\n + n tokens + fin."""
+    import torch
+    return torch.tensor([[151644, 77091, 198] + list(range(start, start + n)) + [151645, 198, 151644, 77091, 198]])
@@ -0,0 +1,36 @@
+"""Cache audio et dédoublonnage : un seul miss et une seule écriture par génération partagée."""
+
+import asyncio
+
+import numpy as np
+
+
+def test_coalesced_requests_count_and_store_once(main, tmp_path, monkeypatch):
+    cache = main.AudioCache(tmp_path, 1 << 20, 0)
+    monkeypatch.setattr(main, "audio_cache", cache)
+    monkeypatch.setattr(main, "request_coalescer", main.RequestCoalescer())
+    generations = []
+
+    async def generate():
+        generations.append(1)
+        await asyncio.sleep(0.05)
+        return [np.zeros(240, dtype=np.float32)], 24000
+
+    async def request():
+        status = {}
+        main.audio_cache_status.set(status)
+        wavs, sr = await main.cached_generation("cle", "", generate)
+        return status.get("status"), len(wavs[0]), sr
+
+    async def scenario():
+        first = await asyncio.gather(*[request() for _ in range(3)])
+        return first, await request()
+
+    concurrent, later = asyncio.run(scenario())
+
+    assert len(generations) == 1
+    assert concurrent == [("MISS", 240, 24000)] * 3
+    assert later == ("HIT", 240, 24000)
+    stats = cache.stats()
+    assert (stats["misses"], stats["stores"], stats["memory_hits"]) == (1, 1, 1)
+    assert main.request_coalescer.stats()["coalesced"] == 2
@@ -0,0 +1,50 @@
+"""Annulation : support de stopping_criteria par modèle et clients déconnectés."""
+
+import asyncio
+
+import pytest
+
+
+@pytest.fixture
+def worker_context(main, monkeypatch):
+    monkeypatch.setattr(main, "_stop_unsupported", set())
+    context = main._worker_context
+    context.cancel_event = main.threading.Event()
+    yield context
+    context.cancel_event = None
+    context.model_key = None
+
+
+def test_stopping_criteria_support_is_tracked_per_model(main, worker_context):
+    calls = []
+
+    def without_criteria(text):
+        calls.append("without")
+        return text
+
+    def with_criteria(text, stopping_criteria=None):
+        calls.append(stopping_criteria is not None)
+        return text
+
+    worker_context.model_key = "preset_voice"
+    assert main.call_generate(without_criteria, text="a") == "a"
+    assert main._stop_unsupported == {"preset_voice"}
+
+    worker_context.model_key = "voice_design"
+    assert main.call_generate(with_criteria, text="b") == "b"
+    assert calls == ["without", True]
+
+
+def test_disconnected_client_gets_empty_standard_response(main):
+    class DisconnectedRequest:
+        async def is_disconnected(self):
+            return True
+
+    async def scenario():
+        with pytest.raises(main.ClientDisconnectedError) as raised:
+            await main.run_for_request(DisconnectedRequest(), asyncio.sleep(10))
+        return await main.client_disconnected_handler(None, raised.value)
+
+    response = asyncio.run(scenario())
+    assert response.status_code == 408
+    assert response.body == b""
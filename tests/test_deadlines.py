@@ -0,0 +1,109 @@
+"""Deadlines : admission, expiration en file, deadline intenable et interruption en cours."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+
+def test_parse_deadline_header(main):
+    now = time.perf_counter()
+    assert main.parse_deadline_header("2500") == pytest.approx(now + 2.5, abs=0.1)
+    assert main.parse_deadline_header(str(time.time() + 3)) == pytest.approx(now + 3, abs=0.1)
+    for value in ("0", "-5", "nan", "abc"):
+        with pytest.raises(ValueError):
+            main.parse_deadline_header(value)
+
+
+def _submit(main, executor, budget_s, fn, *args, **kwargs):
+    async def scenario():
+        main.request_deadline.set(time.perf_counter() + budget_s if budget_s is not None else None)
+        return await executor.submit("stub", fn, *args, **kwargs)
+    return scenario()
+
+
+def test_expired_deadline_is_refused_before_queueing(main):
+    executor = main.InferenceExecutor(1, 8)
+    ran = []
+    with pytest.raises(main.DeadlineExceededError):
+        asyncio.run(_submit(main, executor, -1, ran.append, 1))
+    assert ran == []
+    assert executor.stats()["models"]["stub"]["expired"] == 1
+
+
+def test_job_expiring_in_queue_never_runs(main):
+    executor = main.InferenceExecutor(1, 8)
+    release, ran = threading.Event(), []
+
+    async def scenario():
+        blocker = asyncio.ensure_future(_submit(main, executor, None, release.wait, 5))
+        await asyncio.sleep(0.05)
+        waiting = asyncio.ensure_future(_submit(main, executor, 0.05, ran.append, "late"))
+        await asyncio.sleep(0.15)
+        release.set()
+        await blocker
+        with pytest.raises(main.DeadlineExceededError, match="file"):
+            await waiting
+
+    asyncio.run(scenario())
+    assert ran == []
+
+
+def test_unreachable_deadline_is_dropped_from_measured_throughput(main):
+    executor = main.InferenceExecutor(1, 8)
+    executor._record_throughput("stub", 10, 1.0)  # 10 caractères/s
+    with pytest.raises(main.DeadlineExceededError, match="intenable"):
+        asyncio.run(_submit(main, executor, 1.0, lambda: "ok", cost=100))
+
+
+def test_running_job_is_interrupted_at_deadline(main):
+    executor = main.InferenceExecutor(1, 8)
+
+    def generation():
+        # Comme call_generate : s'arrête quand le travail est annulé
+        main._worker_context.cancel_event.wait(5)
+        return "tronqué"
+
+    started = time.perf_counter()
+    with pytest.raises(main.DeadlineExceededError, match="pendant la génération"):
+        asyncio.run(_submit(main, executor, 0.1, generation))
+    assert time.perf_counter() - started < 2
+    assert executor.stats()["models"]["stub"]["expired"] == 1
+
+
+def test_first_job_loading_the_model_does_not_set_throughput(main, monkeypatch):
+    executor = main.InferenceExecutor(1, 8)
+    manager = main.ModelManager(0, 0, set())
+    monkeypatch.setattr(manager, "_models", {})
+
+    def load(model_key, dtype):
+        time.sleep(0.3)  # Chargement lent, hors débit de génération
+        return object()
+
+    monkeypatch.setattr(main, "_from_pretrained", load)
+    monkeypatch.setattr(main, "_model_nbytes", lambda model: 0)
+
+    def generation():
+        manager.get("preset_voice")
+        return "audio"
+
+    assert asyncio.run(_submit(main, executor, None, generation, cost=100)) == "audio"
+    assert executor._measured_throughput("stub") is None
+
+    # Modèle résident : la génération suivante mesure le débit
+    assert asyncio.run(_submit(main, executor, None, generation, cost=100)) == "audio"
+    assert executor._measured_throughput("stub") > 1000
+    # Pas de refus d'admission ni d'abandon dû au chargement
+    executor.check_admission("stub", 100)
+    assert asyncio.run(_submit(main, executor, 1.0, generation, cost=100)) == "audio"
+
+
+def test_stale_throughput_does_not_drop_jobs(main, monkeypatch):
+    executor = main.InferenceExecutor(1, 8)
+    executor._record_throughput("stub", 10, 1.0)
+    monkeypatch.setattr(main, "THROUGHPUT_MAX_AGE_SECONDS", 0)
+    time.sleep(0.01)
+
+    assert asyncio.run(_submit(main, executor, 1.0, lambda: "ok", cost=100)) == "ok"
+    executor.check_admission("stub", 10_000)
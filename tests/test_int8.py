@@ -0,0 +1,58 @@
+"""Int8Linear : écart borné avec nn.Linear, dans les deux modes et sur les formes non alignées."""
+
+import pytest
+import torch
+
+
+def _relative_error(actual, expected):
+    return ((actual - expected).norm() / expected.norm()).item()
+
+
+@pytest.mark.parametrize("mode,tolerance", [("weight", 0.01), ("dynamic", 0.02)])
+@pytest.mark.parametrize("in_features,out_features", [(64, 96), (60, 30)])  # 60/30 : hors contraintes de _int_mm
+def test_matches_linear(main, mode, tolerance, in_features, out_features):
+    torch.manual_seed(0)
+    linear = torch.nn.Linear(in_features, out_features)
+    layer = main.Int8Linear.from_linear(linear, mode)
+    x = torch.randn(2, 5, in_features)
+
+    with torch.no_grad():
+        expected = linear(x)
+        actual = layer(x)
+
+    assert actual.shape == expected.shape
+    assert _relative_error(actual, expected) < tolerance
+
+
+def test_weight_mode_dequantizes_in_blocks(main, monkeypatch):
+    monkeypatch.setattr(main, "INT8_DEQUANT_BLOCK_BYTES", 16 * 4 * 7)  # 7 lignes par bloc
+    torch.manual_seed(0)
+    linear = torch.nn.Linear(64, 16, bias=False)
+    layer = main.Int8Linear.from_linear(linear, "weight")
+    assert layer.block_rows == 7
+    x = torch.randn(3, 64)
+
+    reference = x @ (layer.weight_int8.to(torch.float32) * layer.weight_scale)
+    assert torch.allclose(layer(x), reference, atol=1e-5)
+
+
+def test_int_mm_constraints(main):
+    cpu, cuda = torch.device("cpu"), torch.device("cuda")
+    assert main._int_mm_supported(1, 64, 64, cpu)
+    assert not main._int_mm_supported(1, 60, 64, cpu)
+    assert not main._int_mm_supported(1, 64, 30, cpu)
+    assert not main._int_mm_supported(16, 64, 64, cuda)
+    assert main._int_mm_supported(17, 64, 64, cuda)
+
+
+def test_quantized_state_dict_roundtrip(main):
+    torch.manual_seed(0)
+    module = torch.nn.Sequential(torch.nn.Linear(32, 32), torch.nn.ReLU(), torch.nn.Linear(32, 16))
+    main.quantize_linears(module, "dynamic")
+    empty = torch.nn.Sequential(torch.nn.Linear(32, 32), torch.nn.ReLU(), torch.nn.Linear(32, 16))
+    main.quantize_linears(empty, "dynamic", from_weights=False)
+    empty.load_state_dict(module.state_dict())
+
+    x = torch.randn(4, 32)
+    assert torch.equal(empty(x), module(x))
+    assert empty[0].weight_int8.is_contiguous()
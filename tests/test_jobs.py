@@ -0,0 +1,61 @@
+"""Jobs asynchrones : expiration, répertoires orphelins et suppression d'un job en cours."""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+
+@pytest.fixture
+def jobs_dir(main, tmp_path, monkeypatch):
+    monkeypatch.setattr(main, "JOBS_DIR", tmp_path / "jobs")
+    monkeypatch.setattr(main, "jobs", {})
+    (tmp_path / "jobs").mkdir()
+    return tmp_path / "jobs"
+
+
+def _job(main, job_id, status, finished_at=None):
+    (main.JOBS_DIR / job_id).mkdir()
+    main.jobs[job_id] = {
+        "job_id": job_id, "status": status, "total": 1, "finished": [], "error": None,
+        "finished_at": finished_at.isoformat() if finished_at else None,
+        "_task": None, "_event": asyncio.Event(),
+    }
+    return main.jobs[job_id]
+
+
+def test_sweep_removes_expired_jobs_and_orphans(main, jobs_dir):
+    async def scenario():
+        now = datetime.now()
+        _job(main, "old", "completed", now - timedelta(hours=main.JOB_TTL_HOURS + 1))
+        _job(main, "recent", "cancelled", now)
+        _job(main, "running", "running")
+        (jobs_dir / "from-previous-run").mkdir()
+        return await main.sweep_jobs()
+
+    assert asyncio.run(scenario()) == 2
+    assert set(main.jobs) == {"recent", "running"}
+    assert sorted(path.name for path in jobs_dir.iterdir()) == ["recent", "running"]
+
+
+def test_delete_waits_for_running_worker(main, jobs_dir):
+    async def scenario():
+        job = _job(main, "busy", "running")
+        writes = []
+
+        async def worker():
+            # Comme _run_job : écriture dans un thread, annulation différée à son retour
+            while True:
+                await main.run_in_threadpool(lambda: (jobs_dir / "busy" / f"{len(writes)}.wav").write_bytes(b"x"))
+                writes.append(1)
+                await asyncio.sleep(0.001)
+
+        job["_task"] = asyncio.ensure_future(worker())
+        await asyncio.sleep(0.02)
+        await main.remove_job(job)
+        return job["_task"]
+
+    task = asyncio.run(scenario())
+    assert task.done()
+    assert "busy" not in main.jobs
+    assert not (jobs_dir / "busy").exists()
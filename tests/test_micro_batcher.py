@@ -0,0 +1,91 @@
+"""MicroBatcher : regroupement dans la fenêtre, plafond de lot et clés de lot (exécuteur stub)."""
+
+import asyncio
+
+import pytest
+
+
+@pytest.fixture
+def batches(main, monkeypatch):
+    """Lots reçus par l'exécuteur stub ; chaque élément produit l'audio "wav:<texte>"."""
+    received = []
+
+    async def submit(model_key, fn, items, cost=1, **kwargs):
+        received.append((model_key, [item[0] for item in items]))
+        await asyncio.sleep(0)
+        return fn(items)
+
+    monkeypatch.setattr(main.inference_executor, "submit", submit)
+    return received
+
+
+def batch_fn(items):
+    return [f"wav:{item[0]}" for item in items], 24000
+
+
+def test_requests_in_window_share_one_batch(main, batches):
+    batcher = main.MicroBatcher(window_ms=20, max_batch_size=8)
+
+    async def scenario():
+        return await asyncio.gather(*[
+            batcher.submit(("preset_voice",), "preset_voice", batch_fn, (text, "french", "Serena"))
+            for text in ("un", "deux", "trois")
+        ])
+
+    results = asyncio.run(scenario())
+    assert batches == [("preset_voice", ["un", "deux", "trois"])]
+    assert results == [(["wav:un"], 24000), (["wav:deux"], 24000), (["wav:trois"], 24000)]
+    assert batcher.stats()["largest_batch"] == 3
+
+
+def test_full_batch_flushes_before_window(main, batches):
+    batcher = main.MicroBatcher(window_ms=10_000, max_batch_size=2)
+
+    async def scenario():
+        return await asyncio.wait_for(asyncio.gather(*[
+            batcher.submit(("k",), "preset_voice", batch_fn, (text,)) for text in ("a", "b")
+        ]), timeout=1)
+
+    asyncio.run(scenario())
+    assert batches == [("preset_voice", ["a", "b"])]
+
+
+def test_window_closes_and_keys_stay_separate(main, batches):
+    batcher = main.MicroBatcher(window_ms=5, max_batch_size=8)
+
+    async def scenario():
+        first = asyncio.gather(
+            batcher.submit(("clone", 1), "clone_1_7b", batch_fn, ("a",)),
+            batcher.submit(("clone", 2), "clone_1_7b", batch_fn, ("b",)),
+        )
+        await first
+        # Après la fenêtre : nouveau lot
+        await batcher.submit(("clone", 1), "clone_1_7b", batch_fn, ("c",))
+
+    asyncio.run(scenario())
+    assert sorted(texts for _, texts in batches) == [["a"], ["b"], ["c"]]
+    assert batcher.stats()["batches"] == 3
+
+
+def test_cancelled_caller_is_left_out_of_batch(main, batches):
+    batcher = main.MicroBatcher(window_ms=20, max_batch_size=8)
+
+    async def scenario():
+        gone = asyncio.ensure_future(batcher.submit(("k",), "preset_voice", batch_fn, ("parti",)))
+        stays = asyncio.ensure_future(batcher.submit(("k",), "preset_voice", batch_fn, ("reste",)))
+        await asyncio.sleep(0)
+        gone.cancel()
+        return await stays
+
+    assert asyncio.run(scenario()) == (["wav:reste"], 24000)
+    assert batches == [("preset_voice", ["reste"])]
+
+
+def test_zero_window_runs_each_item_alone(main, batches):
+    batcher = main.MicroBatcher(window_ms=0)
+
+    async def scenario():
+        return await asyncio.gather(*[batcher.submit(("k",), "preset_voice", batch_fn, (t,)) for t in "ab"])
+
+    assert asyncio.run(scenario()) == [(["wav:a"], 24000), (["wav:b"], 24000)]
+    assert len(batches) == 2
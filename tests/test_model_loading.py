@@ -0,0 +1,52 @@
+"""Chargement des modèles : lecture préalable par plages et chargements parallèles."""
+
+import asyncio
+import threading
+
+import pytest
+
+
+def test_prefetch_reads_every_safetensors_range(main, tmp_path, monkeypatch):
+    monkeypatch.setattr(main, "PREFETCH_RANGE_BYTES", 1000)
+    monkeypatch.setattr(main, "PREFETCH_BLOCK_BYTES", 300)
+    (tmp_path / "speech_tokenizer").mkdir()
+    (tmp_path / "model.safetensors").write_bytes(b"x" * 2500)
+    (tmp_path / "speech_tokenizer" / "model.safetensors").write_bytes(b"y" * 700)
+    (tmp_path / "config.json").write_text("{}")
+
+    assert main.prefetch_checkpoint(tmp_path) == 3200
+
+
+def test_prefetch_range_stops_at_end_of_file(main, tmp_path, monkeypatch):
+    monkeypatch.setattr(main, "PREFETCH_BLOCK_BYTES", 64)
+    path = tmp_path / "model.safetensors"
+    path.write_bytes(b"z" * 100)
+    assert main._prefetch_range(path, 40, 1000) == 60
+
+
+def test_models_load_in_parallel(main, monkeypatch):
+    monkeypatch.setattr(main, "inference_executor", main.InferenceExecutor(1, 8))
+    # Chaque chargement attend l'autre : ne passe que s'ils tournent en même temps
+    both_loading = threading.Barrier(2, timeout=5)
+    loaded = []
+
+    def load(model_key):
+        both_loading.wait()
+        loaded.append(model_key)
+
+    asyncio.run(main.load_models(["voice_design", "preset_voice"], load))
+    assert sorted(loaded) == ["preset_voice", "voice_design"]
+
+
+def test_failed_load_is_reported_after_all_loads(main, monkeypatch):
+    monkeypatch.setattr(main, "inference_executor", main.InferenceExecutor(1, 8))
+    loaded = []
+
+    def load(model_key):
+        if model_key == "voice_design":
+            raise OSError("checkpoint absent")
+        loaded.append(model_key)
+
+    with pytest.raises(RuntimeError, match="voice_design : checkpoint absent"):
+        asyncio.run(main.load_models(["voice_design", "preset_voice"], load))
+    assert loaded == ["preset_voice"]
@@ -0,0 +1,92 @@
+"""ModelManager : LRU sous budget, modèles protégés et composants partagés (modèles stubs)."""
+
+import pytest
+import torch
+
+FLOAT = 4  # octets par paramètre float32
+
+
+class StubModel:
+    """Modèle chargé : talker de talker_params paramètres, speech tokenizer éventuellement partagé."""
+
+    def __init__(self, talker_params, codec):
+        self.model = torch.nn.Linear(talker_params, 1, bias=False)
+        self.model.speech_tokenizer = codec
+
+
+class StubCodec:
+    def __init__(self, params):
+        self.model = torch.nn.Linear(params, 1, bias=False)
+
+
+@pytest.fixture
+def manager_factory(main, monkeypatch):
+    busy = set()
+    monkeypatch.setattr(main.inference_executor, "is_busy", lambda key: key in busy)
+    monkeypatch.setattr(main, "_release_device_memory", lambda: None)
+
+    def factory(budget, models, estimates, pinned=()):
+        monkeypatch.setattr(main, "_from_pretrained", lambda key, dtype: models[key]())
+        monkeypatch.setattr(main, "_checkpoint_estimate", lambda key: estimates[key])
+        manager = main.ModelManager(budget, 0, set(pinned))
+        manager.busy = busy
+        return manager
+
+    return factory
+
+
+def test_lru_eviction_under_budget(main, manager_factory):
+    models = {key: (lambda: StubModel(1000, StubCodec(10))) for key in ("voice_design", "preset_voice", "clone_0_6b")}
+    estimates = dict.fromkeys(models, 1010 * FLOAT)
+    manager = manager_factory(2 * 1010 * FLOAT, models, estimates)
+
+    manager.get("voice_design")
+    manager.get("preset_voice")
+    manager.get("voice_design")  # preset_voice devient le moins récemment utilisé
+    manager.get("clone_0_6b")
+
+    assert manager.is_loaded("voice_design") and manager.is_loaded("clone_0_6b")
+    assert not manager.is_loaded("preset_voice")
+    assert manager.stats()["evictions"] == 1
+
+
+@pytest.mark.parametrize("protect", ["pin", "busy"])
+def test_pinned_or_busy_models_are_never_evicted(main, manager_factory, protect):
+    models = {key: (lambda: StubModel(1000, StubCodec(10))) for key in ("voice_design", "preset_voice")}
+    estimates = dict.fromkeys(models, 1010 * FLOAT)
+    manager = manager_factory(1010 * FLOAT, models, estimates)
+    manager.get("voice_design")
+    if protect == "pin":
+        manager.pin("voice_design")
+    else:
+        manager.busy.add("voice_design")
+
+    with pytest.raises(main.ServerOverloadedError):
+        manager.get("preset_voice")
+    assert manager.is_loaded("voice_design")
+    assert manager.stats()["refused"] == 1
+
+    manager.unpin("voice_design")
+    manager.busy.clear()
+    manager.get("preset_voice")
+    assert not manager.is_loaded("voice_design")
+
+
+def test_eviction_does_not_credit_shared_components(main, manager_factory):
+    # voice_design et preset_voice partagent leur codec : évincer l'un ne le libère pas
+    codec = StubCodec(500)
+    models = {
+        "voice_design": lambda: StubModel(1000, codec),
+        "preset_voice": lambda: StubModel(1000, codec),
+        "clone_0_6b": lambda: StubModel(750, StubCodec(500)),
+    }
+    estimates = {"voice_design": 1500 * FLOAT, "preset_voice": 1000 * FLOAT, "clone_0_6b": 1250 * FLOAT}
+    manager = manager_factory(2625 * FLOAT, models, estimates)
+    manager.get("voice_design")
+    manager.get("preset_voice")
+    assert manager._used_bytes() == 2500 * FLOAT
+
+    manager.get("clone_0_6b")
+
+    assert not manager.is_loaded("voice_design") and not manager.is_loaded("preset_voice")
+    assert manager._used_bytes() <= manager.budget
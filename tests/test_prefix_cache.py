@@ -0,0 +1,71 @@
+"""Cache de préfixe KV (user-019) : sortie identique avec et sans cache."""
+
+import pytest
+
+torch = pytest.importorskip("torch")
+pytest.importorskip("qwen_tts")
+
+from conftest import text_ids, tiny_talker_model
+
+GREEDY = dict(do_sample=False, subtalker_dosample=False, max_new_tokens=12, repetition_penalty=1.0)
+INSTRUCT = torch.tensor([[151644, 8948, 198] + list(range(500, 530)) + [151645, 198]])
+
+
+class Wrapper:
+    """Qwen3TTSModel expose le modèle HF via .model."""
+
+    def __init__(self, model):
+        self.model = model
+
+
+def generate_codes(model, n, start):
+    codes, _ = model.generate(
+        input_ids=[text_ids(n, start)], instruct_ids=[INSTRUCT],
+        languages=["french"], speakers=["serena"], **GREEDY,
+    )
+    return codes[0]
+
+
+def test_cached_output_matches_uncached(main):
+    baseline = tiny_talker_model()
+    cached = tiny_talker_model()
+    cache = main.PrefixKVCache(64 * 1024 * 1024)
+    cache.attach("tiny", Wrapper(cached))
+
+    for n, start in [(20, 1000), (15, 2000), (25, 3000)]:
+        assert torch.equal(generate_codes(baseline, n, start), generate_codes(cached, n, start))
+
+    stats = cache.stats()
+    assert stats["hits"] >= 2
+    assert stats["reused_tokens"] > 0
+
+
+def test_disabled_by_default(main):
+    model = tiny_talker_model()
+    forward = model.talker.forward
+    main.PrefixKVCache(0).attach("tiny", Wrapper(model))
+    assert model.talker.forward == forward
+
+
+def test_unsupported_calls_use_original_forward(main):
+    model = tiny_talker_model()
+    calls = []
+
+    def original_forward(*args, **kwargs):
+        calls.append(args)
+        return "original"
+
+    model.talker.forward = original_forward
+    cache = main.PrefixKVCache(64 * 1024 * 1024)
+    cache.attach("tiny", Wrapper(model))
+    embeds = torch.randn(1, 24, 64)
+
+    class OtherCache:
+        def get_seq_length(self):
+            return 0
+
+    # Type de cache inconnu, puis appel positionnel : forward d'origine, rien n'est mémorisé
+    assert model.talker.forward(inputs_embeds=embeds, past_key_values=OtherCache()) == "original"
+    assert model.talker.forward(embeds) == "original"
+    assert calls == [(), (embeds,)]
+    assert cache.stats()["entries"] == 0
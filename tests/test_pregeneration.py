@@ -0,0 +1,13 @@
+"""Hot set appris de la prégénération."""
+
+
+def test_record_counts_only_when_pregeneration_enabled(main, tmp_path, monkeypatch):
+    pregenerator = main.Pregenerator(tmp_path / "pregen.json", learn_top=10, idle_seconds=1)
+
+    monkeypatch.setattr(main, "PREGEN_ENABLED", False)
+    pregenerator.record("Vivian", "French", "Bonjour")
+    assert not pregenerator._counts
+
+    monkeypatch.setattr(main, "PREGEN_ENABLED", True)
+    pregenerator.record("Vivian", "French", "Bonjour")
+    assert sum(pregenerator._counts.values()) == 1
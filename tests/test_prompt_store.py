@@ -0,0 +1,70 @@
+"""Store de prompts : déchargement sur disque sans pickle et maintenance périodique."""
+
+import asyncio
+import time
+
+import torch
+from qwen_tts.inference.qwen3_tts_model import VoiceClonePromptItem
+
+
+def _prompt():
+    return [VoiceClonePromptItem(
+        ref_code=torch.arange(12).reshape(6, 2), ref_spk_embedding=torch.ones(8),
+        x_vector_only_mode=False, icl_mode=True, ref_text="Bonjour",
+    )]
+
+
+def test_idle_prompt_is_spilled_and_reloaded(main, tmp_path):
+    store = main.PromptStore(tmp_path, 1 << 20, 1 << 20, idle_ttl=60, disk_ttl=86400)
+    prompt_id = store.add(_prompt(), "1.7B")
+    store._entries[prompt_id]["last_used"] = time.time() - 120
+
+    store.maintain()
+    assert not store.is_resident(prompt_id)
+
+    # Fichier lisible sans exécuter de code : tenseurs et types simples
+    data = torch.load(tmp_path / f"{prompt_id}.pt", weights_only=True)
+    assert set(data[0]) == set(main.PROMPT_ITEM_FIELDS)
+
+    item = store.get(prompt_id)["prompt_items"][0]
+    assert isinstance(item, VoiceClonePromptItem)
+    assert torch.equal(item.ref_code, _prompt()[0].ref_code)
+    assert item.ref_text == "Bonjour" and item.icl_mode
+
+
+def test_legacy_prompt_files_still_load(main, tmp_path):
+    torch.save(_prompt(), tmp_path / "prompt.pt")
+    item = main.load_prompt_file(tmp_path / "prompt.pt")[0]
+    assert torch.equal(item.ref_spk_embedding, torch.ones(8))
+
+
+def test_periodic_maintenance_runs_without_requests(main, tmp_path, monkeypatch):
+    store = main.PromptStore(tmp_path, 1 << 20, 1 << 20, idle_ttl=60, disk_ttl=86400)
+    monkeypatch.setattr(main, "prompt_store", store)
+    monkeypatch.setattr(main, "PROMPT_MAINTENANCE_INTERVAL", 0.01)
+    prompt_id = store.add(_prompt(), "1.7B")
+    store._entries[prompt_id]["last_used"] = time.time() - 120
+
+    async def scenario():
+        task = asyncio.ensure_future(main._prompt_maintenance_loop())
+        for _ in range(200):
+            await asyncio.sleep(0.01)
+            if not store.is_resident(prompt_id):
+                break
+        task.cancel()
+
+    asyncio.run(scenario())
+    assert not store.is_resident(prompt_id)
+
+
+def test_legacy_design_voice_dict_loads_unchanged(main, tmp_path):
+    design = {"type": "design", "voice_description": "Voix grave et posée", "language": "french"}
+    torch.save(design, tmp_path / "prompt.pt")
+
+    prompt_items = main.load_prompt_file(tmp_path / "prompt.pt")
+    assert prompt_items == design
+    assert main.is_design_voice({"source": "design"}, prompt_items)
+
+    # Réécrit tel quel (déchargement du store ou sauvegarde de voix)
+    torch.save(main.prompt_state(prompt_items), tmp_path / "again.pt")
+    assert main.load_prompt_file(tmp_path / "again.pt") == design
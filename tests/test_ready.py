@@ -0,0 +1,87 @@
+"""/ready : transitions starting -> loading -> warming -> ready, et échecs (modèles stubs)."""
+
+import asyncio
+import json
+import threading
+
+import pytest
+
+
+@pytest.fixture
+def startup(main, monkeypatch):
+    """Démarrage isolé : exécuteur neuf, chargement et chauffe bloqués jusqu'à libération."""
+    status = {"state": "starting", "models": ["preset_voice"], "phases": {}}
+    monkeypatch.setattr(main, "startup_status", status)
+    monkeypatch.setattr(main, "PRELOAD_MODELS", ["preset_voice"])
+    monkeypatch.setattr(main, "WARMUP_ENABLED", True)
+    monkeypatch.setattr(main, "inference_executor", main.InferenceExecutor(1, 8))
+    gates = {"loading": threading.Event(), "warming": threading.Event()}
+    errors = {}
+
+    def step(phase):
+        def fn(model_key):
+            gates[phase].wait(5)
+            if phase in errors:
+                raise errors[phase]
+        return fn
+
+    class StubManager:
+        get = staticmethod(step("loading"))
+
+    monkeypatch.setattr(main, "model_manager", StubManager())
+    monkeypatch.setattr(main, "warmup_model", step("warming"))
+    return gates, errors
+
+
+async def probe(main):
+    response = await main.ready()
+    return response.status_code, json.loads(response.body)
+
+
+async def wait_for_state(main, state):
+    for _ in range(200):
+        if main.startup_status["state"] == state:
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError(f"état {state} non atteint : {main.startup_status['state']}")
+
+
+def test_ready_transitions(main, startup):
+    gates, _ = startup
+
+    async def scenario():
+        seen = [await probe(main)]
+        task = asyncio.ensure_future(main.preload_and_warmup())
+        for phase in ("loading", "warming"):
+            await wait_for_state(main, phase)
+            seen.append(await probe(main))
+            gates[phase].set()
+        await task
+        seen.append(await probe(main))
+        return seen
+
+    seen = asyncio.run(scenario())
+    assert [(code, body["state"]) for code, body in seen] == [
+        (503, "starting"), (503, "loading"), (503, "warming"), (200, "ready"),
+    ]
+    assert set(seen[-1][1]["phases"]) == {"loading_seconds", "warming_seconds"}
+
+
+def test_failed_warmup_stays_unready(main, startup):
+    gates, errors = startup
+    errors["warming"] = RuntimeError("noyau indisponible")
+    for gate in gates.values():
+        gate.set()
+
+    asyncio.run(main.preload_and_warmup())
+    code, body = asyncio.run(probe(main))
+    assert code == 503
+    assert body["state"] == "failed"
+    assert "warming" in body["error"] and "noyau indisponible" in body["error"]
+
+
+def test_unknown_preload_model_fails(main, startup, monkeypatch):
+    monkeypatch.setattr(main, "PRELOAD_MODELS", ["inconnu"])
+    asyncio.run(main.preload_and_warmup())
+    code, body = asyncio.run(probe(main))
+    assert (code, body["state"]) == (503, "failed")
@@ -0,0 +1,32 @@
+"""Prompts de référence : un seul calcul pour des envois simultanés du même audio."""
+
+import asyncio
+
+import torch
+
+
+def test_concurrent_uploads_compute_once(main, tmp_path, monkeypatch):
+    store = main.PromptStore(tmp_path, 1 << 20, 1 << 20, idle_ttl=3600, disk_ttl=86400)
+    monkeypatch.setattr(main, "prompt_store", store)
+    monkeypatch.setattr(main, "reference_prompt_stats", {"hits": 0, "misses": 0})
+    monkeypatch.setattr(main, "reference_fingerprint", lambda audio_path, ref_text, model_size: "empreinte")
+    computed = []
+
+    async def submit(model_key, fn, *args, **kwargs):
+        computed.append(model_key)
+        await asyncio.sleep(0.05)
+        return [{"ref_spk_embedding": torch.ones(4)}]
+
+    monkeypatch.setattr(main.inference_executor, "submit", submit)
+
+    async def scenario():
+        return await asyncio.gather(*[
+            main.get_or_create_reference_prompt("1.7B", "ref.wav", "Bonjour") for _ in range(5)
+        ])
+
+    results = asyncio.run(scenario())
+    assert len(computed) == 1
+    assert len({prompt_id for prompt_id, _, _ in results}) == 1
+    assert sorted(cached for _, _, cached in results) == [False, True, True, True, True]
+    assert main.reference_prompt_stats == {"hits": 4, "misses": 1}
+    assert len(store) == 1
@@ -0,0 +1,59 @@
+"""Générations seedées : reproductibles malgré des générations concurrentes."""
+
+import threading
+import time
+
+import torch
+
+
+def _sample(steps: int = 20):
+    """Génération factice qui tire dans le RNG global comme torch.multinomial."""
+    values = []
+    for _ in range(steps):
+        values.append(torch.rand(1).item())
+        time.sleep(0.001)
+    return values
+
+
+def test_seeded_output_ignores_concurrent_generations(main):
+    expected = main.run_seeded(7, main.call_generate, _sample)
+
+    stop = threading.Event()
+
+    def noise():
+        while not stop.is_set():
+            main.call_generate(_sample, steps=3)
+
+    threads = [threading.Thread(target=noise) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    try:
+        results = [main.run_seeded(7, main.call_generate, _sample) for _ in range(3)]
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+    assert all(result == expected for result in results)
+
+
+def test_seed_does_not_leak_into_global_rng(main):
+    state = torch.get_rng_state()
+    main.run_seeded(7, main.call_generate, _sample, steps=2)
+    assert torch.equal(torch.get_rng_state(), state)
+
+
+def test_unseeded_generations_run_concurrently(main):
+    inside = threading.Barrier(2, timeout=5)
+
+    def generation():
+        inside.wait()  # Les deux générations doivent être en cours simultanément
+        return True
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(main.call_generate(generation))) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == [True, True]
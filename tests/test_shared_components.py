@@ -0,0 +1,48 @@
+"""Registre des composants partagés entre checkpoints (speech tokenizer, processor)."""
+
+import torch
+
+
+class Component:
+    pass
+
+
+def _checkpoint(tmp_path, name, vocab="{}"):
+    model_dir = tmp_path / name
+    (model_dir / "speech_tokenizer").mkdir(parents=True)
+    (model_dir / "vocab.json").write_text(vocab)
+    (model_dir / "merges.txt").write_text("#version: 0.2\n")
+    (model_dir / "speech_tokenizer" / "model.safetensors").write_bytes(b"codec")
+    return model_dir
+
+
+def test_resident_processor_is_reused_without_building(main, tmp_path):
+    shared = main.SharedComponents()
+    first, second = _checkpoint(tmp_path, "a"), _checkpoint(tmp_path, "b")
+    resident = Component()
+    key = ("processor", shared.content_hash(first, main.PROCESSOR_FILES))
+    assert shared._get_or_load(key, lambda: resident) is resident
+
+    # Fichiers factices : construire un processor échouerait
+    assert shared.processor(second) is resident
+    assert shared.stats({})["reused"] == 1
+
+
+def test_speech_tokenizer_is_keyed_by_content_and_dtype(main, tmp_path):
+    shared = main.SharedComponents()
+    first, second = _checkpoint(tmp_path, "a"), _checkpoint(tmp_path, "b")
+    resident = Component()
+    key = ("speech_tokenizer", shared.content_hash(first / "speech_tokenizer"), str(torch.float32))
+    shared._get_or_load(key, lambda: resident)
+
+    assert shared.speech_tokenizer(second / "speech_tokenizer", torch.float32) is resident
+    (second / "speech_tokenizer" / "model.safetensors").write_bytes(b"other codec")
+    other = ("speech_tokenizer", shared.content_hash(second / "speech_tokenizer"), str(torch.float32))
+    assert other != key
+
+
+def test_library_classes_are_not_patched(main):
+    import qwen_tts.core.models.modeling_qwen3_tts as modeling
+    from qwen_tts.inference.qwen3_tts_tokenizer import Qwen3TTSTokenizer
+
+    assert modeling.Qwen3TTSTokenizer is Qwen3TTSTokenizer
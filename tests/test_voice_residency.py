@@ -0,0 +1,64 @@
+"""VoiceResidency : budget mémoire des voix personnalisées, LRU et voix épinglées."""
+
+import pytest
+import torch
+from qwen_tts.inference.qwen3_tts_model import VoiceClonePromptItem
+
+VOICE_BYTES = 1000 * 4  # ref_spk_embedding de 1000 float32
+
+
+@pytest.fixture
+def voices(main, tmp_path, monkeypatch):
+    """Trois voix sur disque (non chargées) dans un répertoire temporaire."""
+    monkeypatch.setattr(main, "CUSTOM_VOICES_DIR", tmp_path)
+    monkeypatch.setattr(main, "custom_voices", {})
+    for name in ("alpha", "bravo", "charlie"):
+        (tmp_path / name).mkdir()
+        item = VoiceClonePromptItem(
+            ref_code=None, ref_spk_embedding=torch.full((1000,), float(len(name))),
+            x_vector_only_mode=True, icl_mode=False,
+        )
+        torch.save(main.prompt_state([item]), tmp_path / name / "prompt.pt")
+        main.custom_voices[name] = {"meta": {"name": name}, "prompt_items": None}
+    return main.custom_voices
+
+
+def resident(voices):
+    return sorted(name for name, data in voices.items() if data["prompt_items"] is not None)
+
+
+def test_least_recently_used_voice_is_evicted(main, voices):
+    residency = main.VoiceResidency(2 * VOICE_BYTES, set())
+    residency.get("alpha")
+    residency.get("bravo")
+    residency.get("alpha")  # bravo devient la moins récemment utilisée
+    residency.get("charlie")
+
+    assert resident(voices) == ["alpha", "charlie"]
+    stats = residency.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"]) == (1, 3, 1)
+    assert stats["resident_mb"] == round(2 * VOICE_BYTES / 1024 / 1024, 1)
+
+
+def test_evicted_voice_reloads_from_disk(main, voices):
+    residency = main.VoiceResidency(VOICE_BYTES, set())
+    residency.get("alpha")
+    residency.get("bravo")
+    assert resident(voices) == ["bravo"]
+
+    items = residency.get("alpha")
+    assert torch.equal(items[0].ref_spk_embedding, torch.full((1000,), 5.0))
+    assert residency.stats()["misses"] == 3
+
+
+def test_pinned_voice_is_never_evicted(main, voices):
+    residency = main.VoiceResidency(2 * VOICE_BYTES, {"alpha"})
+    residency.get("alpha")
+    residency.get("bravo")
+    residency.get("charlie")
+    assert resident(voices) == ["alpha", "charlie"]
+
+    # Budget dépassé par les seules voix épinglées : elles restent résidentes
+    residency.pin("charlie")
+    residency.get("bravo")
+    assert resident(voices) == ["alpha", "bravo", "charlie"]